@@ -0,0 +1,36 @@
+from airflow import DAG
+from airflow.operators.python import PythonOperator
+from smart_pricing_dag_utils import default_args
+
+
+def run_hyperparameter_tuner(scrap_type: str):
+    # Imported at run time so that parsing the DAG does not load the ML stack
+    from src.ml.baseline.tuning import hyperparameter_tuner
+
+    return hyperparameter_tuner(scrap_type)
+
+
+dag = DAG(
+    "smart_pricing_dag_tuning",
+    default_args=default_args,
+    description="Weekly hyperparameter tuning of the baseline models",
+    schedule_interval="0 3 * * 0",  # 03:00 every Sunday
+    max_active_runs=1,
+    catchup=False,
+)
+
+task_tuning_B = PythonOperator(
+    task_id="hyperparameter_tuner_B",
+    python_callable=run_hyperparameter_tuner,
+    op_args=["B"],
+    dag=dag,
+)
+
+task_tuning_A = PythonOperator(
+    task_id="hyperparameter_tuner_A",
+    python_callable=run_hyperparameter_tuner,
+    op_args=["A"],
+    dag=dag,
+)
+
+task_tuning_B >> task_tuning_A
@@ -0,0 +1,78 @@
+import time
+import argparse
+import pandas as pd
+
+from data_analytics.calendar_fetcher import CalendarFetcher
+from benchmarks.tools.gov_api_stub import AREAS, GovApiStub
+
+# Concurrent calendar fetching against the sequential client, on the local stub
+# of the government APIs: festivals of every area and holidays over a year, split
+# into monthly windows. A second run puts the stub behind a tighter rate limit
+# than the client's, with failing responses and 2-row pages, to exercise 429 /
+# Retry-After, backoff and pagination; both runs must return the sequential
+# frames.
+# Run from src/: python -m benchmarks.calendar_fetcher --latency 0.05
+
+
+def fetch(
+    url: str, start: str, end: str, **kwargs
+) -> tuple[pd.DataFrame, pd.DataFrame, float, int]:
+    with CalendarFetcher(base_url=url, service_key="stub", **kwargs) as fetcher:
+        started = time.perf_counter()
+        df_events = fetcher.fetch_events(list(AREAS), start, end)
+        df_holidays = fetcher.fetch_holidays(start, end)
+        elapsed = time.perf_counter() - started
+        return df_events, df_holidays, elapsed, fetcher.retries
+
+
+def run(
+    latency: float = 0.05,
+    n_workers: int = 8,
+    rate_limit: float = 50,
+    start: str = "2025-09-01",
+    end: str = "2026-08-31",
+):
+    with GovApiStub(latency=latency) as stub:
+        expected_events, expected_holidays, t_sequential, _ = fetch(
+            stub.url, start, end, max_workers=1, rate_limit=1e9
+        )
+        n_requests = sum(stub.hits.values())
+    print(
+        f"sequential          : {t_sequential:6.2f}s  {n_requests} requests, "
+        f"{len(expected_events)} events, {len(expected_holidays)} holidays"
+    )
+
+    runs = {
+        "concurrent": ({}, {}),
+        "rate limited stub": (
+            {"failure_rate": 0.05, "rate_limit": rate_limit * 0.6},
+            {"page_size": 2},
+        ),
+    }
+    for label, (stub_options, fetch_options) in runs.items():
+        with GovApiStub(latency=latency, **stub_options) as stub:
+            df_events, df_holidays, elapsed, retries = fetch(
+                stub.url,
+                start,
+                end,
+                max_workers=n_workers,
+                rate_limit=rate_limit,
+                **fetch_options,
+            )
+            pd.testing.assert_frame_equal(df_events, expected_events)
+            pd.testing.assert_frame_equal(df_holidays, expected_holidays)
+            print(
+                f"{label:<20}: {elapsed:6.2f}s  ({t_sequential / elapsed:.1f}x) "
+                f"{sum(stub.hits.values())} requests, {stub.rejected} rejected "
+                f"with 429, {retries} retries"
+            )
+    print("[parity] events and holidays match the sequential fetch")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--rate-limit", type=float, default=50)
+    args = parser.parse_args()
+    run(args.latency, args.workers, args.rate_limit)
@@ -0,0 +1,116 @@
+import time
+import argparse
+import pandas as pd
+import numpy as np
+import lightgbm as lgb
+
+from ml.baseline.cv import build_shared_dataset, fit_cv_folds
+from ml.baseline.params import resolve_hyperparameters
+
+# fit_cv_folds against the previous serial per-fold loop on synthetic data. The
+# folds now train on subsets of one Dataset binned over all rows: fitted one
+# after the other on the same subsets, every fold's predictions must match; the
+# previous loop, binning each training slice, must select the same fold.
+# Run from src/: python -m benchmarks.cv_folds --rows 200000 --folds 6
+
+CATEGORICAL = ["name", "channel"]
+
+
+def make_data(n_rows: int, seed: int = 0) -> tuple[pd.DataFrame, pd.Series]:
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame(
+        {
+            "name": rng.integers(0, 30, n_rows).astype(np.int32),
+            "channel": rng.integers(0, 8, n_rows).astype(np.int32),
+            "lead_hours": rng.integers(0, 24 * 180, n_rows).astype(np.float64),
+            "comp_median": rng.uniform(50_000, 300_000, n_rows),
+        }
+    )
+    y = pd.Series(
+        X["comp_median"] * (1 + 0.01 * X["name"])
+        - 10 * X["lead_hours"]
+        + rng.normal(0, 5_000, n_rows)
+    )
+    return X, y
+
+
+def serial_folds(X, y, folds, hyperparameters: dict) -> list[lgb.Booster]:
+    # Previous loop: one Dataset per fold, fitted one after the other
+    return [
+        lgb.train(
+            hyperparameters,
+            lgb.Dataset(
+                X.iloc[train_idx], y.iloc[train_idx], categorical_feature=CATEGORICAL
+            ),
+            num_boost_round=hyperparameters["n_estimators"],
+        )
+        for train_idx, _ in folds
+    ]
+
+
+def serial_shared_folds(X, y, folds, hyperparameters: dict) -> list[lgb.Booster]:
+    # Same shared bins as fit_cv_folds, without threads
+    params = {k: v for k, v in hyperparameters.items() if k != "n_estimators"}
+    dataset = build_shared_dataset(X, y, CATEGORICAL, params)
+    return [
+        lgb.train(
+            params,
+            dataset.subset(np.sort(train_idx)),
+            num_boost_round=hyperparameters["n_estimators"],
+        )
+        for train_idx, _ in folds
+    ]
+
+
+def _val_mae(models, X, y, folds) -> list[float]:
+    return [
+        float(np.mean(np.abs(model.predict(X.iloc[val_idx]) - y.iloc[val_idx])))
+        for model, (_, val_idx) in zip(models, folds)
+    ]
+
+
+def run(n_rows: int = 200_000, n_folds: int = 6, num_rounds: int = 200):
+    X, y = make_data(n_rows)
+    # Expanding-window folds over time-ordered rows
+    edges = np.linspace(0, n_rows, n_folds + 2, dtype=int)
+    folds = [
+        (np.arange(0, edges[i]), np.arange(edges[i], edges[i + 1]))
+        for i in range(1, n_folds + 1)
+    ]
+    hyperparameters = resolve_hyperparameters(
+        {"objective": "regression", "verbose": -1, "n_estimators": num_rounds}
+    )
+
+    start = time.perf_counter()
+    reference = serial_folds(X, y, folds, hyperparameters)
+    t_serial = time.perf_counter() - start
+
+    start = time.perf_counter()
+    models = fit_cv_folds(X, y, folds, hyperparameters, CATEGORICAL)
+    t_parallel = time.perf_counter() - start
+
+    for model, expected, (_, val_idx) in zip(
+        models, serial_shared_folds(X, y, folds, hyperparameters), folds
+    ):
+        np.testing.assert_array_equal(
+            model.predict(X.iloc[val_idx]), expected.predict(X.iloc[val_idx])
+        )
+    mae = _val_mae(models, X, y, folds)
+    reference_mae = _val_mae(reference, X, y, folds)
+    assert int(np.argmin(mae)) == int(np.argmin(reference_mae))
+    print(
+        f"[parity] {n_folds} folds: identical to serial shared-bin fits, best fold "
+        f"{np.argmin(mae)} as with per-fold bins (max val MAE gap "
+        f"{np.max(np.abs(np.subtract(mae, reference_mae))):.1f})"
+    )
+    print(f"serial loop   : {t_serial:7.2f}s")
+    print(f"fit_cv_folds  : {t_parallel:7.2f}s ({t_serial / t_parallel:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--folds", type=int, default=6)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+    run(args.rows, args.folds, args.rounds)
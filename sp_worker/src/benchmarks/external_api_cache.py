@@ -0,0 +1,228 @@
+import os
+import time
+import argparse
+import tempfile
+from unittest import mock
+
+# External API calls of daily type B sub-chart runs, with and without the disk
+# cache, against benchmarks.tools.gov_api_stub: every property asks for its area
+# code, the festivals of the next 180 days in its area and the holidays of the
+# next year. Days are simulated by moving the cache clock; the stale-while-
+# revalidate latency is measured on an entry past its TTL.
+# Run from src/: python -m benchmarks.external_api_cache --properties 60 --days 45
+
+# Paths and settings are read at import time: configure them first
+os.environ.setdefault("DATA_PATH", tempfile.mkdtemp(prefix="sp_worker_bench_"))
+os.environ.setdefault("EXTERNAL_API_CACHE", "true")
+
+import requests  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from config.paths import EXTERNAL_API_CACHE_PATH  # noqa: E402
+from config.settings import (  # noqa: E402
+    EXTERNAL_API_CACHE_MAX_STALE_SECONDS,
+    EXTERNAL_API_CACHE_TTL_SECONDS,
+)
+from data_analytics import calendar_fetcher, ext_event_and_holidays  # noqa: E402
+from data_analytics.calendar_fetcher import CalendarFetcher  # noqa: E402
+from utils import api_cache  # noqa: E402
+from benchmarks.tools.gov_api_stub import (  # noqa: E402
+    AREA_CODE_ENDPOINT,
+    AREAS,
+    FESTIVAL_ENDPOINT,
+    HOLIDAYS_ENDPOINT,
+    GovApiStub,
+)
+
+
+def stub_clients(session: requests.Session, url: str) -> dict:
+    # Minimal clients of the stub with the signatures of ext_event_and_holidays
+    def items(endpoint: str, params: dict) -> list[dict]:
+        params = {"numOfRows": 1000, **params}
+        response = session.get(f"{url}{endpoint}", params=params, timeout=10)
+        response.raise_for_status()
+        return response.json()["response"]["body"]["items"]["item"]
+
+    def get_area_code(area_name: str):
+        codes = {i["name"]: i["code"] for i in items(AREA_CODE_ENDPOINT, {})}
+        return codes.get(area_name)
+
+    def get_events(start_date: str, end_date: str, area_name: str):
+        params = {
+            "eventStartDate": start_date.replace("-", ""),
+            "eventEndDate": end_date.replace("-", ""),
+            "areaCode": AREAS[area_name],
+        }
+        return items(FESTIVAL_ENDPOINT, params)
+
+    def get_korean_holidays(start_date: str, end_date: str):
+        start, end = pd.Timestamp(start_date), pd.Timestamp(end_date)
+        holidays = []
+        for year in range(start.year, end.year + 1):
+            holidays += items(HOLIDAYS_ENDPOINT, {"solYear": year})
+        return [h for h in holidays if start <= pd.Timestamp(str(h["locdate"])) <= end]
+
+    return {
+        "get_area_code": get_area_code,
+        "get_events": get_events,
+        "get_korean_holidays": get_korean_holidays,
+    }
+
+
+def daily_runs(calls: dict, n_properties: int, n_days: int, clock: list) -> None:
+    areas = list(AREAS)
+    start = pd.Timestamp("2025-09-01")
+    for day in range(n_days):
+        today = start + pd.Timedelta(days=day)
+        clock[0] = today.timestamp()
+        for property_id in range(n_properties):
+            area_name = areas[property_id % len(areas)]
+            calls["get_area_code"](area_name)
+            calls["get_events"](
+                f"{today:%Y-%m-%d}",
+                f"{today + pd.Timedelta(days=180):%Y-%m-%d}",
+                area_name,
+            )
+            calls["get_korean_holidays"](
+                f"{today:%Y%m%d}", f"{today + pd.Timedelta(days=365):%Y%m%d}"
+            )
+        # Background refreshes finish before the next day
+        api_cache.wait_for_refreshes()
+
+
+def _print_hits(label: str, stub: GovApiStub, elapsed: float) -> None:
+    print(
+        f"{label:<10} {elapsed:7.2f}s  area codes {stub.hits[AREA_CODE_ENDPOINT]:>5}"
+        f"  festivals {stub.hits[FESTIVAL_ENDPOINT]:>5}"
+        f"  holidays {stub.hits[HOLIDAYS_ENDPOINT]:>5}"
+    )
+
+
+def check_repo_helpers(url: str, stub: GovApiStub, clock: list) -> None:
+    # get_events and get_korean_holidays on the shared fetcher, pointed at the
+    # stub: a second call is served by the cache, and the frames built from the
+    # cached items match a direct fetch
+    start_date, end_date = "2025-09-01", "2026-02-28"
+    area_name = next(iter(AREAS))
+    with mock.patch.object(calendar_fetcher, "_FETCHER_PID", os.getpid()):
+        with mock.patch.object(
+            calendar_fetcher,
+            "_FETCHER",
+            CalendarFetcher(base_url=url, service_key="stub"),
+        ):
+            hits = sum(stub.hits.values())
+            for _ in range(2):
+                events = ext_event_and_holidays.get_events(
+                    start_date, end_date, area_name
+                )
+                holidays = ext_event_and_holidays.get_korean_holidays(
+                    start_date, end_date
+                )
+            n_calls = sum(stub.hits.values()) - hits
+            calendar_fetcher.get_calendar_fetcher().close()
+
+    with CalendarFetcher(base_url=url, service_key="stub") as fetcher:
+        pd.testing.assert_frame_equal(
+            calendar_fetcher.events_frame({area_name: events}),
+            fetcher.fetch_events([area_name], start_date, end_date),
+        )
+        pd.testing.assert_frame_equal(
+            calendar_fetcher.holidays_frame(holidays),
+            fetcher.fetch_holidays(start_date, end_date),
+        )
+    print(
+        f"[parity] cached get_events / get_korean_holidays == fetcher frames "
+        f"({n_calls} API calls for two runs)"
+    )
+
+
+def run(n_properties: int = 60, n_days: int = 45, latency: float = 0.02):
+    clock = [0.0]
+    with mock.patch.object(api_cache, "_now", lambda: clock[0]):
+        with GovApiStub(latency=latency) as stub, requests.Session() as session:
+            clients = stub_clients(session, stub.url)
+            start = time.perf_counter()
+            daily_runs(clients, n_properties, n_days, clock)
+            _print_hits("uncached", stub, time.perf_counter() - start)
+
+        EXTERNAL_API_CACHE_PATH.unlink(missing_ok=True)
+        with GovApiStub(latency=latency) as stub, requests.Session() as session:
+            clients = stub_clients(session, stub.url)
+            cached = {
+                "get_area_code": api_cache.cached_api("area_code")(
+                    clients["get_area_code"]
+                ),
+                "get_events": api_cache.cached_api("events")(clients["get_events"]),
+                # The repo's per-year holidays cache, on top of the stub client
+                "get_korean_holidays": ext_event_and_holidays.get_korean_holidays,
+            }
+            with mock.patch.object(
+                ext_event_and_holidays,
+                "_fetch_korean_holidays",
+                clients["get_korean_holidays"],
+            ):
+                start = time.perf_counter()
+                daily_runs(cached, n_properties, n_days, clock)
+                _print_hits("cached", stub, time.perf_counter() - start)
+
+                # The per-year cache returns the requested range only
+                for start_date, end_date in (
+                    ("20250915", "20260310"),
+                    ("2025-12-24", "2026-01-02"),
+                ):
+                    assert cached["get_korean_holidays"](
+                        start_date, end_date
+                    ) == clients["get_korean_holidays"](start_date, end_date)
+                print("[parity] cached holidays == uncached holidays")
+
+            # Past its TTL an entry is returned at once and refreshed behind
+            get_area_code = cached["get_area_code"]
+            clock[0] += EXTERNAL_API_CACHE_TTL_SECONDS["area_code"]
+            get_area_code("서울")
+            api_cache.wait_for_refreshes()
+            clock[0] += EXTERNAL_API_CACHE_TTL_SECONDS["area_code"] + 1
+            hits = stub.hits[AREA_CODE_ENDPOINT]
+            start = time.perf_counter()
+            get_area_code("서울")
+            t_stale = time.perf_counter() - start
+            api_cache.wait_for_refreshes()
+            start = time.perf_counter()
+            get_area_code("서울")
+            t_fresh = time.perf_counter() - start
+            print(
+                f"stale read {t_stale * 1e3:.1f} ms (API latency {latency * 1e3:.0f} "
+                f"ms), background calls: {stub.hits[AREA_CODE_ENDPOINT] - hits}, "
+                f"next read {t_fresh * 1e3:.1f} ms"
+            )
+
+            # A failed call (None) is not stored: the next call tries the API
+            # again, and an expired entry is served instead of the failure
+            attempts = []
+
+            def failing_fetch():
+                attempts.append(clock[0])
+                return None
+
+            for _ in range(2):
+                assert api_cache.cached_call("events", "failed", failing_fetch) is None
+            assert len(attempts) == 2
+            api_cache.cached_call("events", "expired", lambda: [{"title": "kept"}])
+            clock[0] += (
+                EXTERNAL_API_CACHE_TTL_SECONDS["events"]
+                + EXTERNAL_API_CACHE_MAX_STALE_SECONDS
+            )
+            assert api_cache.cached_call("events", "expired", failing_fetch) == [
+                {"title": "kept"}
+            ]
+            print("[check] failed calls are not cached, the last response is served")
+
+            check_repo_helpers(stub.url, stub, clock)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--properties", type=int, default=60)
+    parser.add_argument("--days", type=int, default=45)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+    run(args.properties, args.days, args.latency)
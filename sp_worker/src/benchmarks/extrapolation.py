@@ -0,0 +1,103 @@
+import argparse
+from collections import deque
+import pandas as pd
+import numpy as np
+
+from ml.baseline.type_b.inference import _extrapolate_predictions
+from benchmarks.tools.timing import best_time
+
+# Grouped trailing-mean extrapolation of long-horizon type B predictions against
+# a per-group loop, on 180-day horizons with many (name, channel) groups.
+# Run from src/: python -m benchmarks.extrapolation
+
+
+def make_predictions(
+    n_rooms: int, n_channels: int, n_days: int, horizon: int, seed: int = 0
+) -> tuple[pd.DataFrame, pd.Series]:
+    rng = np.random.default_rng(seed)
+    df = pd.MultiIndex.from_product(
+        [
+            [f"room_{i}" for i in range(n_rooms)],
+            [f"channel_{i}" for i in range(n_channels)],
+            pd.date_range("2026-01-01", periods=n_days, freq="D"),
+        ],
+        names=["name", "channel", "checkIn"],
+    ).to_frame(index=False)
+    df["predicted_price"] = rng.uniform(50_000, 300_000, len(df))
+
+    # Beyond the model horizon plus a few scattered gaps; shuffled row order
+    days_out = (df["checkIn"] - df["checkIn"].min()).dt.days
+    missing = (days_out >= horizon) | (rng.random(len(df)) < 0.02)
+    df.loc[missing, "predicted_price"] = np.nan
+    df = df.sample(frac=1.0, random_state=seed).reset_index(drop=True)
+    missing = df["predicted_price"].isna()
+    return df, missing
+
+
+def loop_reference(
+    prediction_data: pd.DataFrame, missing_mask: pd.Series, window: int
+) -> pd.DataFrame:
+    df = prediction_data.copy()
+    df["_missing"] = missing_mask.to_numpy()
+    for _, group in df.sort_values("checkIn").groupby(["name", "channel"]):
+        last_known: deque = deque(maxlen=window)
+        for idx, price, missing in zip(
+            group.index, group["predicted_price"], group["_missing"]
+        ):
+            if missing:
+                if last_known:
+                    df.at[idx, "predicted_price"] = np.mean(last_known)
+            elif np.isfinite(price):
+                last_known.append(price)
+    return df.drop(columns="_missing")
+
+
+def run(
+    n_rooms: int = 30,
+    n_channels: int = 12,
+    n_days: int = 180,
+    horizon: int = 120,
+    window: int = 20,
+    repeat: int = 5,
+):
+    df, missing = make_predictions(n_rooms, n_channels, n_days, horizon)
+
+    expected = loop_reference(df, missing, window)
+    result = _extrapolate_predictions(df, missing, window)
+    np.testing.assert_allclose(
+        result["predicted_price"].to_numpy(),
+        expected["predicted_price"].to_numpy(),
+        rtol=1e-9,
+    )
+
+    t_reference = best_time(lambda: loop_reference(df, missing, window), 1)
+    t_vectorised = best_time(
+        lambda: _extrapolate_predictions(df, missing, window), repeat
+    )
+
+    print(
+        f"rows: {len(df)}, groups: {n_rooms * n_channels}, "
+        f"missing: {int(missing.sum())}"
+    )
+    print(f"per-group loop      : {t_reference * 1e3:9.2f} ms")
+    print(f"prefix-sum rolling  : {t_vectorised * 1e3:9.2f} ms")
+    print(f"speed-up            : {t_reference / t_vectorised:9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rooms", type=int, default=30)
+    parser.add_argument("--channels", type=int, default=12)
+    parser.add_argument("--days", type=int, default=180)
+    parser.add_argument("--horizon", type=int, default=120)
+    parser.add_argument("--window", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(
+        args.rooms,
+        args.channels,
+        args.days,
+        args.horizon,
+        args.window,
+        args.repeat,
+    )
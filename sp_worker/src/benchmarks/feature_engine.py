@@ -0,0 +1,92 @@
+import argparse
+import tempfile
+from pathlib import Path
+import pandas as pd
+import numpy as np
+
+from features.engine import get_feature_engine
+from benchmarks.tools.timing import best_time
+
+# Parity checks and throughput comparison of the feature engines on synthetic
+# processed feathers. Run from src/: python -m benchmarks.feature_engine
+
+BY = ["name", "channel", "checkIn"]
+COLUMNS = BY + ["price_display"]
+
+
+def make_processed_feathers(
+    folder: Path, n_otas: int, n_rows: int, seed: int = 0
+) -> list[Path]:
+    rng = np.random.default_rng(seed)
+    checkins = pd.date_range("2025-01-01", periods=180, freq="D", tz="Asia/Seoul")
+    files = []
+    for i in range(n_otas):
+        df = pd.DataFrame(
+            {
+                "hotel_id": rng.integers(0, 50, n_rows),
+                "name": rng.choice([f"room_{r}" for r in range(20)], n_rows),
+                "channel": f"ota_{i}",
+                "checkIn": rng.choice(checkins, n_rows),
+                "scraping_id": pd.Timestamp("2025-01-01", tz="Asia/Seoul"),
+                "price_display": rng.uniform(50_000, 300_000, n_rows),
+            }
+        )
+        # Missing prices must be skipped identically by every engine
+        df.loc[rng.random(n_rows) < 0.01, "price_display"] = np.nan
+        path = folder / f"ota_{i}.feather"
+        df.to_feather(path)
+        files.append(path)
+    return files
+
+
+def check_parity(files: list[Path], engine_names: list[str]) -> None:
+    reference = get_feature_engine("pandas")
+    expected_frame = reference.collect(reference.scan_files(files, COLUMNS))
+    expected_stats = reference.price_stats(reference.scan_files(files, COLUMNS), BY)
+
+    for name in engine_names:
+        engine = get_feature_engine(name)
+        frame = engine.collect(engine.scan_files(files, COLUMNS))
+        pd.testing.assert_frame_equal(frame, expected_frame, check_dtype=False)
+
+        stats = engine.price_stats(engine.scan_files(files, COLUMNS), BY)
+        pd.testing.assert_frame_equal(stats, expected_stats, check_dtype=False)
+
+        dict_df = {f.stem: pd.read_feather(f) for f in files}
+        stats = engine.price_stats(engine.from_frames(dict_df, COLUMNS), BY)
+        pd.testing.assert_frame_equal(stats, expected_stats, check_dtype=False)
+        print(f"[parity] {name}: OK")
+
+
+def run(n_otas: int = 8, n_rows: int = 500_000, repeat: int = 3):
+    engine_names = ["pandas"]
+    try:
+        get_feature_engine("polars")
+        engine_names.append("polars")
+    except ImportError as e:
+        print(f"Skipping polars: {e}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = make_processed_feathers(Path(tmp), n_otas, n_rows)
+        check_parity(files, engine_names)
+
+        total_rows = n_otas * n_rows
+        for name in engine_names:
+            engine = get_feature_engine(name)
+            elapsed = best_time(
+                lambda: engine.price_stats(engine.scan_files(files, COLUMNS), BY),
+                repeat,
+            )
+            print(
+                f"{name:<8} scan + price_stats: {elapsed * 1e3:9.1f} ms "
+                f"({total_rows / elapsed / 1e6:6.1f} M rows/s)"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--otas", type=int, default=8)
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.otas, args.rows, args.repeat)
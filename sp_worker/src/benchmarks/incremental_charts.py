@@ -0,0 +1,156 @@
+import time
+import argparse
+import pandas as pd
+import numpy as np
+
+from data_analytics.incremental_charts import (
+    GROUP_COLS,
+    KEY_COLS,
+    OTA_COL,
+    advance_chart_state,
+    comp_rows_since,
+)
+from data_analytics.market_stats import STAT_COLS
+from data_analytics.sub_charts import get_market_trend_chart
+
+# Incremental chart updates against full rebuilds as the scrape history grows:
+# hourly scrapes cover the next `scrape_days` checkIns and a daily one the whole
+# window. Every scrape is applied to the chart state; the final market stats are
+# checked against get_market_trend_chart on the whole history, and the comp
+# prices against the latest price per key rebuilt from it. The same check runs
+# right after a competitor and an OTA are removed from the competitor data.
+# Run from src/: python -m benchmarks.incremental_charts
+
+
+def make_scrape(
+    scraping_id: pd.Timestamp,
+    n_comps: int,
+    n_rooms: int,
+    n_days: int,
+    coverage: float,
+    rng: np.random.Generator,
+) -> pd.DataFrame:
+    # One scrape observes a random share of (hotel, room, checkIn) keys
+    checkins = pd.date_range(scraping_id.normalize(), periods=n_days, freq="D")
+    n_keys = n_comps * n_rooms * n_days
+    keys = np.flatnonzero(rng.random(n_keys) < coverage)
+    df = pd.DataFrame(
+        {
+            "hotel_id": keys // (n_rooms * n_days),
+            "name": (keys // n_days) % n_rooms,
+            "checkIn": checkins[keys % n_days],
+            "scraping_id": scraping_id,
+            "price_display": rng.lognormal(11.5, 0.4, len(keys)).round(-2),
+        }
+    )
+    df.loc[rng.random(len(df)) < 0.02, "price_display"] = np.nan
+    return df
+
+
+def rebuild_market_stats(dict_df_comp: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    frames = [
+        df.assign(**{OTA_COL: ota})
+        for ota, df in get_market_trend_chart(dict_df_comp).items()
+    ]
+    df_stats = pd.concat(frames, ignore_index=True)
+    return df_stats.sort_values(GROUP_COLS, kind="stable", ignore_index=True)
+
+
+def rebuild_comp_prices(
+    dict_df_comp: dict[str, pd.DataFrame], today: pd.Timestamp
+) -> pd.DataFrame:
+    df_latest = comp_rows_since(dict_df_comp, None)
+    df_latest = df_latest.drop_duplicates(KEY_COLS, keep="last")
+    df_latest = df_latest[df_latest["checkIn"] >= today]
+    return df_latest.sort_values(KEY_COLS, ignore_index=True)
+
+
+def check_parity(
+    state: dict[str, pd.DataFrame],
+    dict_df_comp: dict[str, pd.DataFrame],
+    today: pd.Timestamp,
+) -> None:
+    pd.testing.assert_frame_equal(
+        state["market_stats"][GROUP_COLS + STAT_COLS],
+        rebuild_market_stats(dict_df_comp)[GROUP_COLS + STAT_COLS],
+        check_dtype=False,
+    )
+    pd.testing.assert_frame_equal(
+        state["latest_prices"].sort_values(KEY_COLS, ignore_index=True),
+        rebuild_comp_prices(dict_df_comp, today),
+        check_dtype=False,
+    )
+
+
+def run(
+    n_scrapes: int = 48,
+    n_otas: int = 3,
+    n_comps: int = 30,
+    n_rooms: int = 6,
+    n_days: int = 180,
+    scrape_days: int = 14,
+    coverage: float = 0.2,
+):
+    rng = np.random.default_rng(0)
+    start_ts = pd.Timestamp("2025-06-01", tz="Asia/Seoul")
+    history: dict[str, list[pd.DataFrame]] = {f"ota_{i}": [] for i in range(n_otas)}
+    state, watermark = {}, None
+    # Two thirds in, a competitor leaves the set and the last OTA stops being
+    # scraped; their prices must leave the charts like in a full recompute
+    remove_at = 2 * n_scrapes // 3
+    removed_hotel = 0
+
+    print(f"{'scrape':>6} {'history rows':>13} {'incremental':>12} {'rebuild':>9}")
+    for i in range(n_scrapes):
+        scraping_id = start_ts + pd.Timedelta(hours=i)
+        today = scraping_id.normalize()
+        days = n_days if scraping_id.hour == 0 else scrape_days
+        if i == remove_at and n_otas > 1:
+            history.pop(f"ota_{n_otas - 1}")
+            for ota, dfs in history.items():
+                history[ota] = [df[df["hotel_id"] != removed_hotel] for df in dfs]
+        for ota in history:
+            df = make_scrape(scraping_id, n_comps, n_rooms, days, coverage, rng)
+            if i >= remove_at:
+                df = df[df["hotel_id"] != removed_hotel]
+            history[ota].append(df)
+        dict_df_comp = {ota: pd.concat(dfs) for ota, dfs in history.items()}
+
+        start = time.perf_counter()
+        state, watermark, _ = advance_chart_state(state, watermark, dict_df_comp, today)
+        t_incremental = time.perf_counter() - start
+
+        if i == remove_at:
+            check_parity(state, dict_df_comp, today)
+            print("[parity] charts == full recompute after removing a competitor")
+        if i % 8 == 0 or i == n_scrapes - 1:
+            start = time.perf_counter()
+            rebuild_market_stats(dict_df_comp)
+            t_rebuild = time.perf_counter() - start
+            n_rows = sum(len(df) for df in dict_df_comp.values())
+            print(
+                f"{i + 1:>6} {n_rows:>13} {t_incremental * 1e3:>10.1f}ms "
+                f"{t_rebuild * 1e3:>7.1f}ms"
+            )
+
+    check_parity(state, dict_df_comp, today)
+    print("[parity] incremental market stats == get_market_trend_chart")
+    n_kept = len(state["price_history"])
+    print(f"[parity] incremental comp prices == rebuild ({n_kept} rows kept)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scrapes", type=int, default=48)
+    parser.add_argument("--otas", type=int, default=3)
+    parser.add_argument("--comps", type=int, default=30)
+    parser.add_argument("--scrape-days", type=int, default=14)
+    parser.add_argument("--coverage", type=float, default=0.2)
+    args = parser.parse_args()
+    run(
+        args.scrapes,
+        args.otas,
+        args.comps,
+        scrape_days=args.scrape_days,
+        coverage=args.coverage,
+    )
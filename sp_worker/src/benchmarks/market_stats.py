@@ -0,0 +1,78 @@
+import argparse
+import pandas as pd
+import numpy as np
+
+from data_analytics.market_stats import (
+    STAT_COLS,
+    STAT_QUANTILES,
+    market_stats_by_checkin,
+)
+from benchmarks.tools.timing import best_time
+
+# Single-pass lexsort percentiles against one groupby().quantile() per
+# statistic, on competitor prices for 180 checkIn days and many competitors.
+# Run from src/: python -m benchmarks.market_stats
+
+
+def make_comp_data(
+    n_otas: int, n_comps: int, n_rooms: int, n_days: int = 180, seed: int = 0
+) -> dict[str, pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    checkins = pd.date_range("2025-01-01", periods=n_days, freq="D", tz="Asia/Seoul")
+    n_rows = n_comps * n_rooms * n_days
+    dict_df_comp = {}
+    for i in range(n_otas):
+        df = pd.DataFrame(
+            {
+                "hotel_id": np.repeat(np.arange(n_comps), n_rooms * n_days),
+                "checkIn": np.tile(checkins, n_comps * n_rooms),
+                "price_display": rng.lognormal(11.5, 0.4, n_rows).round(-2),
+            }
+        )
+        df.loc[rng.random(n_rows) < 0.02, "price_display"] = np.nan
+        dict_df_comp[f"ota_{i}"] = df
+    return dict_df_comp
+
+
+def reference_market_stats(
+    dict_df_comp: dict[str, pd.DataFrame],
+) -> dict[str, pd.DataFrame]:
+    result = {}
+    for ota, df in dict_df_comp.items():
+        grouped = df.groupby("checkIn")["price_display"]
+        df_stats = pd.DataFrame(
+            {name: grouped.quantile(q) for name, q in STAT_QUANTILES.items()}
+        )
+        result[ota] = df_stats.dropna(how="all").reset_index()
+    return result
+
+
+def run(n_otas: int = 4, n_comps: int = 100, n_rooms: int = 8, repeat: int = 3):
+    dict_df_comp = make_comp_data(n_otas, n_comps, n_rooms)
+    expected = reference_market_stats(dict_df_comp)
+    result = market_stats_by_checkin(dict_df_comp)
+    for ota, df_expected in expected.items():
+        pd.testing.assert_frame_equal(
+            result[ota][["checkIn"] + STAT_COLS],
+            df_expected[["checkIn"] + STAT_COLS],
+            check_exact=False,
+            rtol=1e-12,
+        )
+    print("[parity] OK")
+
+    n_rows = sum(len(df) for df in dict_df_comp.values())
+    t_reference = best_time(lambda: reference_market_stats(dict_df_comp), repeat)
+    t_single_pass = best_time(lambda: market_stats_by_checkin(dict_df_comp), repeat)
+    print(f"rows: {n_rows}, OTAs: {n_otas}, competitors: {n_comps}")
+    print(f"groupby().quantile() per statistic : {t_reference * 1e3:9.1f} ms")
+    print(f"single-pass lexsort                : {t_single_pass * 1e3:9.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--otas", type=int, default=4)
+    parser.add_argument("--comps", type=int, default=100)
+    parser.add_argument("--rooms", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.otas, args.comps, args.rooms, args.repeat)
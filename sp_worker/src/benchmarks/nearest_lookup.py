@@ -0,0 +1,128 @@
+import argparse
+import pandas as pd
+import numpy as np
+
+from features.shared_features.nearest import SortedGroupIndex, attach_nearest
+from benchmarks.tools.timing import best_time
+
+# Micro-benchmark of the nearest (room, channel, key) lookup used by
+# _get_close_lead_hours_data / _get_close_days_after_data on a synthetic grid.
+# Run from src/: python -m benchmarks.nearest_lookup
+
+BY = ["name", "channel"]
+
+
+def make_grid(
+    n_days: int, n_rooms: int, n_channels: int, seed: int = 0
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    rooms = [f"room_{i}" for i in range(n_rooms)]
+    channels = [f"channel_{i}" for i in range(n_channels)]
+
+    grid = pd.MultiIndex.from_product(
+        [rooms, channels, np.arange(n_days)], names=BY + ["days_after"]
+    ).to_frame(index=False)
+
+    # Observed stats only exist for a sparse, irregular subset of the keys
+    observed = grid.sample(frac=0.3, random_state=seed).reset_index(drop=True)
+    observed["mean_price"] = rng.uniform(50_000, 300_000, len(observed))
+    observed["std_price"] = rng.uniform(1_000, 20_000, len(observed))
+    return grid, observed
+
+
+def edge_queries(grid: pd.DataFrame, n_days: int) -> pd.DataFrame:
+    # Keys below, above and between the observed ones, in every group
+    groups = grid[BY].drop_duplicates()
+    offsets = [-7.0, -0.5, n_days + 40.0, n_days / 2 + 0.5]
+    return groups.merge(pd.DataFrame({"days_after": offsets}), how="cross")
+
+
+def asof_reference(
+    query: pd.DataFrame,
+    observed: pd.DataFrame,
+    value_cols: list[str],
+    direction: str,
+) -> pd.DataFrame:
+    query = query.assign(_row=np.arange(len(query)))
+    merged = pd.merge_asof(
+        query.astype({"days_after": np.float64}).sort_values("days_after"),
+        observed.astype({"days_after": np.float64}).sort_values("days_after"),
+        on="days_after",
+        by=BY,
+        direction=direction,
+    )
+    return merged.sort_values("_row")[value_cols].reset_index(drop=True)
+
+
+def filtering_reference(
+    grid: pd.DataFrame, observed: pd.DataFrame, value_cols: list[str]
+) -> pd.DataFrame:
+    # Previous approach: filter the stats for every (room, channel) and take argmin
+    out = grid.copy()
+    for col in value_cols:
+        out[col] = np.nan
+    for (name, channel), rows in grid.groupby(BY, sort=False):
+        candidates = observed[
+            (observed["name"] == name) & (observed["channel"] == channel)
+        ].sort_values("days_after")
+        if candidates.empty:
+            continue
+        keys = candidates["days_after"].to_numpy()
+        nearest = np.abs(rows["days_after"].to_numpy()[:, None] - keys[None, :]).argmin(
+            axis=1
+        )
+        for col in value_cols:
+            out.loc[rows.index, col] = candidates[col].to_numpy()[nearest]
+    return out
+
+
+def run(n_days: int = 180, n_rooms: int = 20, n_channels: int = 10, repeat: int = 5):
+    grid, observed = make_grid(n_days, n_rooms, n_channels)
+    value_cols = ["mean_price", "std_price"]
+
+    expected = filtering_reference(grid, observed, value_cols)
+    result = attach_nearest(grid, observed, BY, "days_after", value_cols)
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+    edges = edge_queries(grid, n_days)
+    pd.testing.assert_frame_equal(
+        attach_nearest(edges, observed, BY, "days_after", value_cols),
+        filtering_reference(edges, observed, value_cols),
+        check_dtype=False,
+    )
+    for direction in ("backward", "forward"):
+        pd.testing.assert_frame_equal(
+            attach_nearest(edges, observed, BY, "days_after", value_cols, direction)[
+                value_cols
+            ],
+            asof_reference(edges, observed, value_cols, direction),
+            check_dtype=False,
+        )
+    print("[parity] grid and out-of-range / between-key queries match")
+
+    index = SortedGroupIndex(observed, BY, "days_after")
+    t_reference = best_time(
+        lambda: filtering_reference(grid, observed, value_cols), repeat
+    )
+    t_build = best_time(lambda: SortedGroupIndex(observed, BY, "days_after"), repeat)
+    t_lookup = best_time(lambda: index.lookup(grid), repeat)
+    t_attach = best_time(
+        lambda: attach_nearest(grid, observed, BY, "days_after", value_cols), repeat
+    )
+
+    print(f"grid rows: {len(grid)}, observed rows: {len(observed)}")
+    print(f"filtering reference : {t_reference * 1e3:9.2f} ms")
+    print(f"index build         : {t_build * 1e3:9.2f} ms")
+    print(f"index lookup        : {t_lookup * 1e3:9.2f} ms")
+    print(f"attach_nearest      : {t_attach * 1e3:9.2f} ms")
+    print(f"speed-up            : {t_reference / t_attach:9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, default=180)
+    parser.add_argument("--rooms", type=int, default=20)
+    parser.add_argument("--channels", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.days, args.rooms, args.channels, args.repeat)
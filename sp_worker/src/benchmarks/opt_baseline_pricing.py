@@ -0,0 +1,90 @@
+import math
+import argparse
+import pandas as pd
+import numpy as np
+
+from ml.optimized_baseline.pricing_engine import (
+    OCC_COL,
+    PRICE_COL,
+    OCC_EPS,
+    apply_price_adjustments,
+)
+from benchmarks.tools.timing import best_time
+
+# Row-wise (.apply(axis=1)) against column-level optimized baseline adjustment
+# on 180 days x rooms x properties, with an element-wise equivalence check.
+# Run from src/: python -m benchmarks.opt_baseline_pricing
+
+
+def make_frame(
+    n_properties: int, n_rooms: int, n_days: int, seed: int = 0
+) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    df = pd.MultiIndex.from_product(
+        [np.arange(n_properties), [f"room_{i}" for i in range(n_rooms)]],
+        names=["property_id", "name"],
+    ).to_frame(index=False)
+
+    # One fitted curve per (property, room), some rooms without a fit
+    df["P0"] = rng.uniform(80_000, 250_000, len(df))
+    df["k"] = rng.uniform(2e-5, 8e-5, len(df))
+    df["v"] = rng.uniform(0.15, 0.5, len(df))
+    df["L"] = rng.uniform(1.0, 1.05, len(df))
+    df.loc[rng.random(len(df)) < 0.05, ["P0", "k"]] = np.nan
+
+    df = df.merge(pd.DataFrame({"checkIn": np.arange(n_days)}), how="cross")
+    df[OCC_COL] = rng.uniform(0.0, 1.0, len(df))
+    df.loc[rng.random(len(df)) < 0.02, OCC_COL] = np.nan
+    df[PRICE_COL] = rng.uniform(50_000, 300_000, len(df))
+    return df
+
+
+def price_inverse_logistic_scalar(occ, P0, k, v=0.25, L=1.02) -> float:
+    # Scalar inverse, as price_inverse_logistic_fitted computes it for one row
+    if math.isnan(occ) or math.isnan(P0) or math.isnan(k):
+        return math.nan
+    occ = min(max(occ, OCC_EPS), L - OCC_EPS)
+    inner = (L / occ) ** v - 1.0
+    return P0 - math.log(inner) / k if inner > 0 else math.nan
+
+
+def rowwise_adjustment(row: pd.Series) -> pd.Series:
+    # Row-wise path (df.apply(apply_price_adjustment, axis=1)): the curve price,
+    # and the baseline price where it is undefined
+    curve_price = price_inverse_logistic_scalar(
+        row[OCC_COL], row["P0"], row["k"], row["v"], row["L"]
+    )
+    if math.isfinite(curve_price):
+        row[PRICE_COL] = curve_price
+    return row
+
+
+def run(n_properties: int = 40, n_rooms: int = 15, n_days: int = 180, repeat: int = 3):
+    df = make_frame(n_properties, n_rooms, n_days)
+
+    expected = df.apply(rowwise_adjustment, axis=1)
+    result = apply_price_adjustments(df)
+    np.testing.assert_allclose(
+        result[PRICE_COL].to_numpy(), expected[PRICE_COL].to_numpy(), rtol=1e-12
+    )
+    print("[parity] vectorised prices == row-wise prices")
+
+    t_rowwise = best_time(lambda: df.apply(rowwise_adjustment, axis=1), 1)
+    t_vectorised = best_time(lambda: apply_price_adjustments(df), repeat)
+
+    print(
+        f"rows: {len(df)} ({n_properties} properties x {n_rooms} rooms x {n_days} days)"
+    )
+    print(f"row-wise apply      : {t_rowwise * 1e3:9.2f} ms")
+    print(f"vectorised engine   : {t_vectorised * 1e3:9.2f} ms")
+    print(f"speed-up            : {t_rowwise / t_vectorised:9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--properties", type=int, default=40)
+    parser.add_argument("--rooms", type=int, default=15)
+    parser.add_argument("--days", type=int, default=180)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.properties, args.rooms, args.days, args.repeat)
@@ -0,0 +1,116 @@
+import os
+import json
+import time
+import resource
+import argparse
+import tempfile
+from collections import defaultdict
+
+# End-to-end throughput of baseline_model_updater and opt_baseline_model_updater
+# on N synthetic properties, fully offline: processed data, properties, events
+# and IMS lookups come from benchmarks.tools.synthetic_properties. Stage times
+# (and tracemalloc peaks with PROFILING_MEMORY=true) are read back from the
+# profiling.jsonl records of every property.
+# Run from src/: python -m benchmarks.pipeline --properties 20
+
+# Paths and settings are read at import time: configure them first
+os.environ.setdefault("DATA_PATH", tempfile.mkdtemp(prefix="sp_worker_bench_"))
+os.environ.setdefault("PROFILING", "true")
+os.environ.setdefault("MLFLOW_LOGGING_MODE", "off")
+
+from config.paths import DATA_PATH, MODELS_PATH  # noqa: E402
+from ml.baseline.baseline_pipeline import baseline_model_updater  # noqa: E402
+from ml.optimized_baseline.opt_baseline_pipeline import (  # noqa: E402
+    opt_baseline_model_updater,
+)
+from benchmarks.tools.synthetic_properties import (  # noqa: E402
+    offline_stand_ins,
+    seed_workspace,
+)
+
+
+def _read_profiles(scrap_type: str) -> list[dict]:
+    records = []
+    for path in MODELS_PATH.glob(f"property_id_*/{scrap_type}/profiling.jsonl"):
+        with open(path) as f:
+            records.extend(json.loads(line) for line in f if line.strip())
+    return records
+
+
+def _print_stages(records: list[dict]) -> None:
+    totals: dict[str, float] = defaultdict(float)
+    calls: dict[str, int] = defaultdict(int)
+    peaks: dict[str, float] = {}
+    for record in records:
+        for name, stage in record["stages"].items():
+            totals[name] += stage["seconds"]
+            calls[name] += stage["calls"]
+            if "peak_mb" in stage:
+                peaks[name] = max(peaks.get(name, 0.0), stage["peak_mb"])
+
+    print(f"  {'stage':<26} {'total s':>9} {'calls':>6} {'ms/call':>9} {'peak MB':>8}")
+    for name in sorted(totals, key=totals.get, reverse=True):
+        peak = f"{peaks[name]:8.1f}" if name in peaks else f"{'-':>8}"
+        print(
+            f"  {name:<26} {totals[name]:9.2f} {calls[name]:6d} "
+            f"{totals[name] / calls[name] * 1e3:9.1f} {peak}"
+        )
+
+
+def run(
+    n_properties: int = 10,
+    scrap_types: tuple[str, ...] = ("B", "A"),
+    rows_per_scrape: int = 200,
+    n_workers: int = 1,
+    optimized: bool = True,
+):
+    print(f"workspace: {DATA_PATH}")
+    start = time.perf_counter()
+    seed_workspace(n_properties, list(scrap_types), rows_per_scrape=rows_per_scrape)
+    print(f"seeded {n_properties} properties in {time.perf_counter() - start:.1f}s")
+
+    # Type B runs first: type A features read the latest type B predictions
+    with offline_stand_ins():
+        for scrap_type in scrap_types:
+            start = time.perf_counter()
+            baseline_model_updater(scrap_type, n_workers=n_workers)
+            elapsed = time.perf_counter() - start
+
+            records = _read_profiles(scrap_type)
+            n_trained = sum("train" in r["stages"] for r in records)
+            print(
+                f"\nbaseline {scrap_type}: {elapsed:.2f}s for {n_properties} "
+                f"properties, {n_properties / elapsed:.2f} properties/s, "
+                f"{n_trained / elapsed:.2f} models/s ({n_trained} trained)"
+            )
+            _print_stages(records)
+
+            if optimized:
+                start = time.perf_counter()
+                opt_baseline_model_updater(scrap_type)
+                elapsed = time.perf_counter() - start
+                print(
+                    f"optimized baseline {scrap_type}: {elapsed:.2f}s, "
+                    f"{n_properties / elapsed:.2f} properties/s"
+                )
+
+    # ru_maxrss is in KiB on Linux
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"\npeak RSS: {peak_rss:.0f} MB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--properties", type=int, default=10)
+    parser.add_argument("--scrap-types", nargs="+", default=["B", "A"])
+    parser.add_argument("--rows-per-scrape", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--no-optimized", action="store_true")
+    args = parser.parse_args()
+    run(
+        args.properties,
+        tuple(args.scrap_types),
+        args.rows_per_scrape,
+        args.workers,
+        not args.no_optimized,
+    )
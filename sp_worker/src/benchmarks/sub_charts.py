@@ -0,0 +1,105 @@
+import os
+import time
+import shutil
+import argparse
+import tempfile
+
+# sub_charts_updater on N synthetic properties sharing `comp_sets` competitor
+# sets, against the previous per-property loop. Runs type A charts with
+# INCREMENTAL_CHARTS=true, the chart path that needs no external API, from an
+# empty chart state each time; comp prices written by every run are compared.
+# Run from src/: python -m benchmarks.sub_charts --properties 40 --comp-sets 10
+
+# Paths and settings are read at import time: configure them first
+os.environ.setdefault("DATA_PATH", tempfile.mkdtemp(prefix="sp_worker_bench_"))
+os.environ.setdefault("INCREMENTAL_CHARTS", "true")
+
+import pandas as pd  # noqa: E402
+
+from config.paths import DATA_PATH, OUTPUTS_PATH  # noqa: E402
+from data_analytics.incremental_charts import update_charts_incrementally  # noqa: E402
+from data_analytics.sub_charts_pipeline import sub_charts_updater  # noqa: E402
+from utils.data_reader import (  # noqa: E402
+    load_chart_state,
+    load_latest_updates_processed,
+    load_processed_data_subfolder,
+)
+from utils.data_saver import save_comp_prices  # noqa: E402
+from benchmarks.tools.synthetic_properties import seed_workspace  # noqa: E402
+
+SCRAP_TYPE = "A"
+
+
+def per_property_charts(scrap_type: str) -> None:
+    # Previous sub_charts_updater: every property loaded and charted on its own
+    for property_id in load_latest_updates_processed(scrap_type):
+        dict_df_comp = load_processed_data_subfolder(
+            property_id, scrap_type, "comp_data"
+        )
+        dict_df_prices, _ = update_charts_incrementally(
+            dict_df_comp, property_id, scrap_type
+        )
+        save_comp_prices(dict_df_prices, property_id, scrap_type)
+
+
+def _reset_outputs() -> None:
+    for folder in ("chart_state", "comp_prices"):
+        shutil.rmtree(OUTPUTS_PATH / folder, ignore_errors=True)
+
+
+def _read_comp_prices(scrap_type: str) -> dict[tuple[int, str], pd.DataFrame]:
+    result = {}
+    for ota_folder in OUTPUTS_PATH.glob(f"comp_prices/property_id_*/{scrap_type}/*"):
+        property_id = int(ota_folder.parent.parent.name.removeprefix("property_id_"))
+        latest = max(ota_folder.glob("*.feather"))
+        result[(property_id, ota_folder.name)] = pd.read_feather(latest)
+    return result
+
+
+def _timed_run(fn) -> tuple[float, dict[tuple[int, str], pd.DataFrame]]:
+    _reset_outputs()
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start, _read_comp_prices(SCRAP_TYPE)
+
+
+def run(
+    n_properties: int = 40,
+    n_comp_sets: int = 10,
+    n_workers: int = os.cpu_count() or 1,
+    rows_per_scrape: int = 400,
+):
+    print(f"workspace: {DATA_PATH}")
+    seed_workspace(
+        n_properties,
+        [SCRAP_TYPE],
+        rows_per_scrape=rows_per_scrape,
+        n_comp_sets=n_comp_sets,
+    )
+
+    t_reference, expected = _timed_run(lambda: per_property_charts(SCRAP_TYPE))
+    print(f"per-property loop          : {t_reference:7.2f}s")
+
+    for workers in sorted({1, n_workers}):
+        elapsed, result = _timed_run(lambda: sub_charts_updater(SCRAP_TYPE, workers))
+        assert result.keys() == expected.keys()
+        for key, df_expected in expected.items():
+            pd.testing.assert_frame_equal(result[key], df_expected)
+        # Every member keeps its own chart state, not only the group's first
+        for property_id in load_latest_updates_processed(SCRAP_TYPE):
+            assert load_chart_state(property_id, SCRAP_TYPE) is not None
+        print(
+            f"grouped, {workers:>2} worker(s)      : {elapsed:7.2f}s "
+            f"({t_reference / elapsed:.1f}x)"
+        )
+    print(f"[parity] comp prices of {n_properties} properties match")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--properties", type=int, default=40)
+    parser.add_argument("--comp-sets", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--rows-per-scrape", type=int, default=400)
+    args = parser.parse_args()
+    run(args.properties, args.comp_sets, args.workers, args.rows_per_scrape)
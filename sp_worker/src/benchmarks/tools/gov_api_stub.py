@@ -0,0 +1,193 @@
+import json
+import time
+import threading
+from typing import Optional
+from collections import Counter, deque
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import pandas as pd
+
+from data_analytics.calendar_fetcher import (
+    AREA_CODE_ENDPOINT,
+    FESTIVAL_ENDPOINT,
+    HOLIDAYS_ENDPOINT,
+)
+
+# Local HTTP stand-in for the government open APIs behind ext_event_and_holidays
+# (area codes, festivals, public holidays). Responses follow the data.go.kr JSON
+# envelope, paginated by pageNo / numOfRows, and are deterministic for a given
+# query. Every request is counted per endpoint, with optional latency, a share
+# of failing (HTTP 500) responses and a requests-per-second limit answered with
+# HTTP 429 and Retry-After.
+#
+#   with GovApiStub(latency=0.05, rate_limit=20) as stub:
+#       requests.get(f"{stub.url}{HOLIDAYS_ENDPOINT}", params={"solYear": 2025})
+
+AREAS = {
+    "서울": "1",
+    "인천": "2",
+    "대전": "3",
+    "대구": "4",
+    "부산": "6",
+    "제주도": "39",
+}
+HOLIDAYS = {
+    "0101": "1월1일",
+    "0301": "삼일절",
+    "0505": "어린이날",
+    "0606": "현충일",
+    "0815": "광복절",
+    "1003": "개천절",
+    "1009": "한글날",
+    "1225": "기독탄신일",
+}
+
+
+def _envelope(items: list[dict], query: dict[str, str]) -> dict:
+    page, n_rows = int(query.get("pageNo", 1)), int(query.get("numOfRows", 10))
+    page_items = items[(page - 1) * n_rows : page * n_rows]
+    return {
+        "response": {
+            "header": {"resultCode": "0000", "resultMsg": "OK"},
+            "body": {
+                "items": {"item": page_items} if page_items else "",
+                "numOfRows": n_rows,
+                "pageNo": page,
+                "totalCount": len(items),
+            },
+        }
+    }
+
+
+def _area_codes(query: dict[str, str]) -> list[dict]:
+    return [{"code": code, "name": name} for name, code in AREAS.items()]
+
+
+def _festivals(query: dict[str, str]) -> list[dict]:
+    # One festival starting every 9 days in the window, offset by area
+    start = pd.Timestamp(query["eventStartDate"])
+    end = pd.Timestamp(query.get("eventEndDate", start + pd.Timedelta(days=365)))
+    area_code = int(query.get("areaCode", "1"))
+    starts = pd.date_range(start + pd.Timedelta(days=area_code % 9), end, freq="9D")
+    return [
+        {
+            "title": f"festival {area_code}-{day:%Y%m%d}",
+            "areacode": str(area_code),
+            "eventstartdate": f"{day:%Y%m%d}",
+            "eventenddate": f"{day + pd.Timedelta(days=2):%Y%m%d}",
+        }
+        for day in starts
+    ]
+
+
+def _holidays(query: dict[str, str]) -> list[dict]:
+    year = query["solYear"]
+    month = query.get("solMonth")
+    return [
+        {"locdate": int(f"{year}{day}"), "dateName": name, "isHoliday": "Y"}
+        for day, name in HOLIDAYS.items()
+        if month is None or day[:2] == month.zfill(2)
+    ]
+
+
+ROUTES = {
+    AREA_CODE_ENDPOINT: _area_codes,
+    FESTIVAL_ENDPOINT: _festivals,
+    HOLIDAYS_ENDPOINT: _holidays,
+}
+
+
+class GovApiStub:
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        rate_limit: Optional[float] = None,
+    ) -> None:
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.rate_limit = rate_limit
+        self.hits: Counter[str] = Counter()
+        self.rejected = 0
+        self._lock = threading.Lock()
+        self._recent: deque[float] = deque()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _count(self, path: str) -> int:
+        with self._lock:
+            self.hits[path] += 1
+            return sum(self.hits.values())
+
+    def _over_rate_limit(self) -> bool:
+        # Sliding one-second window over the accepted requests
+        if self.rate_limit is None:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            while self._recent and self._recent[0] <= now - 1:
+                self._recent.popleft()
+            if len(self._recent) >= self.rate_limit:
+                self.rejected += 1
+                return True
+            self._recent.append(now)
+            return False
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self) -> None:
+                parsed = urlparse(self.path)
+                route = ROUTES.get(parsed.path)
+                if route is None:
+                    self.send_error(404)
+                    return
+                n_requests = stub._count(parsed.path)
+                if stub._over_rate_limit():
+                    self.send_response(429)
+                    # Alternates both Retry-After forms: seconds and HTTP date
+                    retry_after = (
+                        formatdate(time.time() + 1, usegmt=True)
+                        if stub.rejected % 2
+                        else "1"
+                    )
+                    self.send_header("Retry-After", retry_after)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                time.sleep(stub.latency)
+                # Every 1 / failure_rate-th request fails, deterministically
+                if stub.failure_rate and n_requests % round(1 / stub.failure_rate) == 0:
+                    self.send_error(500)
+                    return
+
+                query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+                body = json.dumps(_envelope(route(query), query)).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        return Handler
+
+    def __enter__(self) -> "GovApiStub":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
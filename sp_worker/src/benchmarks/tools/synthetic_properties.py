@@ -0,0 +1,258 @@
+import json
+from typing import Optional
+from contextlib import ExitStack, contextmanager
+from unittest import mock
+import pandas as pd
+import numpy as np
+
+from config.paths import DATA_PATH
+from config.settings import DEFAULT_TIMEZONE
+from data_ingestion.hotel_class import HotelProperty
+from utils.data_saver import save_events_data, save_processed_data, save_properties
+
+# Synthetic processed data, properties and IMS stand-ins for offline runs of the
+# baseline and optimized baseline updaters. Everything is written under DATA_PATH
+# with the repo's own savers, so the pipelines read it through their usual paths.
+
+STAND_INS_PATH = DATA_PATH / "stand_ins"
+OTAS = ["agoda", "booking", "expedia", "yanolja"]
+CHANNEL_CATEGORIES = ["ota", "direct", "wholesale"]
+
+# Scrape cadence and booking horizon of each scrap type
+SCRAP_TYPE_SHAPES = {
+    "A": {"history": pd.Timedelta(days=7), "freq": "h", "horizon_days": 14},
+    "B": {"history": pd.Timedelta(days=90), "freq": "D", "horizon_days": 180},
+}
+
+
+def room_names(property_id: int, n_rooms: int) -> list[str]:
+    return [f"room_{property_id}_{r}" for r in range(n_rooms)]
+
+
+def make_ota_frame(
+    hotel_ids: list[int],
+    rooms: list[str],
+    ota: str,
+    scrap_type: str,
+    rows_per_scrape: int,
+    rng: np.random.Generator,
+    now: pd.Timestamp,
+) -> pd.DataFrame:
+    # Raw-processed schema: one price per (hotel, room, checkIn) seen by a scrape
+    shape = SCRAP_TYPE_SHAPES[scrap_type]
+    scrapes = pd.date_range(now - shape["history"], now, freq=shape["freq"])
+    n_rows = len(scrapes) * rows_per_scrape
+
+    scraping_id = scrapes.repeat(rows_per_scrape)
+    lead_days = rng.integers(0, shape["horizon_days"], n_rows)
+    checkin = scraping_id.normalize() + pd.to_timedelta(lead_days, unit="D")
+    room = rng.integers(0, len(rooms), n_rows)
+    weekend = checkin.dayofweek >= 5
+    price = (
+        100_000
+        + 15_000 * room
+        + 20_000 * weekend
+        - 60 * lead_days
+        + rng.normal(0, 5_000, n_rows)
+    )
+    return pd.DataFrame(
+        {
+            "hotel_id": rng.choice(hotel_ids, n_rows),
+            "name": np.asarray(rooms)[room],
+            "channel": ota,
+            "checkIn": checkin,
+            "scraping_id": scraping_id,
+            "price_display": np.round(price, -2),
+        }
+    )
+
+
+def make_property(
+    property_id: int, client_id: int, comp_ids: list[int], n_rooms: int
+) -> HotelProperty:
+    # HotelProperty is built from IMS lookups in production; only the attributes
+    # the updaters read are filled here
+    hotel_property = HotelProperty.__new__(HotelProperty)
+    hotel_property.property_id = property_id
+    hotel_property.client_ids = [client_id]
+    hotel_property.comp_ids = comp_ids
+    hotel_property.is_using_IMS = True
+    hotel_property.df_rt_mapping = pd.DataFrame(
+        {"property_id": property_id, "name": room_names(property_id, n_rooms)}
+    )
+    return hotel_property
+
+
+def seed_workspace(
+    n_properties: int,
+    scrap_types: list[str],
+    n_rooms: int = 6,
+    n_comps: int = 5,
+    n_otas: int = 3,
+    rows_per_scrape: int = 200,
+    seed: int = 0,
+    n_comp_sets: Optional[int] = None,
+) -> list[HotelProperty]:
+    # n_comp_sets: properties share that many competitor sets (default: one each)
+    rng = np.random.default_rng(seed)
+    now = pd.Timestamp.now(tz=DEFAULT_TIMEZONE).floor("h")
+    otas = OTAS[:n_otas]
+    n_comp_sets = n_comp_sets or n_properties
+
+    properties = []
+    for property_id in range(1, n_properties + 1):
+        client_id = property_id * 1_000
+        comp_set = (property_id - 1) % n_comp_sets + 1
+        comp_ids = [comp_set * 1_000 + 500 + c for c in range(1, n_comps + 1)]
+        properties.append(make_property(property_id, client_id, comp_ids, n_rooms))
+    save_properties(properties)
+
+    for scrap_type in scrap_types:
+        comp_rooms = [f"comp_room_{r}" for r in range(n_rooms)]
+        # Same competitors, same scraped rows: one frame per competitor set
+        dict_comp_sets: dict[tuple[int, ...], dict[str, pd.DataFrame]] = {}
+        dict_prop_id_client_comp = {}
+        for p in properties:
+            rooms = room_names(p.property_id, n_rooms)
+            comp_key = tuple(p.comp_ids)
+            if comp_key not in dict_comp_sets:
+                dict_comp_sets[comp_key] = {
+                    ota: make_ota_frame(
+                        p.comp_ids,
+                        comp_rooms,
+                        ota,
+                        scrap_type,
+                        rows_per_scrape,
+                        rng,
+                        now,
+                    )
+                    for ota in otas
+                }
+            dict_prop_id_client_comp[p.property_id] = (
+                {
+                    ota: make_ota_frame(
+                        p.client_ids, rooms, ota, scrap_type, rows_per_scrape, rng, now
+                    )
+                    for ota in otas
+                },
+                dict_comp_sets[comp_key],
+            )
+        save_processed_data(dict_prop_id_client_comp, scrap_type)
+
+    # Event importance normally comes from sub_charts_updater (external APIs)
+    checkins = pd.date_range(now.normalize(), periods=365, freq="D")
+    for p in properties:
+        save_events_data(
+            pd.DataFrame(
+                {
+                    "checkIn": checkins,
+                    "event_importance": rng.integers(0, 4, len(checkins)),
+                }
+            ),
+            p.property_id,
+        )
+
+    _write_stand_in_files(properties, otas, n_rooms)
+    return properties
+
+
+# ----------------------------------- IMS stand-ins -----------------------------------
+
+
+def _write_stand_in_files(
+    properties: list[HotelProperty], otas: list[str], n_rooms: int
+) -> None:
+    STAND_INS_PATH.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame(
+        [
+            {"property_id": p.property_id, "channel": ota, "name": name}
+            for p in properties
+            for ota in otas
+            for name in room_names(p.property_id, n_rooms)
+        ]
+    ).to_feather(STAND_INS_PATH / "manual_channel_roomtype_mapping.feather")
+    pd.DataFrame({"channel": otas, "category": CHANNEL_CATEGORIES[0]}).to_feather(
+        STAND_INS_PATH / "channel_categories.feather"
+    )
+
+    # Optimized baseline curves for every synthetic room
+    fitted_params = {
+        str(p.property_id): {
+            name: {"P0": 120_000.0, "k": 4e-5, "v": 0.25, "L": 1.02}
+            for name in room_names(p.property_id, n_rooms)
+        }
+        for p in properties
+    }
+    with open(STAND_INS_PATH / "fitted_params.json", "w") as f:
+        json.dump(fitted_params, f)
+
+    pd.DataFrame(
+        {
+            "room_name": [
+                name for p in properties for name in room_names(p.property_id, n_rooms)
+            ],
+            "property_id": np.repeat([p.property_id for p in properties], n_rooms),
+            "category_id": np.tile(np.arange(n_rooms), len(properties)),
+        }
+    ).to_feather(STAND_INS_PATH / "roomtypes.feather")
+    pd.DataFrame(
+        {
+            "channel_name": otas,
+            "category_id": np.arange(len(otas)),
+        }
+    ).to_feather(STAND_INS_PATH / "channels.feather")
+
+
+def fetch_all_existing_roomtypes(property_ids: list[int]) -> pd.DataFrame:
+    df = pd.read_feather(STAND_INS_PATH / "roomtypes.feather")
+    return df[df["property_id"].isin(property_ids)].reset_index(drop=True)
+
+
+def fetch_all_used_channels() -> pd.DataFrame:
+    return pd.read_feather(STAND_INS_PATH / "channels.feather")
+
+
+def get_ims_occ(property_id: int, scrap_type: str) -> pd.DataFrame:
+    # Deterministic occupancy curve per checkIn, filling up as dates approach
+    horizon_days = SCRAP_TYPE_SHAPES[scrap_type]["horizon_days"]
+    today = pd.Timestamp.now(tz=DEFAULT_TIMEZONE).normalize()
+    lead_days = np.arange(horizon_days)
+    return pd.DataFrame(
+        {
+            "checkIn": today + pd.to_timedelta(lead_days, unit="D"),
+            "occ": np.clip(0.9 - lead_days / (2 * horizon_days), 0.05, 0.95),
+        }
+    )
+
+
+@contextmanager
+def offline_stand_ins():
+    # Swaps the IMS queries and the source-tree extra data for the local files
+    targets = {
+        "ml.baseline.baseline_pipeline": {
+            "fetch_all_existing_roomtypes": fetch_all_existing_roomtypes,
+            "fetch_all_used_channels": fetch_all_used_channels,
+            "MANUAL_CHANNEL_ROOMTYPE_MAPPING_PATH": STAND_INS_PATH
+            / "manual_channel_roomtype_mapping.feather",
+            "MANUAL_CHANNEL_CATEGORY_PATH": STAND_INS_PATH
+            / "channel_categories.feather",
+        },
+        "features.shared_features.unseen_simulation": {
+            "MANUAL_CHANNEL_CATEGORY_PATH": STAND_INS_PATH
+            / "channel_categories.feather",
+        },
+        "ml.optimized_baseline.opt_baseline_pipeline": {"get_ims_occ": get_ims_occ},
+        "ml.optimized_baseline.fitted_params": {
+            "OPTIMIZED_BASELINE_FITTED_PARAMS_PATH": STAND_INS_PATH
+            / "fitted_params.json",
+        },
+        "utils.data_reader": {
+            "OPTIMIZED_BASELINE_FITTED_PARAMS_PATH": STAND_INS_PATH
+            / "fitted_params.json",
+        },
+    }
+    with ExitStack() as stack:
+        for module, attributes in targets.items():
+            for name, value in attributes.items():
+                stack.enter_context(mock.patch(f"{module}.{name}", value))
+        yield
@@ -0,0 +1,12 @@
+import time
+import numpy as np
+
+
+def best_time(fn, repeat: int) -> float:
+    # Best wall-clock time of fn() over `repeat` runs, in seconds
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
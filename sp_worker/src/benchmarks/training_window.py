@@ -0,0 +1,70 @@
+import time
+import argparse
+import pandas as pd
+import numpy as np
+import lightgbm as lgb
+
+from features.shared_features.training_window import (
+    select_training_window,
+    pop_sample_weight,
+)
+
+# Training time against history length, on the full history and on the
+# time-decayed training window, for a synthetic property with hourly scrapes.
+# Run from src/: python -m benchmarks.training_window
+
+
+def make_history(n_days: int, rows_per_day: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    n_rows = n_days * rows_per_day
+    latest = pd.Timestamp("2026-10-01")
+    df = pd.DataFrame(
+        {
+            "scraping_id": latest
+            - pd.to_timedelta(rng.integers(0, n_days * 24, n_rows), unit="h"),
+            "lead_days": rng.integers(0, 365, n_rows).astype(np.float64),
+            "comp_median": rng.uniform(50_000, 300_000, n_rows),
+        }
+    )
+    df["price"] = df["comp_median"] * 1.1 + df["lead_days"] * 100
+    return df
+
+
+def _fit(df: pd.DataFrame, num_rounds: int) -> float:
+    X = df.drop(columns=["scraping_id", "price"])
+    X, weight = pop_sample_weight(X)
+    start = time.perf_counter()
+    lgb.train(
+        {"objective": "regression", "verbose": -1},
+        lgb.Dataset(X, df["price"], weight=weight),
+        num_boost_round=num_rounds,
+    )
+    return time.perf_counter() - start
+
+
+def run(rows_per_day: int = 2_000, max_rows: int = 200_000, num_rounds: int = 100):
+    print(
+        f"{'history':>8} {'rows':>9} {'full fit':>10} {'window':>9} {'window fit':>11}"
+    )
+    for n_days in (30, 90, 180, 365):
+        df = make_history(n_days, rows_per_day)
+        t_full = _fit(df, num_rounds)
+
+        start = time.perf_counter()
+        selected = select_training_window({"ota": df}, max_rows=max_rows)["ota"]
+        t_select = time.perf_counter() - start
+        t_window = t_select + _fit(selected, num_rounds)
+
+        print(
+            f"{n_days:>7}d {len(df):>9} {t_full:>9.2f}s "
+            f"{len(selected):>9} {t_window:>10.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows-per-day", type=int, default=2_000)
+    parser.add_argument("--max-rows", type=int, default=200_000)
+    parser.add_argument("--rounds", type=int, default=100)
+    args = parser.parse_args()
+    run(args.rows_per_day, args.max_rows, args.rounds)
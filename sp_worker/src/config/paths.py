@@ -22,6 +22,9 @@ OUTPUTS_PATH = DATA_PATH / "outputs"
 RAW_DATA_PATH = DATA_PATH / "raw_data"
 PROCESSED_DATA_PATH = DATA_PATH / "processed"
 PROPERTIES_PATH = DATA_PATH / "properties"
+MODELS_PATH = DATA_PATH / "models"
+CACHE_PATH = DATA_PATH / "cache"
+EXTERNAL_API_CACHE_PATH = CACHE_PATH / "external_api.sqlite"
 
 # Extra data (kept in source tree, not in volume)
 EXTRA_DATA_PATH = BASE_DIR / "utils" / "extra_data"
@@ -52,6 +55,8 @@ def ensure_directories():
         RAW_DATA_PATH,
         PROCESSED_DATA_PATH,
         PROPERTIES_PATH,
+        MODELS_PATH,
+        CACHE_PATH,
         MFLOW_BASELINE_TRACKING_PATH,
     ]
     for directory in directories:
@@ -1,6 +1,95 @@
+import os
+from typing import Optional
+
 DEFAULT_TIMEZONE = "Asia/Seoul"
 TABLES_TO_FETCh = [
     ### --- OMITTED --- ###
 ]
 # MLFLOW_TRACKING_URI = "file:///opt/airflow/data/mlruns"
 MLFLOW_TRACKING_URI = "file:///shared-data/mlruns"
+
+# MLflow logging: "async" (background batched writes), "sync", "local" (async to
+# MLFLOW_LOCAL_TRACKING_URI instead of the shared store) or "off"
+MLFLOW_LOGGING_MODE = os.getenv("MLFLOW_LOGGING_MODE", "async").lower()
+MLFLOW_LOCAL_TRACKING_URI = os.getenv("MLFLOW_LOCAL_TRACKING_URI", "file:///tmp/mlruns")
+
+# Unseen room/channel augmentation: share of training rows duplicated as unseen,
+# hard cap on synthetic rows per simulator, and per-property overrides
+# e.g. {property_id: {"sample_ratio": 0.05, "max_rows": 20_000}}. By default every
+# row is duplicated once, as before; a budget is opt-in through these settings
+UNSEEN_AUGMENTATION_SAMPLE_RATIO = float(
+    os.getenv("UNSEEN_AUGMENTATION_SAMPLE_RATIO", "1.0")
+)
+UNSEEN_AUGMENTATION_MAX_ROWS: Optional[int] = (
+    int(os.getenv("UNSEEN_AUGMENTATION_MAX_ROWS"))
+    if os.getenv("UNSEEN_AUGMENTATION_MAX_ROWS")
+    else None
+)
+UNSEEN_AUGMENTATION_OVERRIDES: dict[int, dict[str, float]] = {}
+UNSEEN_AUGMENTATION_SEED = 42
+
+# Encode categorical features with per-property dictionaries persisted next to
+# the model (categories.json) instead of pandas categoricals; models must be
+# retrained when this is switched
+CATEGORICAL_STORE_ENABLED = os.getenv("CATEGORICAL_STORE", "false").lower() == "true"
+
+# Training window: scrapes of the last FULL_RESOLUTION_DAYS are kept as-is, older
+# ones are subsampled (stratified by OTA and scrape week) with weights halving
+# every HALF_LIFE_DAYS down to MIN_WEIGHT, within MAX_ROWS client rows per property
+TRAINING_WINDOW_FULL_RESOLUTION_DAYS = 30
+TRAINING_WINDOW_HALF_LIFE_DAYS = 60
+TRAINING_WINDOW_MIN_WEIGHT = 0.05
+TRAINING_WINDOW_MAX_ROWS = 500_000
+TRAINING_WINDOW_SEED = 42
+
+# Update comp price / market stats charts from the scrapes since the last run
+# (per-(OTA, checkIn) state under outputs/chart_state) instead of full history
+INCREMENTAL_CHARTS_ENABLED = os.getenv("INCREMENTAL_CHARTS", "false").lower() == "true"
+
+# Cache events / holidays / area code API responses in SQLite (CACHE_PATH): fresh
+# for the TTL of their namespace, then served stale for up to MAX_STALE seconds
+# while one background call refreshes them (and on API errors)
+EXTERNAL_API_CACHE_ENABLED = os.getenv("EXTERNAL_API_CACHE", "false").lower() == "true"
+EXTERNAL_API_CACHE_TTL_SECONDS = {
+    "area_code": 30 * 24 * 3600,
+    "events": 24 * 3600,
+    "holidays": 30 * 24 * 3600,
+}
+EXTERNAL_API_CACHE_MAX_STALE_SECONDS = 7 * 24 * 3600
+
+# Government calendar APIs (festivals, holidays): concurrent requests on a pooled
+# session, client-side rate limit in requests per second, and retries with
+# exponential backoff on 429 / 5xx / network errors
+GOV_API_BASE_URL = os.getenv("GOV_API_BASE_URL", "https://apis.data.go.kr")
+GOV_API_MAX_WORKERS = int(os.getenv("GOV_API_MAX_WORKERS", "8"))
+GOV_API_RATE_LIMIT_PER_SECOND = float(os.getenv("GOV_API_RATE_LIMIT", "20"))
+GOV_API_MAX_RETRIES = 4
+GOV_API_BACKOFF_SECONDS = 0.5
+GOV_API_TIMEOUT_SECONDS = 10
+
+# Feature engineering backend: "pandas" (default) or "polars" (lazy, optional)
+FEATURE_ENGINE = os.getenv("FEATURE_ENGINE", "pandas")
+
+# Stage-level profiling of baseline updates: per-property timings appended to
+# profiling.jsonl in the model folder, optional tracemalloc peaks and MLflow metrics
+PROFILING_ENABLED = os.getenv("PROFILING", "false").lower() == "true"
+PROFILING_TRACE_MEMORY = os.getenv("PROFILING_MEMORY", "false").lower() == "true"
+PROFILING_MLFLOW = os.getenv("PROFILING_MLFLOW", "false").lower() == "true"
+
+# Properties trained concurrently by baseline_model_updater (1 = serial)
+BASELINE_N_WORKERS = int(os.getenv("BASELINE_N_WORKERS", "1"))
+
+# Competitor groups charted concurrently by sub_charts_updater (1 = serial)
+SUB_CHARTS_N_WORKERS = int(os.getenv("SUB_CHARTS_N_WORKERS", "1"))
+
+# Warm-start type A models from the stored booster instead of hourly full retrains
+# (needs CATEGORICAL_STORE, otherwise every run is a full retrain)
+INCREMENTAL_TRAINING_A_ENABLED = (
+    os.getenv("INCREMENTAL_TRAINING_A", "false").lower() == "true"
+)
+
+# Retrain baseline models only when the drift monitor flags the new scrapes
+DRIFT_MONITOR_ENABLED = os.getenv("DRIFT_MONITOR", "false").lower() == "true"
+
+# Reuse registered models (and same-bucket ai_prices) when processed data is unchanged
+MODEL_REGISTRY_ENABLED = os.getenv("MODEL_REGISTRY", "false").lower() == "true"
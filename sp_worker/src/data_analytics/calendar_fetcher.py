@@ -0,0 +1,370 @@
+import os
+import json
+import time
+import random
+import logging
+import threading
+from typing import Optional
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+from config.settings import (
+    DEFAULT_TIMEZONE,
+    GOV_API_BACKOFF_SECONDS,
+    GOV_API_BASE_URL,
+    GOV_API_MAX_RETRIES,
+    GOV_API_MAX_WORKERS,
+    GOV_API_RATE_LIMIT_PER_SECOND,
+    GOV_API_TIMEOUT_SECONDS,
+)
+from data_analytics.ext_event_and_holidays import GOV_API_KEY
+
+logger = logging.getLogger(__name__)
+
+# Concurrent client of the government calendar APIs. Every (area, month) festival
+# window and every month of holidays is requested in parallel on one pooled
+# session: first pages first, then the remaining pages of all windows at once
+# (no task waits on another, so the pool cannot deadlock). Requests go through a
+# shared token bucket and are retried with exponential backoff and jitter on
+# network errors, 429 (honouring Retry-After) and 5xx. Failures raise, so the
+# response cache of ext_event_and_holidays never stores them.
+
+AREA_CODE_ENDPOINT = "/B551011/KorService1/areaCode1"
+FESTIVAL_ENDPOINT = "/B551011/KorService1/searchFestival1"
+HOLIDAYS_ENDPOINT = "/B090041/openapi/service/SpcdeInfoService/getRestDeInfo"
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+# data.go.kr answers quota overruns with HTTP 200 and this result code
+RATE_LIMITED_RESULT_CODE = "22"
+PAGE_SIZE = 100
+
+
+class RateLimiter:
+    # Token bucket shared by all threads; callers over the rate sleep outside
+    # the lock for the time their reserved token takes to refill
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+class RetryableResponse(Exception):
+
+    def __init__(self, message: str, retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _items(payload: dict) -> tuple[list[dict], int]:
+    # data.go.kr envelope: items is "" when empty and item a dict for one result
+    body = payload["response"]["body"]
+    items = body.get("items") or {}
+    item = items.get("item", []) if isinstance(items, dict) else []
+    item = [item] if isinstance(item, dict) else item
+    return item, int(body.get("totalCount", len(item)))
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    # Retry-After is either a number of seconds or an HTTP date
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        logger.warning(f"Ignoring unparseable Retry-After {value!r}")
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _month_windows(
+    start: pd.Timestamp, end: pd.Timestamp
+) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+    month_starts = pd.date_range(start.to_period("M").to_timestamp(), end, freq="MS")
+    return [
+        (max(month_start, start), min(month_start + pd.offsets.MonthEnd(0), end))
+        for month_start in month_starts
+    ]
+
+
+class CalendarFetcher:
+
+    def __init__(
+        self,
+        base_url: str = GOV_API_BASE_URL,
+        service_key: Optional[str] = GOV_API_KEY,
+        max_workers: int = GOV_API_MAX_WORKERS,
+        rate_limit: float = GOV_API_RATE_LIMIT_PER_SECOND,
+        max_retries: int = GOV_API_MAX_RETRIES,
+        backoff: float = GOV_API_BACKOFF_SECONDS,
+        timeout: float = GOV_API_TIMEOUT_SECONDS,
+        page_size: int = PAGE_SIZE,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.service_key = service_key
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.page_size = page_size
+        self.limiter = RateLimiter(rate_limit)
+        self.retries = 0
+        self._retries_lock = threading.Lock()
+        self._area_codes: Optional[dict[str, str]] = None
+        self._area_codes_lock = threading.Lock()
+
+        # One keep-alive connection per worker; retries are handled here
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=max_workers, max_retries=0
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="calendar_fetcher"
+        )
+
+    def __enter__(self) -> "CalendarFetcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        self.session.close()
+
+    # ----------------------------------- requests -----------------------------------
+
+    def _request_once(self, endpoint: str, params: dict) -> tuple[list[dict], int]:
+        self.limiter.acquire()
+        response = self.session.get(
+            f"{self.base_url}{endpoint}",
+            params={"serviceKey": self.service_key, "_type": "json", **params},
+            timeout=self.timeout,
+        )
+        if response.status_code in RETRY_STATUS:
+            raise RetryableResponse(
+                f"HTTP {response.status_code}",
+                _retry_after_seconds(response.headers.get("Retry-After")),
+            )
+        response.raise_for_status()
+
+        payload = response.json()
+        result_code = payload["response"]["header"]["resultCode"]
+        if result_code == RATE_LIMITED_RESULT_CODE:
+            raise RetryableResponse(f"resultCode {result_code}")
+        if result_code not in ("0000", "00"):
+            raise RuntimeError(
+                f"{endpoint} failed: {payload['response']['header'].get('resultMsg')}"
+            )
+        return _items(payload)
+
+    def _request(self, endpoint: str, params: dict) -> tuple[list[dict], int]:
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self._request_once(endpoint, params)
+            except (
+                RetryableResponse,
+                requests.ConnectionError,
+                requests.Timeout,
+            ) as e:
+                if attempt == self.max_retries:
+                    raise
+                retry_after = getattr(e, "retry_after", None)
+                # Full jitter keeps the workers of a rejected burst apart
+                delay = retry_after or random.uniform(0, self.backoff * 2**attempt)
+                logger.warning(
+                    f"{endpoint} {params}: {e}, retry {attempt + 1}/"
+                    f"{self.max_retries} in {delay:.2f}s"
+                )
+                with self._retries_lock:
+                    self.retries += 1
+                time.sleep(delay)
+
+    def _fetch_all(self, calls: list[tuple[str, dict]]) -> list[list[dict]]:
+        # Items of every (endpoint, params) request across all of its pages
+        first_pages = list(
+            self._executor.map(
+                lambda r: self._request(
+                    r[0], {**r[1], "pageNo": 1, "numOfRows": self.page_size}
+                ),
+                calls,
+            )
+        )
+        next_pages = [
+            (i, endpoint, {**params, "pageNo": page, "numOfRows": self.page_size})
+            for i, ((endpoint, params), (_, total)) in enumerate(
+                zip(calls, first_pages)
+            )
+            for page in range(2, -(-total // self.page_size) + 1)
+        ]
+        pages = self._executor.map(lambda r: self._request(r[1], r[2]), next_pages)
+
+        results = [items for items, _ in first_pages]
+        for (i, _, _), (items, _) in zip(next_pages, pages):
+            results[i] = results[i] + items
+        return results
+
+    # ----------------------------------- calendars -----------------------------------
+
+    def fetch_area_codes(self) -> dict[str, str]:
+        # Fetched once per fetcher: the codes do not change within a run
+        with self._area_codes_lock:
+            if self._area_codes is None:
+                (items,) = self._fetch_all([(AREA_CODE_ENDPOINT, {"MobileOS": "ETC"})])
+                self._area_codes = {item["name"]: str(item["code"]) for item in items}
+            return self._area_codes
+
+    def fetch_festival_items(
+        self, area_codes: dict[str, str], start_date: str, end_date: str
+    ) -> dict[str, list[dict]]:
+        # API items of the festivals of every (area name: code) over
+        # [start_date, end_date]; festivals spanning several months come back in
+        # each of their windows and are kept once
+        windows = _month_windows(pd.Timestamp(start_date), pd.Timestamp(end_date))
+        calls = [
+            (
+                area_name,
+                {
+                    "MobileOS": "ETC",
+                    "areaCode": area_code,
+                    "eventStartDate": f"{window_start:%Y%m%d}",
+                    "eventEndDate": f"{window_end:%Y%m%d}",
+                },
+            )
+            for area_name, area_code in area_codes.items()
+            for window_start, window_end in windows
+        ]
+        results = self._fetch_all([(FESTIVAL_ENDPOINT, params) for _, params in calls])
+        logger.info(
+            f"Fetched {sum(map(len, results))} festival rows for "
+            f"{len(area_codes)} areas x {len(windows)} months"
+        )
+
+        items_by_area: dict[str, dict[str, dict]] = {name: {} for name in area_codes}
+        for (area_name, _), items in zip(calls, results):
+            for item in items:
+                items_by_area[area_name].setdefault(
+                    json.dumps(item, sort_keys=True), item
+                )
+        return {name: list(items.values()) for name, items in items_by_area.items()}
+
+    def fetch_events(
+        self, area_names: list[str], start_date: str, end_date: str
+    ) -> pd.DataFrame:
+        # Festivals of every area over [start_date, end_date], one row per
+        # festival and area with parsed start / end dates
+        area_codes = self.fetch_area_codes()
+        unknown = sorted(set(area_names) - set(area_codes))
+        if unknown:
+            logger.warning(f"No area code for {unknown}, skipping their events")
+        return events_frame(
+            self.fetch_festival_items(
+                {
+                    area_name: area_codes[area_name]
+                    for area_name in dict.fromkeys(area_names)
+                    if area_name in area_codes
+                },
+                start_date,
+                end_date,
+            )
+        )
+
+    def fetch_holiday_items(self, start_date: str, end_date: str) -> list[dict]:
+        # API items of the public holidays in [start_date, end_date]
+        start, end = pd.Timestamp(start_date), pd.Timestamp(end_date)
+        months = _month_windows(start, end)
+        results = self._fetch_all(
+            [
+                (
+                    HOLIDAYS_ENDPOINT,
+                    {"solYear": f"{month:%Y}", "solMonth": f"{month:%m}"},
+                )
+                for month, _ in months
+            ]
+        )
+        return [
+            item
+            for month_items in results
+            for item in month_items
+            if start.normalize()
+            <= pd.Timestamp(str(item["locdate"]))
+            <= end.normalize()
+        ]
+
+    def fetch_holidays(self, start_date: str, end_date: str) -> pd.DataFrame:
+        # Public holidays in [start_date, end_date] as date, name, is_holiday
+        return holidays_frame(self.fetch_holiday_items(start_date, end_date))
+
+
+def events_frame(items_by_area: dict[str, list[dict]]) -> pd.DataFrame:
+    # One row per festival and area with parsed start / end dates
+    frames = [
+        pd.DataFrame(items).assign(area_name=area_name)
+        for area_name, items in items_by_area.items()
+        if items
+    ]
+    if not frames:
+        return pd.DataFrame(columns=["area_name", "start_date", "end_date"])
+    df_events = pd.concat(frames, ignore_index=True).drop_duplicates()
+    for column, source in (
+        ("start_date", "eventstartdate"),
+        ("end_date", "eventenddate"),
+    ):
+        df_events[column] = pd.to_datetime(
+            df_events[source].astype(str), format="%Y%m%d"
+        ).dt.tz_localize(DEFAULT_TIMEZONE)
+    return df_events.sort_values(
+        ["area_name", "start_date"], ignore_index=True, kind="stable"
+    )
+
+
+def holidays_frame(items: list[dict]) -> pd.DataFrame:
+    # Holiday API items as date, name, is_holiday
+    dates = pd.to_datetime([str(item["locdate"]) for item in items], format="%Y%m%d")
+    df_holidays = pd.DataFrame(
+        {
+            "date": dates.tz_localize(DEFAULT_TIMEZONE),
+            "name": [item.get("dateName") for item in items],
+            "is_holiday": [item.get("isHoliday") == "Y" for item in items],
+        }
+    )
+    return df_holidays.drop_duplicates().reset_index(drop=True)
+
+
+_FETCHER: Optional[CalendarFetcher] = None
+_FETCHER_PID: Optional[int] = None
+
+
+def get_calendar_fetcher() -> CalendarFetcher:
+    # One per process, so that every call reuses the pooled session, the worker
+    # threads and the area codes; a forked worker must not reuse the parent's
+    global _FETCHER, _FETCHER_PID
+    if _FETCHER is None or _FETCHER_PID != os.getpid():
+        _FETCHER = CalendarFetcher()
+        _FETCHER_PID = os.getpid()
+    return _FETCHER
@@ -8,7 +8,8 @@ import pytz
 import logging
 from dotenv import load_dotenv
 
-from config.settings import DEFAULT_TIMEZONE
+from config.settings import DEFAULT_TIMEZONE, EXTERNAL_API_CACHE_ENABLED
+from utils.api_cache import cached_api
 
 logger = logging.getLogger(__name__)
 tz = pytz.timezone(DEFAULT_TIMEZONE)
@@ -18,29 +19,74 @@ load_dotenv()
 GOV_API_KEY = os.getenv("GOV_API_KEY")
 
 
-def get_area_code(area_name: str) -> Optional[str]:
+def _calendar_fetcher():
+    # Imported here: calendar_fetcher reads GOV_API_KEY from this module
+    from data_analytics.calendar_fetcher import get_calendar_fetcher
 
-    ### --- OMITTED --- ###
+    return get_calendar_fetcher()
 
-    return None
+
+# The API helpers below go through the process's shared calendar fetcher, which
+# raises once its retries are spent: a failed call is never cached
+@cached_api("area_code")
+def get_area_code(area_name: str) -> Optional[str]:
+    return _calendar_fetcher().fetch_area_codes().get(area_name)
 
 
+@cached_api("events")
 def get_events(
     start_date: str, end_date: str, area_name: str
 ) -> list[dict[str, Union[str, None]]]:
+    area_code = get_area_code(area_name)
+    if area_code is None:
+        logger.warning(f"No area code for {area_name}, skipping its events")
+        return []
+    items_by_area = _calendar_fetcher().fetch_festival_items(
+        {area_name: area_code}, start_date, end_date
+    )
+    return items_by_area[area_name]
 
-    ### --- OMITTED --- ###
 
-    return []
+def _fetch_korean_holidays(
+    start_date: str, end_date: str
+) -> list[dict[str, Union[str, None]]]:
+    return _calendar_fetcher().fetch_holiday_items(start_date, end_date)
+
+
+@cached_api("holidays")
+def _get_korean_holidays_of_year(
+    year: int, date_format: str
+) -> Optional[list[dict[str, Union[str, None]]]]:
+    holidays = _fetch_korean_holidays(
+        pd.Timestamp(year=year, month=1, day=1).strftime(date_format),
+        pd.Timestamp(year=year, month=12, day=31).strftime(date_format),
+    )
+    # Every year has public holidays: none back means the requests failed, and
+    # None keeps the empty list out of the cache
+    if not holidays:
+        logger.warning(f"No holidays fetched for {year}, not caching them")
+        return None
+    return holidays
 
 
 def get_korean_holidays(
     start_date: str, end_date: str
 ) -> list[dict[str, Union[str, None]]]:
-
-    ### --- OMITTED --- ###
-
-    return holidays
+    if not EXTERNAL_API_CACHE_ENABLED:
+        return _fetch_korean_holidays(start_date, end_date)
+
+    # Cached per calendar year so that daily runs fetch each year once, then
+    # cut back to the requested range
+    date_format = "%Y-%m-%d" if "-" in start_date else "%Y%m%d"
+    start, end = pd.Timestamp(start_date), pd.Timestamp(end_date)
+    holidays = []
+    for year in range(start.year, end.year + 1):
+        holidays.extend(_get_korean_holidays_of_year(year, date_format) or [])
+    return [
+        holiday
+        for holiday in holidays
+        if start <= pd.Timestamp(str(holiday["locdate"])) <= end
+    ]
 
 
 def get_eves(df: pd.DataFrame) -> pd.DataFrame:
@@ -56,6 +102,13 @@ def get_events_and_holidays(
     area_name: str,
     with_eves: bool = True,
 ) -> pd.DataFrame:
+    # Imported here: calendar_fetcher reads GOV_API_KEY from this module
+    from data_analytics.calendar_fetcher import events_frame, holidays_frame
+
+    # Festivals and holidays of the range through the cached API helpers, whose
+    # misses fetch the monthly windows concurrently
+    df_events = events_frame({area_name: get_events(start_date, end_date, area_name)})
+    df_holidays = holidays_frame(get_korean_holidays(start_date, end_date))
 
     ### --- OMITTED --- ###
 
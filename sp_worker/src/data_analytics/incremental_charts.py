@@ -0,0 +1,197 @@
+import pandas as pd
+import numpy as np
+from typing import Optional
+import logging
+
+from config.settings import DEFAULT_TIMEZONE
+from utils.data_reader import load_chart_state
+from utils.data_saver import save_chart_state
+from .market_stats import CHECKIN_COL, PRICE_COL, STAT_COLS, market_stats_by_checkin
+
+logger = logging.getLogger(__name__)
+
+# Competitor charts kept up to date from the scrapes newer than the last run.
+# Comp prices: the state holds the latest price of every (OTA, hotel, room,
+# checkIn) still in the future, and new scrapes overwrite their keys. Market
+# stats: like get_market_trend_chart, they cover every scraped price of an
+# (OTA, checkIn), so the state keeps those prices for the checkIns new scrapes
+# can still reach (from the date of the last scrape on, as a scrape carries no
+# checkIn before its own date) and only the (OTA, checkIn) groups touched by new
+# scrapes are recomputed; stats of earlier checkIns are final. Work per run
+# scales with the new scrapes and the booking window, not the scrape history.
+# A change of the competitor set rebuilds the state.
+
+OTA_COL = "ota"
+SCRAPE_COL = "scraping_id"
+KEY_COLS = [OTA_COL, "hotel_id", "name", CHECKIN_COL]
+STATE_COLS = KEY_COLS + [PRICE_COL, SCRAPE_COL]
+GROUP_COLS = [OTA_COL, CHECKIN_COL]
+HISTORY_COLS = GROUP_COLS + [PRICE_COL]
+COMP_COLS = [OTA_COL, "hotel_id"]
+
+
+def comp_rows_since(
+    dict_df_comp: dict[str, pd.DataFrame], since: Optional[pd.Timestamp]
+) -> pd.DataFrame:
+    # Rows of the scrapes newer than `since`, ordered by scrape
+    frames = []
+    for ota, df in dict_df_comp.items():
+        if since is not None:
+            df = df[df[SCRAPE_COL] > since]
+        if not df.empty:
+            frames.append(df.assign(**{OTA_COL: ota})[STATE_COLS])
+    if not frames:
+        return pd.DataFrame(columns=STATE_COLS)
+
+    df_new = pd.concat(frames, ignore_index=True)
+    return df_new.sort_values(SCRAPE_COL, kind="stable", ignore_index=True)
+
+
+def _concat(frames: list[pd.DataFrame], columns: list[str]) -> pd.DataFrame:
+    # Empty (untyped) frames would turn typed columns into object on concat
+    frames = [df for df in frames if not df.empty]
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(frames, ignore_index=True)
+
+
+def _group_index(df: pd.DataFrame) -> pd.MultiIndex:
+    return pd.MultiIndex.from_frame(df[GROUP_COLS])
+
+
+def _split_by_ota(df: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    return {
+        ota: group.drop(columns=OTA_COL).reset_index(drop=True)
+        for ota, group in df.groupby(OTA_COL, sort=True)
+    }
+
+
+def update_chart_state(
+    df_latest: pd.DataFrame,
+    df_history: pd.DataFrame,
+    df_stats: pd.DataFrame,
+    df_new: pd.DataFrame,
+    today: pd.Timestamp,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    # New rows are strictly newer than the state, so appending them and keeping
+    # the last row per key is the upsert; no sort over the state is needed
+    df_latest = _concat([df_latest, df_new[STATE_COLS]], STATE_COLS)
+    df_latest = df_latest.drop_duplicates(KEY_COLS, keep="last")
+    df_latest = df_latest[df_latest[CHECKIN_COL] >= today]
+
+    df_history = _concat([df_history, df_new[HISTORY_COLS]], HISTORY_COLS)
+    touched = _group_index(df_new.drop_duplicates(GROUP_COLS))
+    df_touched = df_history[_group_index(df_history).isin(touched)]
+    dict_df_touched = {
+        ota: group for ota, group in df_touched.groupby(OTA_COL, sort=False)
+    }
+    recomputed = [
+        df.assign(**{OTA_COL: ota})
+        for ota, df in market_stats_by_checkin(dict_df_touched).items()
+    ]
+
+    kept = df_stats[~_group_index(df_stats).isin(touched)]
+    df_stats = _concat([kept] + recomputed, GROUP_COLS + STAT_COLS)
+    df_stats = df_stats.sort_values(GROUP_COLS, kind="stable", ignore_index=True)
+
+    # Prices of checkIns before the last scrape's date can no longer change
+    if not df_new.empty:
+        reachable_from = df_new[SCRAPE_COL].max().normalize()
+        df_history = df_history[df_history[CHECKIN_COL] >= reachable_from]
+    return (
+        df_latest.reset_index(drop=True),
+        df_history.reset_index(drop=True),
+        df_stats,
+    )
+
+
+def comp_set(dict_df_comp: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    # (OTA, hotel) pairs present in the competitor data
+    frames = [
+        pd.DataFrame({OTA_COL: ota, "hotel_id": df["hotel_id"].unique()})
+        for ota, df in dict_df_comp.items()
+    ]
+    df_comps = _concat(frames, COMP_COLS)
+    return df_comps.sort_values(COMP_COLS, ignore_index=True)
+
+
+def _comp_set_changed(df_known: pd.DataFrame, df_comps: pd.DataFrame) -> bool:
+    known = pd.MultiIndex.from_frame(df_known[COMP_COLS])
+    current = pd.MultiIndex.from_frame(df_comps[COMP_COLS])
+    return len(known) != len(current) or not known.isin(current).all()
+
+
+def advance_chart_state(
+    state: dict[str, pd.DataFrame],
+    watermark: Optional[pd.Timestamp],
+    dict_df_comp: dict[str, pd.DataFrame],
+    today: pd.Timestamp,
+) -> tuple[dict[str, pd.DataFrame], Optional[pd.Timestamp], int]:
+    # (state, watermark, new rows) after applying the scrapes newer than the
+    # watermark. A competitor leaving the set drops its prices from every
+    # (OTA, checkIn) it was in, including checkIns whose prices are no longer
+    # kept, and one joining may bring scrapes older than the watermark, so any
+    # change of the set rebuilds the state from the full history
+    df_comps = comp_set(dict_df_comp)
+    # States written before the competitor set was kept cannot tell either
+    if state and (
+        "competitors" not in state or _comp_set_changed(state["competitors"], df_comps)
+    ):
+        logger.info("Competitor set changed, rebuilding the charts from history")
+        state, watermark = {}, None
+
+    df_latest = state.get("latest_prices", pd.DataFrame(columns=STATE_COLS))
+    df_history = state.get("price_history", pd.DataFrame(columns=HISTORY_COLS))
+    df_stats = state.get("market_stats", pd.DataFrame(columns=GROUP_COLS + STAT_COLS))
+    df_new = comp_rows_since(dict_df_comp, watermark)
+    df_latest, df_history, df_stats = update_chart_state(
+        df_latest, df_history, df_stats, df_new, today
+    )
+
+    if not df_new.empty:
+        watermark = df_new[SCRAPE_COL].max()
+    state = {
+        "latest_prices": df_latest,
+        "price_history": df_history,
+        "market_stats": df_stats,
+        "competitors": df_comps,
+    }
+    return state, watermark, len(df_new)
+
+
+def update_charts_incrementally(
+    dict_df_comp: dict[str, pd.DataFrame],
+    property_id: int,
+    scrap_type: str,
+    now: Optional[pd.Timestamp] = None,
+    member_ids: Optional[list[int]] = None,
+) -> tuple[dict[str, pd.DataFrame], dict[str, pd.DataFrame]]:
+    # (comp prices, market stats) per OTA, in the layouts of get_comp_price_data
+    # and get_market_trend_chart. member_ids: properties sharing this comp data,
+    # each of which gets its own copy of the updated state (default: property_id)
+    now = now or pd.Timestamp.now(tz=DEFAULT_TIMEZONE)
+    loaded = load_chart_state(property_id, scrap_type)
+    if loaded is None:
+        logger.info(
+            f"No chart state for property {property_id} type {scrap_type}, "
+            f"building it from the full history"
+        )
+        state, watermark = {}, None
+    else:
+        state, watermark = loaded
+
+    state, watermark, n_new = advance_chart_state(
+        state, watermark, dict_df_comp, now.normalize()
+    )
+    if watermark is not None:
+        for member_id in member_ids or [property_id]:
+            save_chart_state(state, watermark, member_id, scrap_type)
+    logger.info(f"Charts property {property_id} type {scrap_type}: {n_new} new rows")
+
+    df_latest = state["latest_prices"]
+    df_prices = df_latest[np.isfinite(df_latest[PRICE_COL].astype(np.float64))]
+    df_prices = df_prices.sort_values(GROUP_COLS, kind="stable")
+    return (
+        _split_by_ota(df_prices.drop(columns=SCRAPE_COL)),
+        _split_by_ota(state["market_stats"]),
+    )
@@ -0,0 +1,75 @@
+import pandas as pd
+import numpy as np
+
+# Market trend statistics (DateStats: min, max, median, p5 ... p95) per OTA and
+# checkIn. Prices of all OTAs are sorted once with a lexsort over the group keys;
+# every statistic is then read from the sorted array at its interpolated rank,
+# with the same linear interpolation as pandas' quantile.
+
+PRICE_COL = "price_display"
+CHECKIN_COL = "checkIn"
+PERCENTILES = [5, 15, 25, 35, 45, 55, 65, 75, 85, 95]
+STAT_QUANTILES = {"min": 0.0, "max": 1.0, "median": 0.5} | {
+    f"p{p}": p / 100 for p in PERCENTILES
+}
+STAT_COLS = list(STAT_QUANTILES)
+
+
+def grouped_quantiles(
+    codes: np.ndarray, values: np.ndarray, quantiles: list[float]
+) -> tuple[np.ndarray, np.ndarray]:
+    # (group codes present, n_groups x n_quantiles matrix); NaN values skipped
+    valid = ~np.isnan(values)
+    codes, values = codes[valid], values[valid]
+    if len(values) == 0:
+        return codes, np.empty((0, len(quantiles)))
+
+    order = np.lexsort((values, codes))
+    sorted_codes = codes[order]
+    sorted_values = values[order]
+
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    sizes = np.diff(np.r_[starts, len(sorted_values)])
+
+    ranks = (sizes[:, None] - 1) * np.asarray(quantiles)[None, :]
+    lower = np.floor(ranks).astype(np.int64)
+    fraction = ranks - lower
+    upper = np.minimum(lower + 1, sizes[:, None] - 1)
+    low_values = sorted_values[starts[:, None] + lower]
+    high_values = sorted_values[starts[:, None] + upper]
+    return sorted_codes[starts], low_values + (high_values - low_values) * fraction
+
+
+def market_stats_by_checkin(
+    dict_df_comp: dict[str, pd.DataFrame],
+) -> dict[str, pd.DataFrame]:
+    # {ota: DataFrame[checkIn, *STAT_COLS]} sorted by checkIn
+    frames = {ota: df for ota, df in dict_df_comp.items() if not df.empty}
+    if not frames:
+        return {}
+
+    checkins = pd.concat([df[CHECKIN_COL] for df in frames.values()], ignore_index=True)
+    checkin_codes, checkin_values = pd.factorize(checkins, sort=True)
+    ota_codes = np.repeat(np.arange(len(frames)), [len(df) for df in frames.values()])
+    prices = np.concatenate(
+        [df[PRICE_COL].to_numpy(dtype=np.float64) for df in frames.values()]
+    )
+
+    # One group key per (OTA, checkIn); ordering by it sorts checkIns within OTAs
+    n_checkins = len(checkin_values)
+    group_codes, stats = grouped_quantiles(
+        ota_codes * n_checkins + checkin_codes,
+        prices,
+        list(STAT_QUANTILES.values()),
+    )
+
+    result = {}
+    group_otas = group_codes // n_checkins
+    for i, ota in enumerate(frames):
+        in_ota = group_otas == i
+        df_stats = pd.DataFrame(stats[in_ota], columns=STAT_COLS)
+        df_stats.insert(
+            0, CHECKIN_COL, checkin_values[group_codes[in_ota] % n_checkins]
+        )
+        result[ota] = df_stats
+    return result
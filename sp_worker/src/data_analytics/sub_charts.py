@@ -4,6 +4,7 @@ import pytz
 
 from utils.data_manip import df_merger
 from config.settings import DEFAULT_TIMEZONE
+from .market_stats import market_stats_by_checkin
 
 tz = pytz.timezone(DEFAULT_TIMEZONE)
 
@@ -27,6 +28,12 @@ def get_market_trend_chart(
 
     ### --- OMITTED --- ###
 
+    # min / max / median / p5 ... p95 of every (OTA, checkIn) from one sorted pass
+    # (replaces one groupby().quantile() per statistic and OTA)
+    dict_price_stats = market_stats_by_checkin(dict_df_comp_B)
+
+    ### --- OMITTED --- ###
+
     return dict_price_stats
 
 
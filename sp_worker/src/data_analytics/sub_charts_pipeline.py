@@ -1,63 +1,183 @@
+import hashlib
 import pandas as pd
 import logging
+from typing import Optional
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from utils.data_reader import (
     load_latest_updates_processed,
     load_processed_data_subfolder,
+    load_processed_digests,
 )
+from utils.data_manip import bytes_digest
 from utils.data_saver import save_comp_prices, save_market_stats, save_events_data
 from .sub_charts import get_comp_price_data, get_market_trend_chart, get_events_data
 from .ext_event_and_holidays import merge_event_importance_with_calendar_events
+from .incremental_charts import update_charts_incrementally
 
-from config.paths import MANUAL_PROPID_EVENT_AREA_MAPPING_PATH
-
+from config.paths import MANUAL_PROPID_EVENT_AREA_MAPPING_PATH, PROCESSED_DATA_PATH
+from config.settings import INCREMENTAL_CHARTS_ENABLED, SUB_CHARTS_N_WORKERS
 
 logger = logging.getLogger(__name__)
 
 
-def sub_charts_updater(scrap_type: str):
+# ----------------------------------- shared inputs -----------------------------------
+
+
+def _load_event_areas(property_ids: list[int]) -> dict[int, Optional[str]]:
+    # One read of the manual mapping for the whole run; first row per property wins
+    df_prop_id_event_area_mapping = pd.read_feather(
+        MANUAL_PROPID_EVENT_AREA_MAPPING_PATH
+    ).drop_duplicates("property_id")
+    event_areas = df_prop_id_event_area_mapping.set_index("property_id")["event_area"]
+    return {property_id: event_areas.get(property_id) for property_id in property_ids}
+
+
+def _comp_data_fingerprint(property_id: int, scrap_type: str) -> Optional[str]:
+    # Digest of the processed comp_data feathers: properties with the same
+    # competitor set get byte-identical files from data_processor. File digests
+    # come from the sidecar written with them, trusted while (size, mtime_ns)
+    # still match; only files saved without it are read
+    folder = PROCESSED_DATA_PATH / f"property_id_{property_id}" / scrap_type
+    files = sorted((folder / "comp_data").glob("*.feather"))
+    if not files:
+        return None
+    saved_digests = load_processed_digests(property_id, scrap_type, "comp_data")
+    digest = hashlib.blake2b(digest_size=16)
+    for file in files:
+        stat = file.stat()
+        saved = saved_digests.get(file.stem)
+        if saved is not None and saved[:2] == [stat.st_size, stat.st_mtime_ns]:
+            file_digest = saved[2]
+        else:
+            file_digest = bytes_digest(file.read_bytes())
+        digest.update(file.stem.encode())
+        digest.update(file_digest.encode())
+    return digest.hexdigest()
+
+
+def _group_by_competitors(property_ids: list[int], scrap_type: str) -> list[list[int]]:
+    # Properties without processed comp_data stay alone (the loader falls back)
+    groups: dict[object, list[int]] = {}
+    for property_id in property_ids:
+        key = _comp_data_fingerprint(property_id, scrap_type) or property_id
+        groups.setdefault(key, []).append(property_id)
+    return list(groups.values())
 
-    latest_updates: dict[int, pd.Timestamp] = load_latest_updates_processed(
-        scrap_type=scrap_type
-    )
-    property_ids: list[int] = list(latest_updates.keys())
 
-    for property_id in property_ids:
+# ----------------------------------- charts per competitor group -----------------------------------
 
-        dict_df_comp: dict[str, pd.DataFrame] = load_processed_data_subfolder(
-            property_id, scrap_type, "comp_data"
-        )
 
+def _update_group_charts(
+    property_ids: list[int],
+    scrap_type: str,
+    event_areas: dict[int, Optional[str]],
+) -> None:
+    # Charts only depend on comp_data: computed for the first property of the
+    # group and saved for every member, chart state included
+    property_id = property_ids[0]
+    dict_df_comp: dict[str, pd.DataFrame] = load_processed_data_subfolder(
+        property_id, scrap_type, "comp_data"
+    )
+
+    if INCREMENTAL_CHARTS_ENABLED:
+        # Only the checkIn dates touched by new scrapes are recomputed
+        dict_df_prices, dict_price_stats = update_charts_incrementally(
+            dict_df_comp, property_id, scrap_type, member_ids=property_ids
+        )
+    else:
         # Generate and competitor prices stats
         dict_df_prices: dict[str, pd.DataFrame] = get_comp_price_data(
             dict_df_comp, scrap_type
         )
-        save_comp_prices(dict_df_prices, property_id, scrap_type)
+        dict_price_stats = None
+    for member_id in property_ids:
+        save_comp_prices(dict_df_prices, member_id, scrap_type)
 
-        if scrap_type == "B":
-            # Generate and save market stats
+    if scrap_type == "B":
+        # Generate and save market stats
+        if dict_price_stats is None:
             dict_price_stats: dict[str, pd.DataFrame] = get_market_trend_chart(
                 dict_df_comp
             )
-            save_market_stats(dict_price_stats, property_id)
 
-            # Generate and save events data
-            df_event_importance: pd.DataFrame = get_events_data(dict_df_comp)
+        # Generate and save events data, merged once per event area
+        df_event_importance: pd.DataFrame = get_events_data(dict_df_comp)
+        dict_df_events: dict[str, pd.DataFrame] = {}
 
-            df_prop_id_event_area_mapping = pd.read_feather(
-                MANUAL_PROPID_EVENT_AREA_MAPPING_PATH
-            )
-            area_name: str = df_prop_id_event_area_mapping[
-                df_prop_id_event_area_mapping["property_id"] == property_id
-            ]["event_area"].iloc[0]
+        for member_id in property_ids:
+            save_market_stats(dict_price_stats, member_id)
 
-            df_event_importance_with_name: pd.DataFrame = (
-                merge_event_importance_with_calendar_events(
+            area_name = event_areas.get(member_id)
+            if area_name is None:
+                raise RuntimeError(
+                    f"[FATAL] No event area for property_id={member_id} in "
+                    f"{MANUAL_PROPID_EVENT_AREA_MAPPING_PATH}"
+                )
+            if area_name not in dict_df_events:
+                dict_df_events[area_name] = merge_event_importance_with_calendar_events(
                     df_event_importance, area_name
                 )
-            )
+            save_events_data(dict_df_events[area_name], member_id)
+
+
+def _run_groups_parallel(
+    groups: list[list[int]],
+    scrap_type: str,
+    event_areas: dict[int, Optional[str]],
+    n_workers: int,
+) -> dict[int, str]:
+    failures: dict[int, str] = {}
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        futures = {
+            executor.submit(
+                _update_group_charts,
+                group,
+                scrap_type,
+                {property_id: event_areas.get(property_id) for property_id in group},
+            ): group
+            for group in groups
+        }
+        for future in as_completed(futures):
+            group = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                logger.exception(f"Sub charts update failed for properties {group}")
+                for property_id in group:
+                    failures[property_id] = f"{type(e).__name__}: {e}"
+
+    return failures
+
+
+def sub_charts_updater(scrap_type: str, n_workers: Optional[int] = None):
+
+    n_workers = n_workers or SUB_CHARTS_N_WORKERS
 
-            save_events_data(df_event_importance_with_name, property_id)
+    latest_updates: dict[int, pd.Timestamp] = load_latest_updates_processed(
+        scrap_type=scrap_type
+    )
+    property_ids: list[int] = list(latest_updates.keys())
+
+    # Event areas are only used by type B charts
+    event_areas = _load_event_areas(property_ids) if scrap_type == "B" else {}
+    groups = _group_by_competitors(property_ids, scrap_type)
+    logger.info(
+        f"Sub charts {scrap_type}: {len(property_ids)} properties in "
+        f"{len(groups)} competitor groups on {n_workers} workers"
+    )
+
+    if n_workers <= 1 or len(groups) <= 1:
+        for group in groups:
+            _update_group_charts(group, scrap_type, event_areas)
+        return
+
+    failures = _run_groups_parallel(groups, scrap_type, event_areas, n_workers)
+    if failures:
+        raise RuntimeError(
+            f"Sub charts update failed for {len(failures)}/{len(property_ids)} "
+            f"properties: {failures}"
+        )
 
 
 ### EXAMPLE OF AIRFLOW TASKS ###
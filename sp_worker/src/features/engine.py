@@ -0,0 +1,139 @@
+import pandas as pd
+import numpy as np
+from pathlib import Path
+from typing import Any, Optional
+import logging
+
+from config.paths import PROCESSED_DATA_PATH
+from config.settings import FEATURE_ENGINE
+
+logger = logging.getLogger(__name__)
+
+# Aggregations shared by every engine, in output column order
+PRICE_STATS_AGGS = ["count", "mean", "std", "min", "max", "median"]
+
+
+def _processed_files(property_id: int, scrap_type: str, subfolder: str) -> list[Path]:
+    folder = PROCESSED_DATA_PATH / f"property_id_{property_id}" / scrap_type / subfolder
+    return sorted(folder.glob("*.feather"))
+
+
+def _finalize_price_stats(df: pd.DataFrame, by: list[str]) -> pd.DataFrame:
+    df = df.sort_values(by, kind="stable").reset_index(drop=True)
+    df["count"] = df["count"].astype(np.int64)
+    for agg in PRICE_STATS_AGGS[1:]:
+        df[agg] = df[agg].astype(np.float64)
+    return df
+
+
+class PandasEngine:
+    # Eager pandas execution, the default
+
+    name = "pandas"
+
+    def scan_processed(
+        self, property_id: int, scrap_type: str, subfolder: str, columns: list[str]
+    ) -> pd.DataFrame:
+        files = _processed_files(property_id, scrap_type, subfolder)
+        return self.scan_files(files, columns)
+
+    def scan_files(self, files: list[Path], columns: list[str]) -> pd.DataFrame:
+        if not files:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(
+            [pd.read_feather(f, columns=columns) for f in files], ignore_index=True
+        )
+
+    def from_frames(
+        self, dict_df: dict[str, pd.DataFrame], columns: list[str]
+    ) -> pd.DataFrame:
+        return pd.concat([df[columns] for df in dict_df.values()], ignore_index=True)
+
+    def price_stats(
+        self, frame: pd.DataFrame, by: list[str], value_col: str = "price_display"
+    ) -> pd.DataFrame:
+        stats = (
+            frame.groupby(by, observed=True, sort=False)[value_col]
+            .agg(PRICE_STATS_AGGS)
+            .reset_index()
+        )
+        return _finalize_price_stats(stats, by)
+
+    def collect(self, frame: pd.DataFrame) -> pd.DataFrame:
+        return frame
+
+
+class PolarsEngine:
+    # Lazy polars execution over the Arrow (feather) files: projection pushdown,
+    # query optimisation and multi-threaded group-bys, collected to pandas.
+
+    name = "polars"
+
+    def __init__(self):
+        try:
+            import polars as pl
+        except ImportError as e:
+            raise ImportError(
+                "FEATURE_ENGINE='polars' requires polars: pip install 'src[polars]'"
+            ) from e
+        self.pl = pl
+
+    def scan_processed(
+        self, property_id: int, scrap_type: str, subfolder: str, columns: list[str]
+    ) -> Any:
+        files = _processed_files(property_id, scrap_type, subfolder)
+        return self.scan_files(files, columns)
+
+    def scan_files(self, files: list[Path], columns: list[str]) -> Any:
+        pl = self.pl
+        if not files:
+            return pl.from_pandas(pd.DataFrame(columns=columns)).lazy()
+        return pl.concat(
+            [pl.scan_ipc(f).select(columns) for f in files],
+            how="vertical_relaxed",
+        )
+
+    def from_frames(self, dict_df: dict[str, pd.DataFrame], columns: list[str]) -> Any:
+        pl = self.pl
+        return pl.concat(
+            [pl.from_pandas(df[columns]).lazy() for df in dict_df.values()],
+            how="vertical_relaxed",
+        )
+
+    def price_stats(
+        self, frame: Any, by: list[str], value_col: str = "price_display"
+    ) -> pd.DataFrame:
+        pl = self.pl
+        value = pl.col(value_col)
+        stats = (
+            # Match pandas: NaN prices are skipped and null keys dropped
+            frame.with_columns(value.fill_nan(None))
+            .drop_nulls(by)
+            .group_by(by)
+            .agg(
+                value.count().alias("count"),
+                value.mean().alias("mean"),
+                value.std().alias("std"),
+                value.min().alias("min"),
+                value.max().alias("max"),
+                value.median().alias("median"),
+            )
+            .collect()
+            .to_pandas()
+        )
+        return _finalize_price_stats(stats, by)
+
+    def collect(self, frame: Any) -> pd.DataFrame:
+        return frame.collect().to_pandas()
+
+
+_ENGINES = {"pandas": PandasEngine, "polars": PolarsEngine}
+
+
+def get_feature_engine(name: Optional[str] = None) -> PandasEngine | PolarsEngine:
+    name = (name or FEATURE_ENGINE).lower()
+    if name not in _ENGINES:
+        raise ValueError(
+            f"Unknown feature engine '{name}', expected one of {list(_ENGINES)}"
+        )
+    return _ENGINES[name]()
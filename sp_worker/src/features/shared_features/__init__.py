@@ -9,3 +9,10 @@ from .unseen_simulation import (
 )
 
 from .categoricals import CATEGORICAL_COLS_B, CATEGORICAL_COLS_A
+from .categorical_store import categorical_store_handler
+from .nearest import SortedGroupIndex, attach_nearest
+from .training_window import (
+    select_training_window,
+    carry_sample_weight,
+    pop_sample_weight,
+)
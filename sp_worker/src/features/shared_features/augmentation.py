@@ -0,0 +1,100 @@
+import pandas as pd
+import numpy as np
+import logging
+from typing import Optional
+
+from config.settings import (
+    UNSEEN_AUGMENTATION_SAMPLE_RATIO,
+    UNSEEN_AUGMENTATION_MAX_ROWS,
+    UNSEEN_AUGMENTATION_OVERRIDES,
+    UNSEEN_AUGMENTATION_SEED,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def get_augmentation_budget(
+    property_id: Optional[int] = None,
+) -> tuple[float, Optional[int]]:
+    overrides: dict = UNSEEN_AUGMENTATION_OVERRIDES.get(property_id, {})
+    sample_ratio = float(
+        overrides.get("sample_ratio", UNSEEN_AUGMENTATION_SAMPLE_RATIO)
+    )
+    max_rows = overrides.get("max_rows", UNSEEN_AUGMENTATION_MAX_ROWS)
+    return sample_ratio, None if max_rows is None else int(max_rows)
+
+
+def get_augmentation_seed(property_id: Optional[int], stream: int) -> int:
+    # Independent, reproducible sampling stream per (property, simulator)
+    entropy = (UNSEEN_AUGMENTATION_SEED, stream)
+    if property_id is not None:
+        entropy = (UNSEEN_AUGMENTATION_SEED, property_id, stream)
+    return int(np.random.SeedSequence(entropy).generate_state(1)[0])
+
+
+def _sample_positions(
+    n_rows: int, sample_ratio: float, max_rows: Optional[int], seed: int
+) -> np.ndarray:
+    n_synthetic = min(int(n_rows * sample_ratio), n_rows)
+    if max_rows is not None:
+        n_synthetic = min(n_synthetic, max_rows)
+    if n_synthetic <= 0:
+        return np.empty(0, dtype=np.int64)
+    if n_synthetic == n_rows:
+        # Unbounded: every row gets its unseen copy
+        return np.arange(n_rows, dtype=np.int64)
+    rng = np.random.default_rng(seed)
+    positions = rng.choice(n_rows, size=n_synthetic, replace=False)
+    positions.sort()
+    return positions
+
+
+def _extend_column(
+    values: pd.Series, n_synthetic: int, unseen_value: str
+) -> pd.Series | pd.Categorical | np.ndarray:
+    # Original rows keep their values, synthetic rows all get the unseen label
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        categories = values.cat.categories
+        if unseen_value not in categories:
+            categories = categories.append(pd.Index([unseen_value]))
+        unseen_code = categories.get_loc(unseen_value)
+        codes = np.concatenate(
+            [
+                values.cat.codes.to_numpy(),
+                np.full(n_synthetic, unseen_code, dtype=values.cat.codes.dtype),
+            ]
+        )
+        return pd.Categorical.from_codes(
+            codes, categories=categories, ordered=values.cat.ordered
+        )
+
+    extended = np.empty(len(values) + n_synthetic, dtype=object)
+    extended[: len(values)] = values.to_numpy(dtype=object)
+    extended[len(values) :] = unseen_value
+    return extended
+
+
+def augment_unseen_category(
+    df: pd.DataFrame,
+    col: str,
+    unseen_value: str,
+    sample_ratio: float,
+    max_rows: Optional[int],
+    seed: int = UNSEEN_AUGMENTATION_SEED,
+) -> pd.DataFrame:
+    # Synthetic rows are copies of a bounded random sample of the original rows
+    # with `col` relabelled as unseen; built with a single positional take.
+    n_rows = len(df)
+    positions = _sample_positions(n_rows, sample_ratio, max_rows, seed)
+    if positions.size == 0:
+        return df
+
+    take = np.concatenate([np.arange(n_rows, dtype=np.int64), positions])
+    augmented = df.take(take).reset_index(drop=True)
+    augmented[col] = _extend_column(df[col], positions.size, unseen_value)
+
+    logger.info(
+        f"Added {positions.size} synthetic '{unseen_value}' rows on '{col}' "
+        f"({n_rows} -> {len(augmented)} rows)"
+    )
+    return augmented
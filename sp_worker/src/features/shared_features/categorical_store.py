@@ -0,0 +1,55 @@
+import pandas as pd
+import numpy as np
+import logging
+
+from utils.data_reader import load_categorical_dict
+from utils.data_saver import save_categorical_dict
+
+logger = logging.getLogger(__name__)
+
+# Code given to values missing from the dictionary, treated as missing by LightGBM
+UNKNOWN_CODE = -1
+
+
+def update_categorical_dict(
+    cat_dict: dict[str, list], X: pd.DataFrame, cols: list[str]
+) -> dict[str, list]:
+    # Append-only: new values get the next free code, existing codes never move,
+    # so models trained on an older dictionary stay valid.
+    updated: dict[str, list] = {}
+    for col in cols:
+        known = pd.Index(cat_dict.get(col, []))
+        values = pd.Index(pd.unique(X[col].dropna()))
+        new_values = values.difference(known, sort=False)
+        if len(new_values) > 0:
+            logger.info(f"Adding {len(new_values)} new categories to '{col}'")
+        updated[col] = known.tolist() + new_values.tolist()
+    return updated
+
+
+def encode_categoricals(
+    X: pd.DataFrame, cat_dict: dict[str, list], cols: list[str]
+) -> pd.DataFrame:
+    for col in cols:
+        categories = pd.Index(cat_dict.get(col, []))
+        codes = categories.get_indexer(X[col])
+        n_unknown = int(np.count_nonzero(codes == UNKNOWN_CODE))
+        if n_unknown:
+            logger.warning(f"{n_unknown} values of '{col}' missing from dictionary")
+        X[col] = codes.astype(np.int32)
+    return X
+
+
+def categorical_store_handler(
+    X: pd.DataFrame, cols: list[str], property_id: int, scrap_type: str, fit: bool
+) -> pd.DataFrame:
+    cat_dict: dict[str, list] = load_categorical_dict(property_id, scrap_type)
+    if fit:
+        cat_dict = update_categorical_dict(cat_dict, X, cols)
+        save_categorical_dict(cat_dict, property_id, scrap_type)
+    elif not cat_dict:
+        raise RuntimeError(
+            f"[FATAL] No categorical dictionary for property_id={property_id}, "
+            f"scrap_type='{scrap_type}'. Train the model before running inference."
+        )
+    return encode_categoricals(X, cat_dict, cols)
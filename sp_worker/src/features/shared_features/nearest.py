@@ -0,0 +1,107 @@
+import pandas as pd
+import numpy as np
+
+
+class SortedGroupIndex:
+    # Rows of `df` sorted by (group of `by` columns, `on`), searched with a
+    # single np.searchsorted over a composite key: O(n log m) for n queries.
+
+    def __init__(self, df: pd.DataFrame, by: list[str], on: str):
+        self.by = by
+        self.on = on
+
+        keys = pd.MultiIndex.from_frame(df[by])
+        group_codes, self.groups = pd.factorize(keys)
+        values = df[on].to_numpy(dtype=np.float64)
+
+        order = np.lexsort((values, group_codes))
+        self.positions: np.ndarray = order
+        self.group_codes: np.ndarray = group_codes[order]
+        self.values: np.ndarray = values[order]
+
+        # Queries are clipped to one unit outside the indexed values, so they keep
+        # their order against every indexed value and stay within their group
+        finite = values[np.isfinite(values)]
+        self._v_min = finite.min() - 1.0 if finite.size else 0.0
+        self._v_max = finite.max() + 1.0 if finite.size else 0.0
+        self._span = self._v_max - self._v_min + 1.0
+        self._composite = self._compose(self.group_codes, self.values)
+
+    def _compose(self, group_codes: np.ndarray, values: np.ndarray) -> np.ndarray:
+        clipped = np.clip(values, self._v_min, self._v_max)
+        return group_codes * self._span + (clipped - self._v_min)
+
+    def lookup(self, query: pd.DataFrame, direction: str = "nearest") -> np.ndarray:
+        # Positional index into the indexed frame for each query row, -1 if none
+        n_query = len(query)
+        result = np.full(n_query, -1, dtype=np.int64)
+        if n_query == 0 or len(self.values) == 0:
+            return result
+
+        query_codes = self.groups.get_indexer(pd.MultiIndex.from_frame(query[self.by]))
+        query_values = query[self.on].to_numpy(dtype=np.float64)
+        valid = (query_codes >= 0) & np.isfinite(query_values)
+        if not valid.any():
+            return result
+
+        codes = query_codes[valid]
+        values = query_values[valid]
+        composite = self._compose(codes, values)
+        n = len(self.values)
+
+        after = np.searchsorted(self._composite, composite, side="left")
+        exact_or_after = np.minimum(after, n - 1)
+        has_after = (after < n) & (self.group_codes[exact_or_after] == codes)
+
+        before = np.searchsorted(self._composite, composite, side="right") - 1
+        before_clipped = np.maximum(before, 0)
+        has_before = (before >= 0) & (self.group_codes[before_clipped] == codes)
+
+        if direction == "backward":
+            chosen = np.where(has_before, before_clipped, -1)
+        elif direction == "forward":
+            chosen = np.where(has_after, exact_or_after, -1)
+        elif direction == "nearest":
+            dist_before = np.where(
+                has_before, values - self.values[before_clipped], np.inf
+            )
+            dist_after = np.where(
+                has_after, self.values[exact_or_after] - values, np.inf
+            )
+            # Ties go to the smaller key
+            chosen = np.where(dist_before <= dist_after, before_clipped, exact_or_after)
+            chosen = np.where(has_before | has_after, chosen, -1)
+        else:
+            raise ValueError(f"Unknown direction '{direction}'")
+
+        found = chosen >= 0
+        mapped = np.full(len(chosen), -1, dtype=np.int64)
+        mapped[found] = self.positions[chosen[found]]
+        result[valid] = mapped
+        return result
+
+
+def attach_nearest(
+    left: pd.DataFrame,
+    right: pd.DataFrame,
+    by: list[str],
+    on: str,
+    value_cols: list[str],
+    direction: str = "nearest",
+    index: SortedGroupIndex | None = None,
+) -> pd.DataFrame:
+    # Copies `value_cols` from the nearest `right` row of the same group onto `left`
+    if index is None:
+        index = SortedGroupIndex(right, by, on)
+    positions = index.lookup(left, direction)
+    found = positions >= 0
+
+    left = left.copy()
+    for col in value_cols:
+        source = right[col].to_numpy()
+        values = np.full(
+            len(left), np.nan, dtype=np.result_type(source.dtype, np.float64)
+        )
+        values[found] = source[positions[found]]
+        left[col] = values
+    return left
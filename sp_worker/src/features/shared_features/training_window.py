@@ -0,0 +1,127 @@
+import pandas as pd
+import numpy as np
+from typing import Optional
+import logging
+
+from config.settings import (
+    TRAINING_WINDOW_FULL_RESOLUTION_DAYS,
+    TRAINING_WINDOW_HALF_LIFE_DAYS,
+    TRAINING_WINDOW_MIN_WEIGHT,
+    TRAINING_WINDOW_MAX_ROWS,
+    TRAINING_WINDOW_SEED,
+)
+
+logger = logging.getLogger(__name__)
+
+SCRAPE_COL = "scraping_id"
+SAMPLE_WEIGHT_COL = "sample_weight"
+
+
+def _decay_weights(age_days: np.ndarray) -> np.ndarray:
+    excess = np.maximum(age_days - TRAINING_WINDOW_FULL_RESOLUTION_DAYS, 0.0)
+    weights = 0.5 ** (excess / TRAINING_WINDOW_HALF_LIFE_DAYS)
+    return np.maximum(weights, TRAINING_WINDOW_MIN_WEIGHT)
+
+
+def _stratified_keep(
+    strata: np.ndarray, limit: int, rng: np.random.Generator
+) -> np.ndarray:
+    # Keeps ceil(fraction * size) random rows of every stratum, then trims the
+    # rounding overshoot at random so at most `limit` rows remain
+    fraction = limit / len(strata)
+    if fraction >= 1.0:
+        return np.ones(len(strata), dtype=bool)
+
+    order = np.lexsort((rng.random(len(strata)), strata))
+    sorted_strata = strata[order]
+    starts = np.r_[0, np.flatnonzero(sorted_strata[1:] != sorted_strata[:-1]) + 1]
+    sizes = np.diff(np.r_[starts, len(strata)])
+    rank = np.arange(len(strata)) - np.repeat(starts, sizes)
+    quota = np.repeat(np.ceil(sizes * fraction), sizes)
+
+    keep = np.zeros(len(strata), dtype=bool)
+    keep[order] = rank < quota
+    excess = int(keep.sum()) - limit
+    if excess > 0:
+        keep[rng.choice(np.flatnonzero(keep), excess, replace=False)] = False
+    return keep
+
+
+def select_training_window(
+    dict_df_client: dict[str, pd.DataFrame],
+    max_rows: Optional[int] = None,
+    seed: int = TRAINING_WINDOW_SEED,
+) -> dict[str, pd.DataFrame]:
+    # Recent scrapes at full resolution, older ones stratified-subsampled to fit
+    # the row cap; every kept row gets its age-decayed SAMPLE_WEIGHT_COL
+    max_rows = max_rows or TRAINING_WINDOW_MAX_ROWS
+    frames = {ota: df for ota, df in dict_df_client.items() if not df.empty}
+    if not frames:
+        return dict_df_client
+
+    latest = max(df[SCRAPE_COL].max() for df in frames.values())
+    ages, strata, lengths = [], [], []
+    for i, df in enumerate(frames.values()):
+        age_days = (latest - df[SCRAPE_COL]) / pd.Timedelta(days=1)
+        age_days = age_days.to_numpy(dtype=np.float64)
+        ages.append(age_days)
+        strata.append(i * 100_000 + (age_days // 7).astype(np.int64))
+        lengths.append(len(df))
+    age_days = np.concatenate(ages)
+    strata = np.concatenate(strata)
+
+    recent = age_days <= TRAINING_WINDOW_FULL_RESOLUTION_DAYS
+    n_recent, n_old = int(recent.sum()), int((~recent).sum())
+    rng = np.random.default_rng(seed)
+
+    keep = np.zeros(len(age_days), dtype=bool)
+    if n_recent >= max_rows:
+        keep[recent] = _stratified_keep(strata[recent], max_rows, rng)
+    else:
+        keep[recent] = True
+        if n_old:
+            keep[~recent] = _stratified_keep(strata[~recent], max_rows - n_recent, rng)
+    weights = _decay_weights(age_days)
+
+    selected = dict(dict_df_client)
+    offsets = np.cumsum([0] + lengths)
+    for (ota, df), start, stop in zip(frames.items(), offsets[:-1], offsets[1:]):
+        mask = keep[start:stop]
+        df = df[mask].copy()
+        df[SAMPLE_WEIGHT_COL] = weights[start:stop][mask]
+        selected[ota] = df
+
+    logger.info(
+        f"Training window: {int(keep.sum())}/{len(keep)} client rows "
+        f"({n_recent} recent, {int(keep[~recent].sum())}/{n_old} older kept)"
+    )
+    return selected
+
+
+def carry_sample_weight(X: pd.DataFrame, df_client: pd.DataFrame) -> pd.DataFrame:
+    # Brings the window weights of df_client onto the feature rows (by index) when
+    # feature building left the column out
+    if SAMPLE_WEIGHT_COL not in df_client.columns or SAMPLE_WEIGHT_COL in X.columns:
+        return X
+    weights = df_client[SAMPLE_WEIGHT_COL].reindex(X.index)
+    n_missing = int(weights.isna().sum())
+    if n_missing:
+        logger.warning(f"No window weight for {n_missing}/{len(X)} feature rows")
+    X[SAMPLE_WEIGHT_COL] = weights
+    return X
+
+
+def pop_sample_weight(
+    X: pd.DataFrame, required: bool = False
+) -> tuple[pd.DataFrame, Optional[np.ndarray]]:
+    # Weights carried through feature processing, removed from the model inputs.
+    # required: the rows come from select_training_window, so they must be weighted
+    if SAMPLE_WEIGHT_COL not in X.columns:
+        if required:
+            raise RuntimeError(
+                f"[FATAL] '{SAMPLE_WEIGHT_COL}' missing from the training features "
+                "of a weighted training window"
+            )
+        return X, None
+    weights = X[SAMPLE_WEIGHT_COL].fillna(1.0).to_numpy(dtype=np.float64)
+    return X.drop(columns=SAMPLE_WEIGHT_COL), weights
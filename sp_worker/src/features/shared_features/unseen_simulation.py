@@ -1,31 +1,63 @@
 import pandas as pd
 import numpy as np
 import logging
+from typing import Optional
 
 from config.paths import MANUAL_CHANNEL_CATEGORY_PATH
+from .augmentation import (
+    augment_unseen_category,
+    get_augmentation_budget,
+    get_augmentation_seed,
+)
 
 logger = logging.getLogger(__name__)
 
+ROOM_COL = "name"
+CHANNEL_COL = "channel"
 
-def channel_category_handler(df_client: pd.DataFrame, property_id: int) -> pd.DataFrame:
-
-    ### --- OMITTED --- ###
+# Labels seen by the model for rooms/channels absent from training,
+# shared by the simulators and the *_pred_manager functions
+UNSEEN_ROOM_LABEL = "unseen_room"
+UNSEEN_CHANNEL_LABEL = "unseen_channel"
 
-    return df_client
+# Sampling streams of the simulators, so their synthetic rows are drawn independently
+ROOM_SIMULATOR_STREAM = 0
+CHANNEL_SIMULATOR_STREAM = 1
 
 
-def unknown_room_simulator(df: pd.DataFrame) -> pd.DataFrame:
+def channel_category_handler(df_client: pd.DataFrame, property_id: int) -> pd.DataFrame:
 
     ### --- OMITTED --- ###
 
-    return df
-
-
-def unknown_channel_simulator(df: pd.DataFrame) -> pd.DataFrame:
+    return df_client
 
-    ### --- OMITTED --- ###
 
-    return df
+def unknown_room_simulator(
+    df: pd.DataFrame, property_id: Optional[int] = None
+) -> pd.DataFrame:
+    sample_ratio, max_rows = get_augmentation_budget(property_id)
+    return augment_unseen_category(
+        df,
+        ROOM_COL,
+        UNSEEN_ROOM_LABEL,
+        sample_ratio,
+        max_rows,
+        seed=get_augmentation_seed(property_id, ROOM_SIMULATOR_STREAM),
+    )
+
+
+def unknown_channel_simulator(
+    df: pd.DataFrame, property_id: Optional[int] = None
+) -> pd.DataFrame:
+    sample_ratio, max_rows = get_augmentation_budget(property_id)
+    return augment_unseen_category(
+        df,
+        CHANNEL_COL,
+        UNSEEN_CHANNEL_LABEL,
+        sample_ratio,
+        max_rows,
+        seed=get_augmentation_seed(property_id, CHANNEL_SIMULATOR_STREAM),
+    )
 
 
 def unseen_rooms_pred_manager(
@@ -5,18 +5,23 @@ import pytz
 import logging
 
 from config.settings import DEFAULT_TIMEZONE
+from utils.profiling import profiled
 from .basic import basic_feature_engineering, categorical_handler
 from ..shared_features import (
     add_events_features,
     add_temp_features,
     unseen_rooms_pred_manager,
     unseen_channels_pred_manager,
+    attach_nearest,
 )
-from utils.data_reader import load_ai_prices, file_search_timestamp
+from .type_b_cache import get_type_B_prediction_index
 
 
 tz = pytz.timezone(DEFAULT_TIMEZONE)
 
+CLOSE_DATA_GROUP_COLS = ["name", "channel"]
+CLOSE_DATA_KEYS = CLOSE_DATA_GROUP_COLS + ["lead_hours"]
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,18 +29,40 @@ def add_predicted_type_B_prices(
     prediction_data: pd.DataFrame, property_id: int, now: pd.Timestamp
 ) -> pd.DataFrame:
 
+    type_B_index = get_type_B_prediction_index(property_id, now)
+    if type_B_index is None:
+        raise RuntimeError(
+            f"[FATAL] No type B AI prices available for property_id={property_id} at {now}."
+        )
+    prediction_data["predicted_price_B"] = type_B_index.lookup(
+        prediction_data["checkIn"], prediction_data["name"], prediction_data["channel"]
+    )
+
     ### --- OMITTED --- ###
 
     return prediction_data
 
 
-def _get_close_lead_hours_data(prediction_data, price_stats):
+def _get_close_lead_hours_data(
+    prediction_data: pd.DataFrame, price_stats: pd.DataFrame
+) -> pd.DataFrame:
+    # Nearest observed lead_hours per (room, channel) via sorted search
+    stats_cols = [c for c in price_stats.columns if c not in CLOSE_DATA_KEYS]
+    prediction_data = attach_nearest(
+        prediction_data,
+        price_stats,
+        by=CLOSE_DATA_GROUP_COLS,
+        on="lead_hours",
+        value_cols=stats_cols,
+        direction="nearest",
+    )
 
     ### --- OMITTED --- ###
 
     return prediction_data
 
 
+@profiled("feature_processing_pred")
 def feature_processing_pred(
     dict_df_client_A: dict[str, pd.DataFrame],
     dict_df_comp_A: dict[str, pd.DataFrame],
@@ -44,6 +71,10 @@ def feature_processing_pred(
     property_id: int,
 ) -> pd.DataFrame:
 
+    # Prediction grid and its features up to prediction_data; categorical_handler
+    # is only called below
     ### --- OMITTED --- ###
 
+    prediction_data = categorical_handler(prediction_data, property_id)
+
     return prediction_data
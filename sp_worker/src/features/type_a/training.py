@@ -1,12 +1,15 @@
 import pandas as pd
 import numpy as np
+from typing import Optional
 
 from utils.data_manip import df_merger
 from utils.data_reader import load_processed_data_subfolder
+from utils.profiling import profiled
 from .basic import basic_feature_engineering, categorical_handler
 from ..shared_features import (
     add_events_features,
     add_temp_features,
+    carry_sample_weight,
     channel_category_handler,
     unknown_channel_simulator,
     unknown_room_simulator,
@@ -20,12 +23,37 @@ def _type_B_processor_for_type_A(property_id: int) -> pd.DataFrame:
     return df_client_B
 
 
+@profiled("feature_processing_train")
 def feature_processing_train(
     dict_df_client_A: dict[str, pd.DataFrame],
     dict_df_comp_A: dict[str, pd.DataFrame],
     property_id: int,
+    augment: bool = True,
+    fit_categories: bool = True,
+    scraped_after: Optional[pd.Timestamp] = None,
 ) -> tuple[pd.DataFrame, pd.Series]:
+    # augment=False, fit_categories=False is the transform-only path used to
+    # score or update an existing model: no synthetic rows, read-only
+    # categorical dictionary. scraped_after keeps the rows of newer scrapes
+    # only, after history-based features are computed over the whole window.
 
+    # Client / comp features and channel categories up to df_client; the
+    # simulators and categorical_handler are only called below
     ### --- OMITTED --- ###
 
+    if scraped_after is not None:
+        df_client = df_client[df_client["scraping_id"] > scraped_after]
+
+    if augment:
+        # Unseen room/channel rows, budgeted and seeded per property
+        df_client = unknown_room_simulator(df_client, property_id)
+        df_client = unknown_channel_simulator(df_client, property_id)
+
+    # Events / temporal features and the X, y split of df_client
+    ### --- OMITTED --- ###
+
+    # Training window weights stay on X until the model pops them
+    X = carry_sample_weight(X, df_client)
+    X = categorical_handler(X, property_id, fit=fit_categories)
+
     return X, y
@@ -0,0 +1,127 @@
+import os
+import pandas as pd
+import numpy as np
+from typing import Optional
+import logging
+
+from utils.data_reader import (
+    file_search_timestamp,
+    find_ai_prices_file,
+    load_ai_prices_index,
+)
+from utils.data_saver import save_ai_prices_index
+
+logger = logging.getLogger(__name__)
+
+
+def _to_ns(values) -> np.ndarray:
+    return pd.DatetimeIndex(values).as_unit("ns").asi8
+
+
+def _keys(names, channels) -> pd.MultiIndex:
+    # Stored as strings, so the index file needs no pickling
+    return pd.MultiIndex.from_arrays(
+        [np.asarray(names).astype(str), np.asarray(channels).astype(str)]
+    )
+
+
+class TypeBPredictionIndex:
+    # Latest type B predictions pivoted to a (checkIn x (name, channel)) array
+
+    def __init__(
+        self,
+        checkins: np.ndarray,
+        names: np.ndarray,
+        channels: np.ndarray,
+        prices: np.ndarray,
+    ):
+        self.checkins = checkins
+        self.keys = _keys(names, channels)
+        self.prices = prices
+
+    @classmethod
+    def from_predictions(cls, df_pred_B: pd.DataFrame) -> "TypeBPredictionIndex":
+        pivot = df_pred_B.pivot_table(
+            index="checkIn",
+            columns=["name", "channel"],
+            values="predicted_price",
+            aggfunc="last",
+        ).sort_index()
+        return cls(
+            _to_ns(pivot.index),
+            pivot.columns.get_level_values("name"),
+            pivot.columns.get_level_values("channel"),
+            pivot.to_numpy(dtype=np.float64),
+        )
+
+    @classmethod
+    def from_arrays(cls, arrays: dict[str, np.ndarray]) -> "TypeBPredictionIndex":
+        return cls(
+            arrays["checkins"], arrays["names"], arrays["channels"], arrays["prices"]
+        )
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        return {
+            "checkins": self.checkins,
+            "names": self.keys.get_level_values(0).to_numpy(dtype=str),
+            "channels": self.keys.get_level_values(1).to_numpy(dtype=str),
+            "prices": self.prices,
+        }
+
+    def lookup(
+        self, checkins: pd.Series, names: pd.Series, channels: pd.Series
+    ) -> np.ndarray:
+        # Row/column positions via sorted search and hash lookup, NaN when absent
+        query = _to_ns(checkins)
+        result = np.full(len(query), np.nan)
+        if len(self.checkins) == 0:
+            return result
+
+        rows = np.searchsorted(self.checkins, query)
+        rows_clipped = np.minimum(rows, len(self.checkins) - 1)
+        row_found = (rows < len(self.checkins)) & (self.checkins[rows_clipped] == query)
+
+        cols = self.keys.get_indexer(_keys(names, channels))
+        found = row_found & (cols >= 0)
+        result[found] = self.prices[rows_clipped[found], cols[found]]
+        return result
+
+
+_TYPE_B_INDEX_CACHE: dict[str, tuple[float, TypeBPredictionIndex]] = {}
+
+
+def get_type_B_prediction_index(
+    property_id: int, now: pd.Timestamp, model: str = "baseline"
+) -> Optional[TypeBPredictionIndex]:
+    # The index is compiled once per daily type B snapshot and stored next to
+    # it, so each hourly type A task loads a few arrays instead of pivoting the
+    # feather, whichever process it runs in. Within a process it is kept in
+    # memory and read again only when the snapshot's mtime changes.
+    source = find_ai_prices_file(
+        file_search_timestamp(now, "B"), model, property_id, "B"
+    )
+    if source is None:
+        return None
+
+    mtime = os.path.getmtime(source)
+    cached = _TYPE_B_INDEX_CACHE.get(str(source))
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    arrays = load_ai_prices_index(source)
+    if arrays is not None:
+        index = TypeBPredictionIndex.from_arrays(arrays)
+        _TYPE_B_INDEX_CACHE[str(source)] = (mtime, index)
+        return index
+
+    try:
+        df_pred_B = pd.read_feather(source)
+    except Exception as e:
+        logger.error(f"Failed to read AI prices from {source}: {e}")
+        return None
+
+    index = TypeBPredictionIndex.from_predictions(df_pred_B)
+    save_ai_prices_index(index.to_arrays(), source)
+    _TYPE_B_INDEX_CACHE[str(source)] = (mtime, index)
+    logger.info(f"Compiled type B predictions index for property {property_id}")
+    return index
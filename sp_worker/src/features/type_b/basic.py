@@ -1,8 +1,18 @@
 import pandas as pd
 import numpy as np
+from typing import Optional
 
+from config.settings import CATEGORICAL_STORE_ENABLED
 from utils.data_manip import df_merger
-from ..shared_features import lead_time_changer, CATEGORICAL_COLS_B
+from ..engine import get_feature_engine
+from ..shared_features import (
+    lead_time_changer,
+    CATEGORICAL_COLS_B,
+    categorical_store_handler,
+)
+
+# Comp price stats are computed per room, channel and days after
+PRICE_STATS_KEYS = ["name", "channel", "days_after"]
 
 
 def client_processor(dict_df_client_B: dict[str, pd.DataFrame]) -> pd.DataFrame:
@@ -26,10 +36,26 @@ def basic_feature_engineering(
 
     ### --- OMITTED --- ###
 
+    # Comp price stats on the configured FEATURE_ENGINE
+    engine = get_feature_engine()
+    price_stats = engine.price_stats(
+        engine.from_frames({"comp": df_comp}, PRICE_STATS_KEYS + ["price_display"]),
+        PRICE_STATS_KEYS,
+    )
+
     return df_client, price_stats
 
 
-def categorical_handler(X: pd.DataFrame) -> pd.DataFrame:
-    for col in CATEGORICAL_COLS_B:
-        X[col] = X[col].astype("category")
-    return X
+def categorical_handler(
+    X: pd.DataFrame, property_id: Optional[int] = None, fit: bool = False
+) -> pd.DataFrame:
+    # Plain pandas categoricals as before, unless CATEGORICAL_STORE is on: then
+    # codes from the property's persisted dictionary (fit=True at training
+    # extends and saves it)
+    if property_id is None or not CATEGORICAL_STORE_ENABLED:
+        for col in CATEGORICAL_COLS_B:
+            X[col] = X[col].astype("category")
+        return X
+    return categorical_store_handler(
+        X, CATEGORICAL_COLS_B, property_id, scrap_type="B", fit=fit
+    )
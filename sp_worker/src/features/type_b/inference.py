@@ -3,6 +3,7 @@ from itertools import product
 import pytz
 
 from config.settings import DEFAULT_TIMEZONE
+from utils.profiling import profiled
 
 from .basic import basic_feature_engineering, categorical_handler
 from ..shared_features import (
@@ -10,20 +11,37 @@ from ..shared_features import (
     add_temp_features,
     unseen_rooms_pred_manager,
     unseen_channels_pred_manager,
+    attach_nearest,
     lead_time_changer,
 )
 
 
 tz = pytz.timezone(DEFAULT_TIMEZONE)
 
+CLOSE_DATA_GROUP_COLS = ["name", "channel"]
+CLOSE_DATA_KEYS = CLOSE_DATA_GROUP_COLS + ["days_after"]
 
-def _get_close_days_after_data(prediction_data, price_stats):
+
+def _get_close_days_after_data(
+    prediction_data: pd.DataFrame, price_stats: pd.DataFrame
+) -> pd.DataFrame:
+    # Nearest observed days_after per (room, channel) via sorted search
+    stats_cols = [c for c in price_stats.columns if c not in CLOSE_DATA_KEYS]
+    prediction_data = attach_nearest(
+        prediction_data,
+        price_stats,
+        by=CLOSE_DATA_GROUP_COLS,
+        on="days_after",
+        value_cols=stats_cols,
+        direction="nearest",
+    )
 
     ### --- OMITTED --- ###
 
     return prediction_data
 
 
+@profiled("feature_processing_pred")
 def feature_processing_pred(
     dict_df_client_B: dict[str, pd.DataFrame],
     dict_df_comp_B: dict[str, pd.DataFrame],
@@ -32,6 +50,10 @@ def feature_processing_pred(
     property_id: int,
 ) -> pd.DataFrame:
 
+    # Prediction grid and its features up to prediction_data; categorical_handler
+    # is only called below
     ### --- OMITTED --- ###
 
+    prediction_data = categorical_handler(prediction_data, property_id)
+
     return prediction_data
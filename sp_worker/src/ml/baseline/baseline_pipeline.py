@@ -1,5 +1,10 @@
+import os
 import pandas as pd
+import numpy as np
 import logging
+from typing import Optional
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.util import Finalize
 
 from sp_worker.src.data_ingestion.database_loader_2 import (
     fetch_all_existing_roomtypes,
@@ -7,14 +12,49 @@ from sp_worker.src.data_ingestion.database_loader_2 import (
 )
 from data_ingestion.hotel_class import HotelProperty
 
-from .type_b import baseline_model_B_train, baseline_model_B_predict
-from .type_a import baseline_model_A_train, baseline_model_A_predict
+from .type_b import (
+    baseline_model_B_train,
+    baseline_model_B_prepare,
+    baseline_model_B_finalize,
+)
+from .type_a import (
+    baseline_model_A_train,
+    baseline_model_A_prepare,
+    baseline_model_A_finalize,
+    baseline_model_A_update,
+)
+from .mlflow_logger import flush_mlflow_logs, log_stage_metrics
+from .drift_monitor import drift_gated_train
+from .params import get_hyperparameters
+from .model_registry import (
+    compute_data_fingerprint,
+    compute_prediction_fingerprint,
+    is_prediction_current,
+    load_registered_model,
+    register_model,
+    register_prediction,
+)
 
 from utils.data_reader import load_processed_data_subfolder, load_properties
-from utils.data_saver import save_ai_prices
+from utils.data_saver import append_profile_record, save_ai_prices
+from utils.profiling import (
+    StageProfile,
+    activate_profile,
+    new_profile,
+    profile_stage,
+)
 from config.paths import (
     MANUAL_CHANNEL_CATEGORY_PATH,
     MANUAL_CHANNEL_ROOMTYPE_MAPPING_PATH,
+    PROCESSED_DATA_PATH,
+)
+from config.settings import (
+    DEFAULT_TIMEZONE,
+    BASELINE_N_WORKERS,
+    DRIFT_MONITOR_ENABLED,
+    INCREMENTAL_TRAINING_A_ENABLED,
+    MODEL_REGISTRY_ENABLED,
+    PROFILING_MLFLOW,
 )
 
 logger = logging.getLogger(__name__)
@@ -41,19 +81,31 @@ def get_prop_id_ims_channel_room_types(
     return prop_id_roomtype_mapping, property_id_channel_cat
 
 
-def baseline_model_updater(scrap_type: str) -> None:
-
-    properties: list[HotelProperty] = load_properties()
-    property_ids = [p.property_id for p in properties]
-
-    df_roomtype_mapping, ims_channels_cat_prop_id = ims_channel_room_types_processor(
-        property_ids
-    )
+def _prepare_property_inference(
+    property_id: int,
+    scrap_type: str,
+    prop_id_roomtype_mapping: pd.DataFrame,
+    property_id_channel_cat: pd.DataFrame,
+    now: pd.Timestamp,
+) -> Optional[tuple]:
+    # Model and prediction inputs for a property, None when its saved ai_prices
+    # are still current
 
-    for property in properties:
-        property_id = property.property_id
-        is_using_IMS = property.is_using_IMS
+    prediction_fingerprint = None
+    if MODEL_REGISTRY_ENABLED:
+        data_fingerprint = compute_data_fingerprint(
+            property_id, scrap_type, get_hyperparameters(property_id, scrap_type)
+        )
+        prediction_fingerprint = compute_prediction_fingerprint(
+            data_fingerprint, prop_id_roomtype_mapping, property_id_channel_cat
+        )
+        if is_prediction_current(property_id, scrap_type, prediction_fingerprint, now):
+            logger.info(
+                f"Inputs unchanged for property {property_id}, keeping saved ai_prices"
+            )
+            return None
 
+    with profile_stage("load_data"):
         dict_df_client: dict[str, pd.DataFrame] = load_processed_data_subfolder(
             property_id=property_id, scrap_type=scrap_type, subfolder="client_data"
         )
@@ -61,27 +113,60 @@ def baseline_model_updater(scrap_type: str) -> None:
             property_id=property_id, scrap_type=scrap_type, subfolder="comp_data"
         )
 
-        prop_id_roomtype_mapping, property_id_channel_cat = (
-            get_prop_id_ims_channel_room_types(
-                df_roomtype_mapping, ims_channels_cat_prop_id, property_id, is_using_IMS
-            )
-        )
+    model = None
+    if MODEL_REGISTRY_ENABLED:
+        model = load_registered_model(property_id, scrap_type, data_fingerprint)
 
-        if scrap_type == "B":
-            model = baseline_model_B_train(dict_df_client, dict_df_comp, property_id)
-            df_pred: pd.DataFrame = baseline_model_B_predict(
-                model,
+    if scrap_type == "B":
+        if model is None:
+            with profile_stage("train"):
+                if DRIFT_MONITOR_ENABLED:
+                    model = drift_gated_train(
+                        baseline_model_B_train,
+                        dict_df_client,
+                        dict_df_comp,
+                        property_id,
+                        scrap_type,
+                        now,
+                    )
+                else:
+                    model = baseline_model_B_train(
+                        dict_df_client, dict_df_comp, property_id
+                    )
+                if MODEL_REGISTRY_ENABLED:
+                    register_model(model, property_id, scrap_type, data_fingerprint)
+        with profile_stage("grid"):
+            prediction_data, X = baseline_model_B_prepare(
                 dict_df_client,
                 dict_df_comp,
                 prop_id_roomtype_mapping,
                 property_id_channel_cat,
                 property_id,
-                extrapolate=True,
             )
-        else:
-            model = baseline_model_A_train(dict_df_client, dict_df_comp, property_id)
-            df_pred: pd.DataFrame = baseline_model_A_predict(
-                model,
+    else:
+        if model is None:
+            with profile_stage("train"):
+                if INCREMENTAL_TRAINING_A_ENABLED:
+                    model = baseline_model_A_update(
+                        dict_df_client, dict_df_comp, property_id
+                    )
+                elif DRIFT_MONITOR_ENABLED:
+                    model = drift_gated_train(
+                        baseline_model_A_train,
+                        dict_df_client,
+                        dict_df_comp,
+                        property_id,
+                        scrap_type,
+                        now,
+                    )
+                else:
+                    model = baseline_model_A_train(
+                        dict_df_client, dict_df_comp, property_id
+                    )
+                if MODEL_REGISTRY_ENABLED:
+                    register_model(model, property_id, scrap_type, data_fingerprint)
+        with profile_stage("grid"):
+            prediction_data, X = baseline_model_A_prepare(
                 dict_df_client,
                 dict_df_comp,
                 prop_id_roomtype_mapping,
@@ -89,10 +174,184 @@ def baseline_model_updater(scrap_type: str) -> None:
                 property_id,
             )
 
-        # SAVE THE DATA
+    return model, prediction_data, X, prediction_fingerprint
+
+
+def _finalize_property_prediction(
+    property_id: int,
+    scrap_type: str,
+    prediction_data: pd.DataFrame,
+    predictions: np.ndarray,
+    prediction_fingerprint: Optional[str],
+    now: pd.Timestamp,
+) -> None:
+
+    with profile_stage("finalize"):
+        if scrap_type == "B":
+            df_pred: pd.DataFrame = baseline_model_B_finalize(
+                prediction_data, predictions, extrapolate=True
+            )
+        else:
+            df_pred: pd.DataFrame = baseline_model_A_finalize(
+                prediction_data, predictions
+            )
+
+    # SAVE THE DATA
+    with profile_stage("save"):
         save_ai_prices(
             df_pred=df_pred,
             model="baseline",
             property_id=property_id,
             scrap_type=scrap_type,
         )
+    if MODEL_REGISTRY_ENABLED:
+        register_prediction(property_id, scrap_type, prediction_fingerprint, now)
+
+
+def _update_property_model(
+    property_id: int,
+    scrap_type: str,
+    prop_id_roomtype_mapping: pd.DataFrame,
+    property_id_channel_cat: pd.DataFrame,
+) -> None:
+
+    now = pd.Timestamp.now(tz=DEFAULT_TIMEZONE)
+    profile = new_profile(property_id, scrap_type)
+    with activate_profile(profile):
+        prepared = _prepare_property_inference(
+            property_id,
+            scrap_type,
+            prop_id_roomtype_mapping,
+            property_id_channel_cat,
+            now,
+        )
+        if prepared is not None:
+            model, prediction_data, X, prediction_fingerprint = prepared
+            with profile_stage("predict"):
+                predictions = model.predict(X)
+            _finalize_property_prediction(
+                property_id,
+                scrap_type,
+                prediction_data,
+                predictions,
+                prediction_fingerprint,
+                now,
+            )
+    _emit_profile(profile)
+
+
+def _emit_profile(profile: Optional[StageProfile]) -> None:
+    if profile is None:
+        return
+    record = profile.record()
+    append_profile_record(record, profile.property_id, profile.scrap_type)
+    if PROFILING_MLFLOW:
+        log_stage_metrics(record)
+    logger.info(
+        f"Profile property {profile.property_id} type {profile.scrap_type}: "
+        f"{record['total_seconds']:.2f}s "
+        + ", ".join(f"{k} {v['seconds']:.2f}s" for k, v in record["stages"].items())
+    )
+
+
+# ----------------------------------- parallel execution -----------------------------------
+
+
+def _processed_data_size(property_id: int, scrap_type: str) -> int:
+    # Size on disk of the processed feathers, used as a proxy for training cost
+    folder = PROCESSED_DATA_PATH / f"property_id_{property_id}" / scrap_type
+    if not folder.exists():
+        return 0
+    return sum(f.stat().st_size for f in folder.rglob("*.feather"))
+
+
+def _init_worker(num_threads: int) -> None:
+    os.environ["LGBM_NUM_THREADS"] = str(num_threads)
+    os.environ["OMP_NUM_THREADS"] = str(num_threads)
+    # Pool workers exit without running atexit hooks: drain queued MLflow runs
+    Finalize(None, flush_mlflow_logs, exitpriority=10)
+
+
+def _run_property_jobs_parallel(
+    jobs: list[tuple[int, pd.DataFrame, pd.DataFrame]],
+    scrap_type: str,
+    n_workers: int,
+) -> dict[int, str]:
+    # Largest properties first so the longest fits start early
+    jobs = sorted(
+        jobs, key=lambda job: _processed_data_size(job[0], scrap_type), reverse=True
+    )
+    num_threads = max(1, (os.cpu_count() or 1) // n_workers)
+    logger.info(
+        f"Training {len(jobs)} properties on {n_workers} workers "
+        f"with {num_threads} LightGBM threads each"
+    )
+
+    failures: dict[int, str] = {}
+    with ProcessPoolExecutor(
+        max_workers=n_workers, initializer=_init_worker, initargs=(num_threads,)
+    ) as executor:
+        futures = {
+            executor.submit(
+                _update_property_model,
+                property_id,
+                scrap_type,
+                prop_id_roomtype_mapping,
+                property_id_channel_cat,
+            ): property_id
+            for property_id, prop_id_roomtype_mapping, property_id_channel_cat in jobs
+        }
+        for future in as_completed(futures):
+            property_id = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                logger.exception(f"Baseline update failed for property {property_id}")
+                failures[property_id] = f"{type(e).__name__}: {e}"
+
+    return failures
+
+
+def baseline_model_updater(scrap_type: str, n_workers: Optional[int] = None) -> None:
+
+    n_workers = n_workers or BASELINE_N_WORKERS
+
+    properties: list[HotelProperty] = load_properties()
+    property_ids = [p.property_id for p in properties]
+
+    df_roomtype_mapping, ims_channels_cat_prop_id = ims_channel_room_types_processor(
+        property_ids
+    )
+
+    jobs: list[tuple[int, pd.DataFrame, pd.DataFrame]] = []
+    for property in properties:
+        property_id = property.property_id
+        is_using_IMS = property.is_using_IMS
+
+        prop_id_roomtype_mapping, property_id_channel_cat = (
+            get_prop_id_ims_channel_room_types(
+                df_roomtype_mapping, ims_channels_cat_prop_id, property_id, is_using_IMS
+            )
+        )
+        jobs.append((property_id, prop_id_roomtype_mapping, property_id_channel_cat))
+
+    try:
+        if n_workers <= 1:
+            for property_id, prop_id_roomtype_mapping, property_id_channel_cat in jobs:
+                _update_property_model(
+                    property_id,
+                    scrap_type,
+                    prop_id_roomtype_mapping,
+                    property_id_channel_cat,
+                )
+            return
+
+        failures = _run_property_jobs_parallel(jobs, scrap_type, n_workers)
+        if failures:
+            raise RuntimeError(
+                f"Baseline update failed for {len(failures)}/{len(jobs)} properties: "
+                f"{failures}"
+            )
+    finally:
+        # Tracking writes run in the background during training; wait for them here
+        flush_mlflow_logs()
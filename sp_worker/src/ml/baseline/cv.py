@@ -0,0 +1,74 @@
+import os
+import pandas as pd
+import numpy as np
+import lightgbm as lgb
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+import logging
+
+from .params import split_num_boost_round
+
+logger = logging.getLogger(__name__)
+
+
+def build_shared_dataset(
+    X: pd.DataFrame,
+    y: pd.Series,
+    categorical_feature: list[str],
+    params: dict,
+    weight: Optional[np.ndarray] = None,
+) -> lgb.Dataset:
+    # Binned once; callers subset it (weights included) to reuse the same bin
+    # mappers across models trained on the same rows
+    dataset = lgb.Dataset(
+        X,
+        y,
+        weight=weight,
+        categorical_feature=categorical_feature,
+        params=params,
+        free_raw_data=False,
+    )
+    return dataset.construct()
+
+
+def _total_threads(params: dict) -> int:
+    return int(params.get("num_threads", 0)) or (os.cpu_count() or 1)
+
+
+def fit_cv_folds(
+    X: pd.DataFrame,
+    y: pd.Series,
+    folds: list[tuple[np.ndarray, np.ndarray]],
+    hyperparameters: dict,
+    categorical_feature: list[str],
+    n_jobs: Optional[int] = None,
+    weight: Optional[np.ndarray] = None,
+) -> list[lgb.Booster]:
+    # Fits one booster per (train_idx, val_idx) fold concurrently on subsets of
+    # one Dataset binned once over X, so the folds share its bin mappers instead
+    # of re-binning their training slices. Boosters come back in fold order so
+    # models[best_model_index] selects as the serial loop. The thread budget
+    # (num_threads, else all cores) is split between the folds.
+    params, num_boost_round = split_num_boost_round(hyperparameters)
+    total_threads = _total_threads(params)
+    n_jobs = max(1, min(n_jobs or len(folds), len(folds), total_threads))
+    fold_params = {**params, "num_threads": max(1, total_threads // n_jobs)}
+
+    dataset = build_shared_dataset(X, y, categorical_feature, params, weight)
+    # Subsets (labels and weights included) are built before the threads start
+    train_sets = [
+        dataset.subset(np.sort(train_idx), params=fold_params).construct()
+        for train_idx, _ in folds
+    ]
+
+    def fit_fold(train_set: lgb.Dataset) -> lgb.Booster:
+        return lgb.train(fold_params, train_set, num_boost_round=num_boost_round)
+
+    logger.info(
+        f"Fitting {len(folds)} CV folds on {n_jobs} threads "
+        f"({fold_params['num_threads']} LightGBM threads each)"
+    )
+    if n_jobs == 1:
+        return [fit_fold(train_set) for train_set in train_sets]
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        return list(executor.map(fit_fold, train_sets))
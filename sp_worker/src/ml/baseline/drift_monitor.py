@@ -0,0 +1,217 @@
+import pandas as pd
+import numpy as np
+import lightgbm as lgb
+from typing import Callable, Optional
+import logging
+
+from config.settings import DEFAULT_TIMEZONE
+from features.type_a.training import (
+    feature_processing_train as feature_processing_train_A,
+)
+from features.type_b.training import (
+    feature_processing_train as feature_processing_train_B,
+)
+from utils.data_reader import load_booster, load_drift_reference
+from utils.data_saver import append_drift_audit, save_booster, save_drift_reference
+from .params import DRIFT_THRESHOLDS
+from .model_registry import as_booster
+
+logger = logging.getLogger(__name__)
+
+PRICE_COL = "price_display"
+SCRAPE_COL = "scraping_id"
+CATEGORY_COLS = ["name", "channel"]
+N_PRICE_BINS = 10
+SHARE_EPS = 1e-4
+
+# Reference statistics are taken over the client data a model was trained on;
+# every later run compares the scrapes newer than the last check against them.
+
+
+def _client_rows(
+    dict_df_client: dict[str, pd.DataFrame], since: Optional[pd.Timestamp] = None
+) -> dict[str, pd.DataFrame]:
+    if since is None:
+        return {ota: df for ota, df in dict_df_client.items() if not df.empty}
+    recent = {ota: df[df[SCRAPE_COL] > since] for ota, df in dict_df_client.items()}
+    return {ota: df for ota, df in recent.items() if not df.empty}
+
+
+def _bin_shares(prices: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    bins = np.searchsorted(edges, prices, side="right")
+    return np.bincount(bins, minlength=len(edges) + 1) / max(len(prices), 1)
+
+
+def population_stability_index(reference: np.ndarray, current: np.ndarray) -> float:
+    reference = np.maximum(reference, SHARE_EPS)
+    current = np.maximum(current, SHARE_EPS)
+    return float(np.sum((current - reference) * np.log(current / reference)))
+
+
+def summarize_batch(dict_df_client: dict[str, pd.DataFrame]) -> dict:
+    # Decile sketch of prices and room/channel frequencies of a batch
+    df = pd.concat(dict_df_client.values(), ignore_index=True)
+    prices = df[PRICE_COL].dropna().to_numpy(dtype=np.float64)
+    edges = (
+        np.quantile(prices, np.linspace(0, 1, N_PRICE_BINS + 1)[1:-1])
+        if len(prices)
+        else np.array([])
+    )
+    return {
+        "n_rows": len(df),
+        "latest_scrape": df[SCRAPE_COL].max().isoformat(),
+        "price_edges": edges.tolist(),
+        "price_shares": _bin_shares(prices, edges).tolist(),
+        "categories": {
+            col: df[col].astype(str).value_counts(normalize=True).to_dict()
+            for col in CATEGORY_COLS
+            if col in df.columns
+        },
+    }
+
+
+def _category_drift(reference: dict, current: pd.Series) -> tuple[float, float]:
+    # Total variation distance and share of rows whose category is unseen
+    frequencies = current.astype(str).value_counts(normalize=True).to_dict()
+    keys = set(reference) | set(frequencies)
+    tvd = 0.5 * sum(abs(reference.get(k, 0.0) - frequencies.get(k, 0.0)) for k in keys)
+    unseen = sum(share for k, share in frequencies.items() if k not in reference)
+    return float(tvd), float(unseen)
+
+
+def _recent_mae(
+    booster: lgb.Booster,
+    dict_df_client: dict[str, pd.DataFrame],
+    dict_df_comp: dict[str, pd.DataFrame],
+    property_id: int,
+    scrap_type: str,
+    since: pd.Timestamp,
+) -> Optional[float]:
+    # Transform-only features of the scrapes after `since`, computed with their
+    # history: no synthetic rows and no change to the categorical dictionary
+    feature_processing_train = (
+        feature_processing_train_B if scrap_type == "B" else feature_processing_train_A
+    )
+    X_recent, y_recent = feature_processing_train(
+        dict_df_client,
+        dict_df_comp,
+        property_id,
+        augment=False,
+        fit_categories=False,
+        scraped_after=since,
+    )
+    if X_recent.empty:
+        return None
+    return float(np.mean(np.abs(booster.predict(X_recent) - y_recent)))
+
+
+def check_drift(
+    booster: lgb.Booster,
+    dict_df_client: dict[str, pd.DataFrame],
+    dict_df_comp: dict[str, pd.DataFrame],
+    property_id: int,
+    scrap_type: str,
+    now: pd.Timestamp,
+) -> tuple[Optional[str], dict]:
+    # Reason to retrain (None to keep the model) and the statistics behind it
+    reference = load_drift_reference(property_id, scrap_type)
+    if not reference:
+        return "no drift reference", {}
+
+    model_age = (now - pd.Timestamp(reference["trained_at"])) / pd.Timedelta(hours=1)
+    stats: dict = {"model_age_hours": round(model_age, 2)}
+    if model_age >= DRIFT_THRESHOLDS["max_model_age_hours"]:
+        return f"model age {model_age:.0f}h", stats
+
+    since = pd.Timestamp(reference["last_checked_scrape"])
+    dict_df_recent = _client_rows(dict_df_client, since)
+    if not dict_df_recent:
+        return None, {**stats, "n_rows": 0}
+
+    df_recent = pd.concat(dict_df_recent.values(), ignore_index=True)
+    prices = df_recent[PRICE_COL].dropna().to_numpy(dtype=np.float64)
+    stats["n_rows"] = len(df_recent)
+    stats["price_psi"] = population_stability_index(
+        np.asarray(reference["price_shares"]),
+        _bin_shares(prices, np.asarray(reference["price_edges"])),
+    )
+    stats["category_tvd"], stats["unseen_share"] = 0.0, 0.0
+    for col, frequencies in reference["categories"].items():
+        if col in df_recent.columns:
+            tvd, unseen = _category_drift(frequencies, df_recent[col])
+            stats["category_tvd"] = max(stats["category_tvd"], tvd)
+            stats["unseen_share"] = max(stats["unseen_share"], unseen)
+
+    # The first batch after a retrain sets the out-of-sample reference error
+    recent_mae = _recent_mae(
+        booster, dict_df_client, dict_df_comp, property_id, scrap_type, since
+    )
+    stats["residual_ratio"] = 0.0
+    if recent_mae is not None:
+        reference_mae = reference.get("reference_mae") or recent_mae
+        stats["recent_mae"] = recent_mae
+        stats["residual_ratio"] = (
+            recent_mae / reference_mae if reference_mae > 0 else 1.0
+        )
+        reference["reference_mae"] = reference_mae
+
+    reference["last_checked_scrape"] = df_recent[SCRAPE_COL].max().isoformat()
+    save_drift_reference(reference, property_id, scrap_type)
+
+    reasons = [
+        f"{name} {stats[name]:.3f} > {DRIFT_THRESHOLDS[name]}"
+        for name in ["price_psi", "category_tvd", "unseen_share", "residual_ratio"]
+        if stats[name] > DRIFT_THRESHOLDS[name]
+    ]
+    return ("; ".join(reasons) or None), stats
+
+
+def drift_gated_train(
+    train_fn: Callable,
+    dict_df_client: dict[str, pd.DataFrame],
+    dict_df_comp: dict[str, pd.DataFrame],
+    property_id: int,
+    scrap_type: str,
+    now: Optional[pd.Timestamp] = None,
+):
+    # Reuses the stored booster unless check_drift finds a reason to retrain;
+    # every decision is appended to the property's drift_audit.jsonl
+    now = now or pd.Timestamp.now(tz=DEFAULT_TIMEZONE)
+    booster = load_booster(property_id, scrap_type)
+    if booster is None:
+        reason, stats = "no previous model", {}
+    else:
+        reason, stats = check_drift(
+            booster, dict_df_client, dict_df_comp, property_id, scrap_type, now
+        )
+
+    append_drift_audit(
+        {
+            "checked_at": now.isoformat(),
+            "retrain": reason is not None,
+            "reason": reason,
+            **stats,
+        },
+        property_id,
+        scrap_type,
+    )
+    if reason is None:
+        logger.info(
+            f"No drift for type {scrap_type} property {property_id}, reusing model"
+        )
+        return booster
+
+    logger.info(f"Retraining type {scrap_type} property {property_id}: {reason}")
+    model = train_fn(dict_df_client, dict_df_comp, property_id)
+    save_booster(as_booster(model), property_id, scrap_type)
+
+    reference = summarize_batch(_client_rows(dict_df_client))
+    reference.update(
+        {
+            "trained_at": now.isoformat(),
+            "last_checked_scrape": reference["latest_scrape"],
+            "reference_mae": None,
+        }
+    )
+    save_drift_reference(reference, property_id, scrap_type)
+    return model
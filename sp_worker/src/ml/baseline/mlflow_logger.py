@@ -1,26 +1,176 @@
-import mlflow
 import numpy as np
 import datetime
+import time
+import queue
+import atexit
+import threading
+from typing import Optional
+import logging
 
-from config.settings import MLFLOW_TRACKING_URI
+from mlflow.entities import Metric, Param, RunTag
+from mlflow.tracking import MlflowClient
+
+from config.settings import (
+    MLFLOW_TRACKING_URI,
+    MLFLOW_LOCAL_TRACKING_URI,
+    MLFLOW_LOGGING_MODE,
+)
+
+logger = logging.getLogger(__name__)
+
+EXPERIMENT_NAME = "baseline"
+
+
+def _write_runs(tracking_uri: str, records: list[dict]) -> None:
+    # One create_run + log_batch + set_terminated per run, one client per flush
+    client = MlflowClient(tracking_uri=tracking_uri)
+    experiment = client.get_experiment_by_name(EXPERIMENT_NAME)
+    experiment_id = (
+        experiment.experiment_id
+        if experiment is not None
+        else client.create_experiment(EXPERIMENT_NAME)
+    )
+
+    for record in records:
+        run = client.create_run(experiment_id, run_name=record["run_name"])
+        client.log_batch(
+            run.info.run_id,
+            metrics=[
+                Metric(key, value, record["timestamp_ms"], 0)
+                for key, value in record["metrics"].items()
+            ],
+            params=[Param(key, str(value)) for key, value in record["params"].items()],
+            tags=[RunTag(key, value) for key, value in record["tags"].items()],
+        )
+        client.set_terminated(run.info.run_id)
+
+
+class _AsyncRunLogger:
+    # Records are queued by training and written by a single background thread,
+    # which drains everything pending into one batch per flush
+
+    def __init__(self, tracking_uri: str):
+        self.tracking_uri = tracking_uri
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, record: dict) -> None:
+        self._queue.put(record)
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._worker, name="mlflow-logger", daemon=True
+                )
+                self._thread.start()
+
+    def _worker(self) -> None:
+        while True:
+            records = [self._queue.get()]
+            while True:
+                try:
+                    records.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                _write_runs(self.tracking_uri, records)
+            except Exception:
+                logger.exception(f"Failed to log {len(records)} MLflow runs")
+            finally:
+                for _ in records:
+                    self._queue.task_done()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        # Waits for queued runs to be written; False if the timeout expired
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() > deadline:
+                logger.warning(
+                    f"MLflow flush timed out, {self._queue.unfinished_tasks} runs pending"
+                )
+                return False
+            time.sleep(0.05)
+        return True
+
+
+_ASYNC_LOGGERS: dict[str, _AsyncRunLogger] = {}
+
+
+def _get_async_logger(tracking_uri: str) -> _AsyncRunLogger:
+    if tracking_uri not in _ASYNC_LOGGERS:
+        _ASYNC_LOGGERS[tracking_uri] = _AsyncRunLogger(tracking_uri)
+    return _ASYNC_LOGGERS[tracking_uri]
+
+
+def flush_mlflow_logs(timeout: Optional[float] = None) -> None:
+    for async_logger in list(_ASYNC_LOGGERS.values()):
+        async_logger.flush(timeout)
+
+
+atexit.register(flush_mlflow_logs)
+
+
+def _submit_run(record: dict, mode: str) -> None:
+    if mode == "sync":
+        _write_runs(MLFLOW_TRACKING_URI, [record])
+    elif mode == "local":
+        _get_async_logger(MLFLOW_LOCAL_TRACKING_URI).submit(record)
+    elif mode == "async":
+        _get_async_logger(MLFLOW_TRACKING_URI).submit(record)
+    else:
+        raise ValueError(f"Unknown MLflow logging mode '{mode}'")
 
 
 def log_cv_metrics(
-    property_id: int, scrap_type: str, all_scores: dict[str, dict[str, list]]
+    property_id: int,
+    scrap_type: str,
+    all_scores: dict[str, dict[str, list]],
+    mode: Optional[str] = None,
 ):
-    tracking_uri = MLFLOW_TRACKING_URI
-    mlflow.set_tracking_uri(tracking_uri)
+    mode = mode or MLFLOW_LOGGING_MODE
+    if mode == "off":
+        return
 
-    experiment_name = "baseline"
-    mlflow.set_experiment(experiment_name)
+    record = {
+        "run_name": f"property_{property_id}_type_{scrap_type.upper()}",
+        "params": {"property_id": property_id},
+        "tags": {
+            "type": scrap_type.upper(),
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        },
+        "metrics": {
+            f"{split}_{metric}": float(np.mean(values))
+            for split in ["train", "val", "test"]
+            for metric, values in all_scores[split].items()
+        },
+        "timestamp_ms": int(time.time() * 1000),
+    }
+    _submit_run(record, mode)
 
-    with mlflow.start_run(run_name=f"property_{property_id}_type_{scrap_type.upper()}"):
-        mlflow.log_param("property_id", property_id)
-        mlflow.set_tag("type", scrap_type.upper())
-        mlflow.set_tag(
-            "timestamp", datetime.datetime.now().isoformat(timespec="seconds")
-        )
 
-        for split in ["train", "val", "test"]:
-            for metric, values in all_scores[split].items():
-                mlflow.log_metric(f"{split}_{metric}", np.mean(values))
+def log_stage_metrics(profile_record: dict, mode: Optional[str] = None):
+    # Stage timings (and tracemalloc peaks) of one property update as a run
+    mode = mode or MLFLOW_LOGGING_MODE
+    if mode == "off":
+        return
+
+    property_id = profile_record["property_id"]
+    scrap_type = profile_record["scrap_type"].upper()
+    metrics = {"total_seconds": profile_record["total_seconds"]}
+    for name, stage in profile_record["stages"].items():
+        metrics[f"{name}_seconds"] = stage["seconds"]
+        if "peak_mb" in stage:
+            metrics[f"{name}_peak_mb"] = stage["peak_mb"]
+
+    record = {
+        "run_name": f"property_{property_id}_type_{scrap_type}_profile",
+        "params": {"property_id": property_id},
+        "tags": {
+            "type": scrap_type,
+            "kind": "profile",
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        },
+        "metrics": metrics,
+        "timestamp_ms": int(time.time() * 1000),
+    }
+    _submit_run(record, mode)
@@ -0,0 +1,121 @@
+import hashlib
+import json
+import pandas as pd
+import lightgbm as lgb
+from typing import Optional
+import logging
+
+from config.paths import PROCESSED_DATA_PATH
+from config.settings import DEFAULT_TIMEZONE
+from utils.data_reader import (
+    load_booster,
+    load_model_registry,
+    file_search_timestamp,
+)
+from utils.data_saver import (
+    save_booster,
+    save_model_registry,
+)
+
+logger = logging.getLogger(__name__)
+
+# Local registry under DATA_PATH/models/property_id_<id>/<scrap_type>/ holding
+# booster.txt, categories.json and registry.json (fingerprints of the data the
+# booster was trained on and of the inputs of the last saved ai_prices).
+
+
+def as_booster(model) -> lgb.Booster:
+    return getattr(model, "booster_", model)
+
+
+def _hash_frame(digest, df: Optional[pd.DataFrame]) -> None:
+    if df is None or df.empty:
+        digest.update(b"<empty>")
+        return
+    digest.update(",".join(map(str, df.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+
+
+def compute_data_fingerprint(
+    property_id: int, scrap_type: str, hyperparameters: dict
+) -> str:
+    # Content hash of the processed feathers (mtimes change on every cleaner run)
+    digest = hashlib.blake2b(digest_size=16)
+    folder = PROCESSED_DATA_PATH / f"property_id_{property_id}" / scrap_type
+    for file in sorted(folder.rglob("*.feather")):
+        digest.update(str(file.relative_to(folder)).encode())
+        with open(file, "rb") as f:
+            digest.update(hashlib.file_digest(f, "blake2b").digest())
+    digest.update(json.dumps(hyperparameters, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+def compute_prediction_fingerprint(
+    data_fingerprint: str,
+    prop_id_roomtype_mapping: pd.DataFrame,
+    property_id_channel_cat: pd.DataFrame,
+) -> str:
+    digest = hashlib.blake2b(data_fingerprint.encode(), digest_size=16)
+    _hash_frame(digest, prop_id_roomtype_mapping)
+    _hash_frame(digest, property_id_channel_cat)
+    return digest.hexdigest()
+
+
+def load_registered_model(
+    property_id: int, scrap_type: str, data_fingerprint: str
+) -> Optional[lgb.Booster]:
+    registry = load_model_registry(property_id, scrap_type)
+    if registry.get("data_fingerprint") != data_fingerprint:
+        return None
+    booster = load_booster(property_id, scrap_type)
+    if booster is not None:
+        logger.info(
+            f"Reusing registered type {scrap_type} model for property {property_id}"
+        )
+    return booster
+
+
+def register_model(
+    model, property_id: int, scrap_type: str, data_fingerprint: str
+) -> None:
+    save_booster(as_booster(model), property_id, scrap_type)
+    registry = load_model_registry(property_id, scrap_type)
+    registry.update(
+        {
+            "data_fingerprint": data_fingerprint,
+            "registered_at": pd.Timestamp.now(tz=DEFAULT_TIMEZONE).isoformat(),
+        }
+    )
+    save_model_registry(registry, property_id, scrap_type)
+
+
+def is_prediction_current(
+    property_id: int,
+    scrap_type: str,
+    prediction_fingerprint: str,
+    now: pd.Timestamp,
+) -> bool:
+    # The saved ai_prices are reusable when inputs match and they were produced
+    # in the same file-search bucket (hour for A, day for B), so readers still
+    # resolve them for `now`.
+    registry = load_model_registry(property_id, scrap_type)
+    return registry.get("prediction_fingerprint") == prediction_fingerprint and (
+        registry.get("prediction_bucket")
+        == file_search_timestamp(now, scrap_type).isoformat()
+    )
+
+
+def register_prediction(
+    property_id: int,
+    scrap_type: str,
+    prediction_fingerprint: str,
+    now: pd.Timestamp,
+) -> None:
+    registry = load_model_registry(property_id, scrap_type)
+    registry.update(
+        {
+            "prediction_fingerprint": prediction_fingerprint,
+            "prediction_bucket": file_search_timestamp(now, scrap_type).isoformat(),
+        }
+    )
+    save_model_registry(registry, property_id, scrap_type)
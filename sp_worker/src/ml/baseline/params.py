@@ -1,3 +1,7 @@
+import os
+
+from utils.data_reader import load_tuned_hyperparameters
+
 HYPERPARAMETERS_BASELINE_B = {
     ### --- OMITTED --- ###
 }
@@ -6,3 +10,110 @@ HYPERPARAMETERS_BASELINE_B = {
 HYPERPARAMETERS_BASELINE_A = {
     ### --- OMITTED --- ###
 }
+
+
+# Search space of the successive-halving tuner: (low, high, scale) ranges or choices
+HYPERPARAMETER_SPACE = {
+    "learning_rate": (0.01, 0.3, "log"),
+    "num_leaves": (15, 255, "int"),
+    "min_child_samples": (5, 100, "int"),
+    "feature_fraction": (0.5, 1.0, "linear"),
+    "bagging_fraction": (0.5, 1.0, "linear"),
+    "lambda_l2": (1e-3, 10.0, "log"),
+}
+
+# Successive halving: configurations in the first rung, rounds in the first rung,
+# kept fraction 1/eta per rung, wall-clock budget per property, and the shares
+# of the latest rows held out for early stopping and then for scoring
+TUNING = {
+    "n_configs": 27,
+    "min_rounds": 50,
+    "max_rounds": 1350,
+    "eta": 3,
+    "budget_seconds": int(os.getenv("TUNING_BUDGET_SECONDS", "600")),
+    "early_stopping_fraction": 0.1,
+    "scoring_fraction": 0.1,
+}
+
+
+# Hourly warm-start of type A models: trees added per update, forced full
+# retrain period, cap on updates (trees appended) between full retrains, and
+# recent/reference MAE ratio that triggers a full retrain
+INCREMENTAL_TRAINING_A = {
+    "boost_rounds": 20,
+    "full_retrain_every_hours": 24,
+    "max_incremental_updates": 24,
+    "drift_threshold": 1.5,
+}
+
+
+# Drift gate: retrain only when the new scrapes moved past one of these (price
+# PSI over reference deciles, total variation of room/channel frequencies, share
+# of rows with categories unseen at training, recent/reference MAE ratio) or the
+# model is older than max_model_age_hours
+DRIFT_THRESHOLDS = {
+    "price_psi": 0.2,
+    "category_tvd": 0.15,
+    "unseen_share": 0.05,
+    "residual_ratio": 1.3,
+    "max_model_age_hours": 24 * 7,
+}
+
+
+def get_hyperparameters(property_id: int, scrap_type: str) -> dict:
+    # Defaults overridden by the tuner's winning parameters for this property
+    defaults = (
+        HYPERPARAMETERS_BASELINE_B if scrap_type == "B" else HYPERPARAMETERS_BASELINE_A
+    )
+    return {**defaults, **load_tuned_hyperparameters(property_id, scrap_type)}
+
+
+def cap_threads(hyperparameters: dict, num_threads: int) -> dict:
+    # Per-worker thread cap; deterministic col-wise histograms keep the fitted
+    # model independent of the cap, so capped runs match each other
+    params = {**hyperparameters, "num_threads": num_threads}
+    params.setdefault("deterministic", True)
+    if "force_row_wise" not in params:
+        params.setdefault("force_col_wise", True)
+    return params
+
+
+def resolve_hyperparameters(hyperparameters: dict) -> dict:
+    # Thread cap set by the parallel property runner (LGBM_NUM_THREADS, 0 = all
+    # cores); serial runs keep the parameters untouched
+    num_threads = int(os.getenv("LGBM_NUM_THREADS", "0"))
+    if num_threads > 0:
+        return cap_threads(hyperparameters, num_threads)
+    return dict(hyperparameters)
+
+
+# lgb.train reads these as the number of rounds, overriding num_boost_round
+NUM_ROUNDS_ALIASES = [
+    "n_estimators",
+    "num_iterations",
+    "num_iteration",
+    "n_iter",
+    "num_tree",
+    "num_trees",
+    "num_round",
+    "num_rounds",
+    "num_boost_round",
+]
+EARLY_STOPPING_ALIASES = [
+    "early_stopping_round",
+    "early_stopping_rounds",
+    "early_stopping",
+    "n_iter_no_change",
+]
+
+
+def split_num_boost_round(
+    hyperparameters: dict, default: int = 100
+) -> tuple[dict, int]:
+    # Sklearn-style params (n_estimators, ...) to lgb.train params + round count
+    params = dict(hyperparameters)
+    num_boost_round = default
+    for alias in NUM_ROUNDS_ALIASES:
+        if alias in params:
+            num_boost_round = int(params.pop(alias))
+    return params, num_boost_round
@@ -0,0 +1,238 @@
+import time
+import pandas as pd
+import numpy as np
+import lightgbm as lgb
+from typing import Optional
+import logging
+
+from data_ingestion.hotel_class import HotelProperty
+from features.shared_features.categoricals import (
+    CATEGORICAL_COLS_A,
+    CATEGORICAL_COLS_B,
+)
+from features.type_a.training import (
+    feature_processing_train as feature_processing_train_A,
+)
+from features.type_b.training import (
+    feature_processing_train as feature_processing_train_B,
+)
+from utils.data_reader import load_processed_data_subfolder, load_properties
+from utils.data_saver import save_tuned_hyperparameters
+from .cv import build_shared_dataset
+from .params import (
+    HYPERPARAMETER_SPACE,
+    TUNING,
+    EARLY_STOPPING_ALIASES,
+    get_hyperparameters,
+    resolve_hyperparameters,
+    split_num_boost_round,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _sample_configurations(
+    space: dict[str, tuple], n_configs: int, rng: np.random.Generator
+) -> list[dict]:
+    configs = []
+    for _ in range(n_configs):
+        config = {}
+        for name, (low, high, scale) in space.items():
+            if scale == "log":
+                config[name] = float(np.exp(rng.uniform(np.log(low), np.log(high))))
+            elif scale == "int":
+                config[name] = int(rng.integers(low, high + 1))
+            else:
+                config[name] = float(rng.uniform(low, high))
+        configs.append(config)
+    return configs
+
+
+def _validation_mae(booster: lgb.Booster, X_val: pd.DataFrame, y_val) -> float:
+    return float(np.mean(np.abs(booster.predict(X_val) - np.asarray(y_val))))
+
+
+def successive_halving(
+    train: tuple[pd.DataFrame, pd.Series],
+    early_stopping: tuple[pd.DataFrame, pd.Series],
+    scoring: tuple[pd.DataFrame, pd.Series],
+    base_params: dict,
+    categorical_feature: list[str],
+    budget_seconds: float,
+    seed: int = 0,
+) -> tuple[Optional[dict], float]:
+    # Rung k fits the surviving configurations for min_rounds * eta^k rounds,
+    # early-stopped on one later slice and ranked on a separate, latest one, and
+    # keeps the best 1/eta; stops when the budget is spent.
+    deadline = time.monotonic() + budget_seconds
+    rng = np.random.default_rng(seed)
+    eta = TUNING["eta"]
+
+    params, _ = split_num_boost_round(base_params)
+    for alias in EARLY_STOPPING_ALIASES:
+        params.pop(alias, None)
+    # Configs change min_child_samples on the shared Dataset; bagging needs a freq
+    params["feature_pre_filter"] = False
+    params.setdefault("bagging_freq", 1)
+
+    train_set = build_shared_dataset(*train, categorical_feature, params)
+    val_set = lgb.Dataset(
+        *early_stopping, categorical_feature=categorical_feature, reference=train_set
+    ).construct()
+    X_score, y_score = scoring
+
+    configs = _sample_configurations(HYPERPARAMETER_SPACE, TUNING["n_configs"], rng)
+    num_rounds = TUNING["min_rounds"]
+    best_config, best_score = None, np.inf
+
+    while configs and num_rounds <= TUNING["max_rounds"]:
+        scores = []
+        for config in configs:
+            if time.monotonic() > deadline:
+                break
+            booster = lgb.train(
+                {**params, **config},
+                train_set,
+                num_boost_round=num_rounds,
+                valid_sets=[val_set],
+                callbacks=[
+                    lgb.early_stopping(max(10, num_rounds // 10), verbose=False)
+                ],
+            )
+            score = _validation_mae(booster, X_score, y_score)
+            scores.append(score)
+            if score < best_score:
+                best_score = score
+                best_config = {
+                    **config,
+                    "bagging_freq": params["bagging_freq"],
+                    "n_estimators": booster.best_iteration or num_rounds,
+                }
+
+        logger.info(
+            f"Rung with {num_rounds} rounds: {len(scores)}/{len(configs)} configs, "
+            f"best MAE {best_score:.2f}"
+        )
+        if len(scores) < len(configs) or len(configs) == 1:
+            break
+        keep = max(1, len(configs) // eta)
+        configs = [configs[i] for i in np.argsort(scores)[:keep]]
+        num_rounds *= eta
+
+    return best_config, best_score
+
+
+def _scrapes_until(
+    dict_df: dict[str, pd.DataFrame], cutoff: pd.Timestamp
+) -> dict[str, pd.DataFrame]:
+    until = {ota: df[df["scraping_id"] <= cutoff] for ota, df in dict_df.items()}
+    return {ota: df for ota, df in until.items() if not df.empty}
+
+
+def _holdout_cutoffs(
+    dict_df_client: dict[str, pd.DataFrame],
+) -> Optional[tuple[pd.Timestamp, pd.Timestamp]]:
+    # Last scrapes of the training and early-stopping slices: the latest rows
+    # (by scrape) are held out, scoring share last, whole scrapes at a time
+    scrapes = pd.concat(
+        [df["scraping_id"] for df in dict_df_client.values()], ignore_index=True
+    ).sort_values(ignore_index=True)
+    n_rows = len(scrapes)
+    n_scoring = max(1, int(n_rows * TUNING["scoring_fraction"]))
+    n_early_stopping = max(1, int(n_rows * TUNING["early_stopping_fraction"]))
+    if n_scoring + n_early_stopping >= n_rows:
+        return None
+
+    train_until = scrapes.iloc[n_rows - n_scoring - n_early_stopping - 1]
+    early_stopping_until = scrapes.iloc[n_rows - n_scoring - 1]
+    if not train_until < early_stopping_until < scrapes.iloc[-1]:
+        return None
+    return train_until, early_stopping_until
+
+
+def tune_property(
+    property_id: int, scrap_type: str, budget_seconds: Optional[float] = None
+) -> Optional[dict]:
+    dict_df_client = load_processed_data_subfolder(
+        property_id=property_id, scrap_type=scrap_type, subfolder="client_data"
+    )
+    dict_df_comp = load_processed_data_subfolder(
+        property_id=property_id, scrap_type=scrap_type, subfolder="comp_data"
+    )
+
+    cutoffs = _holdout_cutoffs(dict_df_client)
+    if cutoffs is None:
+        logger.warning(f"Too few scrapes to hold out for property {property_id}")
+        return None
+    train_until, early_stopping_until = cutoffs
+
+    if scrap_type == "B":
+        feature_processing_train = feature_processing_train_B
+        categorical_feature = CATEGORICAL_COLS_B
+    else:
+        feature_processing_train = feature_processing_train_A
+        categorical_feature = CATEGORICAL_COLS_A
+
+    # Time-ordered split on the scrapes: only the training slice is augmented;
+    # held-out slices get transform-only features computed with their history.
+    # All slices read the production categorical dictionary without updating it
+    train = feature_processing_train(
+        _scrapes_until(dict_df_client, train_until),
+        _scrapes_until(dict_df_comp, train_until),
+        property_id,
+        fit_categories=False,
+    )
+    early_stopping = feature_processing_train(
+        _scrapes_until(dict_df_client, early_stopping_until),
+        _scrapes_until(dict_df_comp, early_stopping_until),
+        property_id,
+        augment=False,
+        fit_categories=False,
+        scraped_after=train_until,
+    )
+    scoring = feature_processing_train(
+        dict_df_client,
+        dict_df_comp,
+        property_id,
+        augment=False,
+        fit_categories=False,
+        scraped_after=early_stopping_until,
+    )
+
+    base_params = resolve_hyperparameters(get_hyperparameters(property_id, scrap_type))
+    best_config, best_score = successive_halving(
+        train,
+        early_stopping,
+        scoring,
+        base_params,
+        categorical_feature,
+        budget_seconds or TUNING["budget_seconds"],
+        seed=property_id,
+    )
+    if best_config is None:
+        logger.warning(f"Tuning budget too small for property {property_id}")
+        return None
+
+    save_tuned_hyperparameters(best_config, best_score, property_id, scrap_type)
+    logger.info(
+        f"Tuned type {scrap_type} params for property {property_id}: "
+        f"{best_config} (holdout MAE {best_score:.2f})"
+    )
+    return best_config
+
+
+def hyperparameter_tuner(scrap_type: str) -> None:
+    properties: list[HotelProperty] = load_properties()
+    failures: dict[int, str] = {}
+    for property in properties:
+        try:
+            tune_property(property.property_id, scrap_type)
+        except Exception as e:
+            logger.exception(f"Tuning failed for property {property.property_id}")
+            failures[property.property_id] = f"{type(e).__name__}: {e}"
+
+    if failures:
+        raise RuntimeError(
+            f"Tuning failed for {len(failures)}/{len(properties)} properties: "
+            f"{failures}"
+        )
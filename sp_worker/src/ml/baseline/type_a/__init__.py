@@ -1,2 +1,7 @@
 from .training import baseline_model_A_train
-from .inference import baseline_model_A_predict
+from .inference import (
+    baseline_model_A_predict,
+    baseline_model_A_prepare,
+    baseline_model_A_finalize,
+)
+from .incremental import baseline_model_A_update
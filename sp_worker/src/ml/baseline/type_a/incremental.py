@@ -0,0 +1,162 @@
+import pandas as pd
+import numpy as np
+import lightgbm as lgb
+from typing import Optional
+import logging
+
+from config.settings import CATEGORICAL_STORE_ENABLED, DEFAULT_TIMEZONE
+from features.type_a.training import feature_processing_train
+from features.shared_features.categoricals import CATEGORICAL_COLS_A
+from utils.data_reader import load_booster, load_model_metadata
+from utils.data_saver import save_booster, save_model_metadata
+from ..params import (
+    get_hyperparameters,
+    INCREMENTAL_TRAINING_A,
+    EARLY_STOPPING_ALIASES,
+    resolve_hyperparameters,
+    split_num_boost_round,
+)
+from ..model_registry import as_booster
+from .training import baseline_model_A_train
+
+logger = logging.getLogger(__name__)
+
+
+def _latest_scrape(dict_df_client_A: dict[str, pd.DataFrame]) -> pd.Timestamp:
+    return max(df["scraping_id"].max() for df in dict_df_client_A.values())
+
+
+def _scrapes_since(
+    dict_df_client_A: dict[str, pd.DataFrame], since: pd.Timestamp
+) -> dict[str, pd.DataFrame]:
+    recent = {
+        ota: df[df["scraping_id"] > since] for ota, df in dict_df_client_A.items()
+    }
+    return {ota: df for ota, df in recent.items() if not df.empty}
+
+
+def _needs_full_retrain(
+    booster: Optional[lgb.Booster], metadata: dict, now: pd.Timestamp
+) -> Optional[str]:
+    if booster is None or not metadata.get("last_full_train"):
+        return "no previous model"
+    # pandas categoricals of the new scrapes alone would not match the model's
+    if not CATEGORICAL_STORE_ENABLED:
+        return "no persisted categorical dictionary (CATEGORICAL_STORE off)"
+    last_full_train = pd.Timestamp(metadata["last_full_train"])
+    hours_since = (now - last_full_train) / pd.Timedelta(hours=1)
+    if hours_since >= INCREMENTAL_TRAINING_A["full_retrain_every_hours"]:
+        return f"scheduled ({hours_since:.0f}h since last full retrain)"
+    n_updates = metadata.get("n_incremental_updates", 0)
+    if n_updates >= INCREMENTAL_TRAINING_A["max_incremental_updates"]:
+        return f"{n_updates} incremental updates since last full retrain"
+    return None
+
+
+def _full_retrain(
+    dict_df_client_A: dict[str, pd.DataFrame],
+    dict_df_comp_A: dict[str, pd.DataFrame],
+    property_id: int,
+    now: pd.Timestamp,
+    reason: str,
+) -> lgb.Booster:
+    logger.info(f"Full type A retrain for property {property_id}: {reason}")
+    booster = as_booster(
+        baseline_model_A_train(dict_df_client_A, dict_df_comp_A, property_id)
+    )
+    save_booster(booster, property_id, "A")
+    save_model_metadata(
+        {
+            "last_full_train": now.isoformat(),
+            "last_trained_at": _latest_scrape(dict_df_client_A).isoformat(),
+            "n_incremental_updates": 0,
+            "reference_mae": None,
+            "last_recent_mae": None,
+            "last_full_train_reason": reason,
+        },
+        property_id,
+        "A",
+    )
+    return booster
+
+
+def baseline_model_A_update(
+    dict_df_client_A: dict[str, pd.DataFrame],
+    dict_df_comp_A: dict[str, pd.DataFrame],
+    property_id: int,
+    now: Optional[pd.Timestamp] = None,
+) -> lgb.Booster:
+    # Continues boosting the stored model on scrapes newer than its last update,
+    # falling back to baseline_model_A_train on schedule or validation drift.
+    now = now or pd.Timestamp.now(tz=DEFAULT_TIMEZONE)
+    booster = load_booster(property_id, "A")
+    metadata = load_model_metadata(property_id, "A")
+
+    reason = _needs_full_retrain(booster, metadata, now)
+    if reason is not None:
+        return _full_retrain(dict_df_client_A, dict_df_comp_A, property_id, now, reason)
+
+    since = pd.Timestamp(metadata["last_trained_at"])
+    dict_df_recent = _scrapes_since(dict_df_client_A, since)
+    if not dict_df_recent:
+        logger.info(f"No new type A scrapes for property {property_id} since {since}")
+        return booster
+
+    # Features over the whole retained window (history-based features see their
+    # history), kept for the new scrapes only; no augmentation and no change to
+    # the categorical dictionary, which only full retrains extend.
+    X_recent, y_recent = feature_processing_train(
+        dict_df_client_A,
+        dict_df_comp_A,
+        property_id,
+        augment=False,
+        fit_categories=False,
+        scraped_after=since,
+    )
+    if X_recent.empty:
+        logger.info(f"No new type A training rows for property {property_id}")
+        return booster
+
+    # Out-of-sample error of the current model on the new hour tracks drift;
+    # the first measurement after a full retrain becomes the reference.
+    recent_mae = float(np.mean(np.abs(booster.predict(X_recent) - y_recent)))
+    reference_mae = metadata.get("reference_mae") or recent_mae
+    drift_ratio = recent_mae / reference_mae if reference_mae > 0 else 1.0
+    if drift_ratio > INCREMENTAL_TRAINING_A["drift_threshold"]:
+        return _full_retrain(
+            dict_df_client_A,
+            dict_df_comp_A,
+            property_id,
+            now,
+            f"validation drift (recent MAE {recent_mae:.1f}, x{drift_ratio:.2f})",
+        )
+
+    params, _ = split_num_boost_round(
+        resolve_hyperparameters(get_hyperparameters(property_id, "A"))
+    )
+    for alias in EARLY_STOPPING_ALIASES:
+        params.pop(alias, None)
+
+    booster = lgb.train(
+        params,
+        lgb.Dataset(X_recent, y_recent, categorical_feature=CATEGORICAL_COLS_A),
+        num_boost_round=INCREMENTAL_TRAINING_A["boost_rounds"],
+        init_model=booster,
+        keep_training_booster=True,
+    )
+
+    save_booster(booster, property_id, "A")
+    metadata.update(
+        {
+            "last_trained_at": _latest_scrape(dict_df_recent).isoformat(),
+            "n_incremental_updates": metadata.get("n_incremental_updates", 0) + 1,
+            "reference_mae": reference_mae,
+            "last_recent_mae": recent_mae,
+        }
+    )
+    save_model_metadata(metadata, property_id, "A")
+    logger.info(
+        f"Incremental type A update for property {property_id} on {len(X_recent)} rows "
+        f"(recent MAE {recent_mae:.1f}, x{drift_ratio:.2f} of reference)"
+    )
+    return booster
@@ -6,15 +6,51 @@ import numpy as np
 from features.type_a.inference import feature_processing_pred
 
 
-def baseline_model_A_predict(
-    model: ### --- OMITTED --- ###,
+def baseline_model_A_prepare(
     dict_df_client_A: dict[str, pd.DataFrame],
     dict_df_comp_A: dict[str, pd.DataFrame],
     property_id_roomtype_mapping: pd.DataFrame,
     property_id_channel_cat: pd.DataFrame,
     property_id: int,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    # Prediction grid and the model input matrix built from it
+
+    prediction_data = feature_processing_pred(
+        dict_df_client_A,
+        dict_df_comp_A,
+        property_id_roomtype_mapping,
+        property_id_channel_cat,
+        property_id,
+    )
+
+    ### --- OMITTED --- ###
+
+    return prediction_data, X
+
+
+def baseline_model_A_finalize(
+    prediction_data: pd.DataFrame, predictions: np.ndarray
 ) -> pd.DataFrame:
 
     ### --- OMITTED --- ###
 
     return prediction_data
+
+
+def baseline_model_A_predict(
+    model: ### --- OMITTED --- ###,
+    dict_df_client_A: dict[str, pd.DataFrame],
+    dict_df_comp_A: dict[str, pd.DataFrame],
+    property_id_roomtype_mapping: pd.DataFrame,
+    property_id_channel_cat: pd.DataFrame,
+    property_id: int,
+) -> pd.DataFrame:
+
+    prediction_data, X = baseline_model_A_prepare(
+        dict_df_client_A,
+        dict_df_comp_A,
+        property_id_roomtype_mapping,
+        property_id_channel_cat,
+        property_id,
+    )
+    return baseline_model_A_finalize(prediction_data, model.predict(X))
@@ -1,2 +1,6 @@
 from .training import baseline_model_B_train
-from .inference import baseline_model_B_predict
+from .inference import (
+    baseline_model_B_predict,
+    baseline_model_B_prepare,
+    baseline_model_B_finalize,
+)
@@ -6,22 +6,75 @@ import numpy as np
 from features.type_b.inference import feature_processing_pred
 
 
+EXTRAPOLATION_GROUP_COLS = ["name", "channel"]
+
+
 def _extrapolate_predictions(
     prediction_data: pd.DataFrame, missing_mask: pd.Series, window: int = 20
 ) -> pd.DataFrame:
+    # Missing rows take the mean of the last `window` known predictions of their
+    # (name, channel) group before them in checkIn order. All groups are handled
+    # in one pass with a prefix sum over the known values.
+    df = prediction_data.copy()
+    if df.empty or not missing_mask.any():
+        return df
 
-    ### --- OMITTED --- ###
+    group_codes, _ = pd.MultiIndex.from_frame(df[EXTRAPOLATION_GROUP_COLS]).factorize()
+    order = np.lexsort((df["checkIn"].to_numpy(), group_codes))
+    groups = group_codes[order]
+    prices = df["predicted_price"].to_numpy(dtype=np.float64)[order]
+    missing = missing_mask.to_numpy(dtype=bool)[order]
+
+    known = ~missing & np.isfinite(prices)
+    # n_known[i]: known values up to row i; prefix[j]: sum of the first j of them
+    n_known = np.cumsum(known)
+    prefix = np.concatenate(([0.0], np.cumsum(prices[known])))
+
+    group_start = np.r_[True, groups[1:] != groups[:-1]]
+    start_rows = np.flatnonzero(group_start)
+    group_known_start = (n_known - known)[start_rows][np.cumsum(group_start) - 1]
+
+    upper = n_known
+    lower = np.maximum(upper - window, group_known_start)
+    count = upper - lower
+    with np.errstate(invalid="ignore", divide="ignore"):
+        trailing_mean = (prefix[upper] - prefix[lower]) / count
+
+    filled = prices.copy()
+    fill = missing & (count > 0)
+    filled[fill] = trailing_mean[fill]
 
+    result = np.empty_like(filled)
+    result[order] = filled
+    df["predicted_price"] = result
     return df
 
 
-def baseline_model_B_predict(
-    model: ### --- OMITTED --- ###,
+def baseline_model_B_prepare(
     dict_df_client_B: dict[str, pd.DataFrame],
     dict_df_comp_B: dict[str, pd.DataFrame],
     property_id_roomtype_mapping: pd.DataFrame,
     property_id_channel_cat: pd.DataFrame,
     property_id: int,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    # Prediction grid and the model input matrix built from it
+
+    prediction_data = feature_processing_pred(
+        dict_df_client_B,
+        dict_df_comp_B,
+        property_id_roomtype_mapping,
+        property_id_channel_cat,
+        property_id,
+    )
+
+    ### --- OMITTED --- ###
+
+    return prediction_data, X
+
+
+def baseline_model_B_finalize(
+    prediction_data: pd.DataFrame,
+    predictions: np.ndarray,
     extrapolate: bool = False,
     window: int = 20,
 ) -> pd.DataFrame:
@@ -29,3 +82,26 @@ def baseline_model_B_predict(
     ### --- OMITTED --- ###
 
     return prediction_data
+
+
+def baseline_model_B_predict(
+    model: ### --- OMITTED --- ###,
+    dict_df_client_B: dict[str, pd.DataFrame],
+    dict_df_comp_B: dict[str, pd.DataFrame],
+    property_id_roomtype_mapping: pd.DataFrame,
+    property_id_channel_cat: pd.DataFrame,
+    property_id: int,
+    extrapolate: bool = False,
+    window: int = 20,
+) -> pd.DataFrame:
+
+    prediction_data, X = baseline_model_B_prepare(
+        dict_df_client_B,
+        dict_df_comp_B,
+        property_id_roomtype_mapping,
+        property_id_channel_cat,
+        property_id,
+    )
+    return baseline_model_B_finalize(
+        prediction_data, model.predict(X), extrapolate=extrapolate, window=window
+    )
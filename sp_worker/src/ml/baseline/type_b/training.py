@@ -6,8 +6,14 @@ import logging
 
 from features.type_b.training import feature_processing_train
 from features.shared_features.categoricals import CATEGORICAL_COLS_B
-from ..params import HYPERPARAMETERS_BASELINE_B
+from features.shared_features.training_window import (
+    select_training_window,
+    pop_sample_weight,
+)
+from utils.profiling import profile_stage
+from ..params import get_hyperparameters, resolve_hyperparameters
 from ..mlflow_logger import log_cv_metrics
+from ..cv import fit_cv_folds
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +25,20 @@ def baseline_model_B_train(
     n_splits: int = 6,
 ) -> ### --- OMITTED --- ###:
 
+    # Bounded, age-weighted history so training time plateaus as scrapes accumulate
+    with profile_stage("training_window"):
+        dict_df_client_B = select_training_window(dict_df_client_B)
+    hyperparameters = resolve_hyperparameters(get_hyperparameters(property_id, "B"))
+
+    ### --- OMITTED --- ###
+
+    X, sample_weight = pop_sample_weight(X, required=True)
+    # One pre-binned Dataset shared by all folds, fitted concurrently
+    with profile_stage("cv_fit"):
+        models = fit_cv_folds(
+            X, y, folds, hyperparameters, CATEGORICAL_COLS_B, weight=sample_weight
+        )
+
     ### --- OMITTED --- ###
 
     return models[best_model_index]
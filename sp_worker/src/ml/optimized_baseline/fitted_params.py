@@ -0,0 +1,79 @@
+import pandas as pd
+import numpy as np
+from typing import Optional
+import logging
+
+from config.paths import OPTIMIZED_BASELINE_FITTED_PARAMS_PATH
+from utils.data_reader import load_fitted_params
+from .pricing_engine import FITTED_PARAM_COLS, DEFAULT_V, DEFAULT_L
+
+logger = logging.getLogger(__name__)
+
+PARAM_DEFAULTS = {"P0": np.nan, "k": np.nan, "v": DEFAULT_V, "L": DEFAULT_L}
+
+
+class FittedParamsStore:
+    # fitted_params.json compiled once into one float64 array per parameter,
+    # indexed by (property_id, room name)
+
+    def __init__(self, loaded_params: dict, mtime: float):
+        self.mtime = mtime
+
+        keys: list[tuple[int, str]] = []
+        values: dict[str, list[float]] = {col: [] for col in FITTED_PARAM_COLS}
+        for property_id, rooms in loaded_params.items():
+            if not isinstance(rooms, dict):
+                logger.warning(f"Skipping fitted params entry '{property_id}'")
+                continue
+            for name, params in rooms.items():
+                if not isinstance(params, dict):
+                    continue
+                keys.append((int(property_id), str(name)))
+                for col in FITTED_PARAM_COLS:
+                    values[col].append(float(params.get(col, PARAM_DEFAULTS[col])))
+
+        self.keys = pd.MultiIndex.from_tuples(keys, names=["property_id", "name"])
+        self.params: dict[str, np.ndarray] = {
+            col: np.asarray(values[col], dtype=np.float64) for col in FITTED_PARAM_COLS
+        }
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def lookup(self, property_ids, names) -> dict[str, np.ndarray]:
+        # Parameter columns for each (property_id, name) pair; P0/k are NaN when
+        # the room has no fitted curve, so the engine keeps the baseline price
+        positions = self.keys.get_indexer(
+            pd.MultiIndex.from_arrays([np.asarray(property_ids), np.asarray(names)])
+        )
+        found = positions >= 0
+        result = {}
+        for col in FITTED_PARAM_COLS:
+            column = np.full(len(positions), PARAM_DEFAULTS[col], dtype=np.float64)
+            column[found] = self.params[col][positions[found]]
+            result[col] = column
+        return result
+
+    def attach(self, df: pd.DataFrame, property_id: int) -> pd.DataFrame:
+        df = df.copy()
+        params = self.lookup(np.full(len(df), property_id), df["name"].astype(str))
+        for col, values in params.items():
+            df[col] = values
+        return df
+
+
+_FITTED_PARAMS_CACHE: dict[str, FittedParamsStore] = {}
+
+
+def get_fitted_params_store() -> FittedParamsStore:
+    # Parsed on first use and again only when the file's mtime changes
+    path = OPTIMIZED_BASELINE_FITTED_PARAMS_PATH
+    mtime: Optional[float] = path.stat().st_mtime if path.exists() else None
+    cached = _FITTED_PARAMS_CACHE.get(str(path))
+    if cached is not None and cached.mtime == mtime:
+        return cached
+
+    store = FittedParamsStore(load_fitted_params(), mtime)
+    _FITTED_PARAMS_CACHE[str(path)] = store
+    logger.info(f"Loaded fitted params for {len(store)} rooms from {path}")
+    return store
@@ -1,28 +1,22 @@
 import pandas as pd
 import numpy as np
-import json
 import pytz
 import logging
 from typing import Optional
 
-from config.paths import OPTIMIZED_BASELINE_FITTED_PARAMS_PATH
 from config.settings import DEFAULT_TIMEZONE
 from data_ingestion.hotel_class import HotelProperty
 from sp_worker.src.data_ingestion.database_loader_2 import get_ims_occ
 from utils.data_reader import load_ai_prices, file_search_timestamp, load_properties
 from utils.data_saver import save_ai_prices
+from .pricing_engine import apply_price_adjustments
+from .fitted_params import get_fitted_params_store
 
 logger = logging.getLogger(__name__)
 
 tz = pytz.timezone(DEFAULT_TIMEZONE)
 
 
-with open(OPTIMIZED_BASELINE_FITTED_PARAMS_PATH, "r") as f:
-    loaded_params = json.load(f)
-    
-    ### --- OMITTED --- ###
-
-
 def price_inverse_logistic_fitted(occ, P0, k, v=0.25, L=1.02):
 
     ### --- OMITTED --- ###
@@ -48,4 +42,14 @@ def get_baseline_predictions(
 
 def opt_baseline_model_updater(scrap_type: str, add_discount: bool = False) -> None:
 
+    # Properties, baseline predictions and IMS occupancy up to df_pred (occ),
+    # without fitted params or row-wise price adjustment
+    ### --- OMITTED --- ###
+
+    # Whole-frame curve prices on the fitted params, in place of the row-wise
+    # df.apply(apply_price_adjustment, axis=1); the add_discount branch follows
+    df_pred = get_fitted_params_store().attach(df_pred, property_id)
+    df_pred = apply_price_adjustments(df_pred)
+
+    # add_discount branch, save_ai_prices
     ### --- OMITTED --- ###
@@ -0,0 +1,56 @@
+import pandas as pd
+import numpy as np
+
+OCC_COL = "occ"
+PRICE_COL = "predicted_price"
+FITTED_PARAM_COLS = ["P0", "k", "v", "L"]
+
+# Same defaults as price_inverse_logistic_fitted
+DEFAULT_V = 0.25
+DEFAULT_L = 1.02
+
+# Occupancy is kept strictly inside (0, L) where the inverse is defined
+OCC_EPS = 1e-6
+
+
+def inverse_logistic_prices(
+    occ: np.ndarray,
+    P0: np.ndarray,
+    k: np.ndarray,
+    v: np.ndarray | float = DEFAULT_V,
+    L: np.ndarray | float = DEFAULT_L,
+) -> np.ndarray:
+    # Inverse of the generalised logistic occ = L / (1 + exp(-k (P - P0))) ** (1 / v)
+    # evaluated element-wise over broadcast arrays
+    occ = np.asarray(occ, dtype=np.float64)
+    L = np.asarray(L, dtype=np.float64)
+    occ = np.clip(occ, OCC_EPS, L - OCC_EPS)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return P0 - np.log(np.power(L / occ, v) - 1.0) / k
+
+
+def adjust_prices(
+    occ: np.ndarray,
+    base_price: np.ndarray,
+    P0: np.ndarray,
+    k: np.ndarray,
+    v: np.ndarray | float = DEFAULT_V,
+    L: np.ndarray | float = DEFAULT_L,
+) -> np.ndarray:
+    # The fitted curve gives the price for the occupancy, on P0's (price) scale;
+    # rows with missing occupancy or parameters keep the baseline price
+    base_price = np.asarray(base_price, dtype=np.float64)
+    curve_price = inverse_logistic_prices(occ, P0, k, v, L)
+    return np.where(np.isfinite(curve_price), curve_price, base_price)
+
+
+def apply_price_adjustments(df: pd.DataFrame) -> pd.DataFrame:
+    # Column-level equivalent of price_inverse_logistic_fitted applied per row
+    # by apply_price_adjustment, on a prediction frame with attached fitted params
+    df = df.copy()
+    df[PRICE_COL] = adjust_prices(
+        df[OCC_COL].to_numpy(dtype=np.float64),
+        df[PRICE_COL].to_numpy(dtype=np.float64),
+        *(df[col].to_numpy(dtype=np.float64) for col in FITTED_PARAM_COLS),
+    )
+    return df
@@ -0,0 +1,181 @@
+import os
+import json
+import time
+import sqlite3
+import logging
+import functools
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from config.paths import EXTERNAL_API_CACHE_PATH
+from config.settings import (
+    EXTERNAL_API_CACHE_ENABLED,
+    EXTERNAL_API_CACHE_MAX_STALE_SECONDS,
+    EXTERNAL_API_CACHE_TTL_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Disk-backed cache for external API responses: JSON values in one SQLite file
+# shared by every process of a run. An entry is fresh for the TTL of its
+# namespace; past it, it is still returned for MAX_STALE seconds while a single
+# background call (claimed in the table, so once across processes) refreshes it.
+# Stale entries are also returned when the API fails. None is never stored: the
+# API helpers return it on failure, so a failed call is retried on the next one
+# instead of caching an empty response for the whole TTL.
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    refreshing_since REAL,
+    PRIMARY KEY (namespace, key)
+)
+"""
+
+# A refresh claimed longer ago than this is assumed lost and can be taken again
+REFRESH_TIMEOUT_SECONDS = 300
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_PID: Optional[int] = None
+
+
+def _now() -> float:
+    return time.time()
+
+
+def _refresh_executor() -> ThreadPoolExecutor:
+    # One per process: a forked worker must not reuse the parent's threads.
+    # Its threads are joined at interpreter exit, so refreshes are not lost
+    global _EXECUTOR, _EXECUTOR_PID
+    if _EXECUTOR is None or _EXECUTOR_PID != os.getpid():
+        _EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="api_cache")
+        _EXECUTOR_PID = os.getpid()
+    return _EXECUTOR
+
+
+def wait_for_refreshes() -> None:
+    # Blocks until the background refreshes started by this process are done
+    global _EXECUTOR
+    if _EXECUTOR is not None and _EXECUTOR_PID == os.getpid():
+        _EXECUTOR.shutdown(wait=True)
+    _EXECUTOR = None
+
+
+def _connect() -> sqlite3.Connection:
+    EXTERNAL_API_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(EXTERNAL_API_CACHE_PATH, timeout=30, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(_SCHEMA)
+    return conn
+
+
+def _read(namespace: str, key: str) -> Optional[tuple[Any, float]]:
+    with closing(_connect()) as conn:
+        row = conn.execute(
+            "SELECT value, fetched_at FROM responses WHERE namespace = ? AND key = ?",
+            (namespace, key),
+        ).fetchone()
+    if row is None:
+        return None
+    return json.loads(row[0]), row[1]
+
+
+def _write(namespace: str, key: str, value: Any) -> None:
+    with closing(_connect()) as conn:
+        conn.execute(
+            "INSERT INTO responses (namespace, key, value, fetched_at) "
+            "VALUES (?, ?, ?, ?) ON CONFLICT (namespace, key) DO UPDATE SET "
+            "value = excluded.value, fetched_at = excluded.fetched_at, "
+            "refreshing_since = NULL",
+            (namespace, key, json.dumps(value), _now()),
+        )
+
+
+def _claim_refresh(namespace: str, key: str) -> bool:
+    now = _now()
+    with closing(_connect()) as conn:
+        cursor = conn.execute(
+            "UPDATE responses SET refreshing_since = ? "
+            "WHERE namespace = ? AND key = ? "
+            "AND (refreshing_since IS NULL OR refreshing_since < ?)",
+            (now, namespace, key, now - REFRESH_TIMEOUT_SECONDS),
+        )
+        return cursor.rowcount == 1
+
+
+def _release_refresh(namespace: str, key: str) -> None:
+    with closing(_connect()) as conn:
+        conn.execute(
+            "UPDATE responses SET refreshing_since = NULL "
+            "WHERE namespace = ? AND key = ?",
+            (namespace, key),
+        )
+
+
+def _fetch_and_store(namespace: str, key: str, fetch: Callable[[], Any]) -> Any:
+    value = fetch()
+    if value is not None:
+        _write(namespace, key, value)
+    return value
+
+
+def _refresh(namespace: str, key: str, fetch: Callable[[], Any]) -> None:
+    try:
+        _fetch_and_store(namespace, key, fetch)
+    except Exception:
+        logger.exception(f"Background refresh of {namespace} {key} failed")
+    finally:
+        _release_refresh(namespace, key)
+
+
+def cached_call(namespace: str, key: str, fetch: Callable[[], Any]) -> Any:
+    if not EXTERNAL_API_CACHE_ENABLED:
+        return fetch()
+
+    entry = _read(namespace, key)
+    if entry is not None:
+        value, fetched_at = entry
+        age = _now() - fetched_at
+        ttl = EXTERNAL_API_CACHE_TTL_SECONDS[namespace]
+        if age < ttl:
+            return value
+        if age < ttl + EXTERNAL_API_CACHE_MAX_STALE_SECONDS:
+            if _claim_refresh(namespace, key):
+                _refresh_executor().submit(_refresh, namespace, key, fetch)
+            return value
+
+    try:
+        value = _fetch_and_store(namespace, key, fetch)
+    except Exception as e:
+        if entry is None:
+            raise
+        logger.warning(
+            f"{namespace} API call failed ({e}), serving the response cached "
+            f"{age / 3600:.1f}h ago for {key}"
+        )
+        return entry[0]
+    # None is the helpers' failure value: the last response is better than none
+    if value is None and entry is not None:
+        logger.warning(
+            f"{namespace} API call failed, serving the response cached "
+            f"{age / 3600:.1f}h ago for {key}"
+        )
+        return entry[0]
+    return value
+
+
+def cached_api(namespace: str):
+    # Caches fn(*args, **kwargs) under its JSON-encoded arguments
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = json.dumps([args, kwargs], sort_keys=True, default=str)
+            return cached_call(namespace, key, lambda: fn(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
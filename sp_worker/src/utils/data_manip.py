@@ -1,4 +1,5 @@
 import os
+import hashlib
 from pathlib import Path
 import pandas as pd
 import logging
@@ -77,3 +78,8 @@ def cleanup_old_files(folder: Path, max_files: int = 365) -> None:
             logger.info(f"Deleted old file: {f}")
         except Exception as e:
             logger.warning(f"Failed to delete old file {f}: {e}")
+
+
+def bytes_digest(data: bytes) -> str:
+    # Content digest of a saved file, used to spot identical files across properties
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
@@ -2,7 +2,9 @@ import os
 import json
 import pickle
 import pandas as pd
-from typing import Optional
+import numpy as np
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 import logging
 
 from config.paths import (
@@ -11,11 +13,16 @@ from config.paths import (
     PROCESSED_DATA_PATH,
     OUTPUTS_PATH,
     PROPERTIES_PATH,
+    MODELS_PATH,
+    OPTIMIZED_BASELINE_FITTED_PARAMS_PATH,
 )
 from config.settings import DEFAULT_TIMEZONE, TABLES_TO_FETCH
 from .data_manip import find_best_matching_file
 from data_ingestion.hotel_class import HotelProperty
 
+if TYPE_CHECKING:
+    import lightgbm as lgb
+
 logger = logging.getLogger(__name__)
 
 
@@ -172,6 +179,26 @@ def load_processed_data_subfolder(
     return dict_df
 
 
+def load_processed_digests(
+    property_id: int, scrap_type: str, subfolder: str
+) -> dict[str, list]:
+    # {ota: [size, mtime_ns, digest]} written with the subfolder; {} when missing
+    path = (
+        PROCESSED_DATA_PATH
+        / f"property_id_{property_id}"
+        / scrap_type
+        / f"{subfolder}_digests.json"
+    )
+    if not path.exists():
+        return {}
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except Exception as e:
+        logger.error(f"Failed to read '{path}': {e}")
+        return {}
+
+
 # ----------------------------------- read outputs in feather -----------------------------------
 
 
@@ -251,9 +278,9 @@ def load_events_data(date: pd.Timestamp, property_id: int) -> Optional[pd.DataFr
     return None
 
 
-def load_ai_prices(
+def find_ai_prices_file(
     date: pd.Timestamp, model: str, property_id: int, scrap_type: str
-) -> Optional[pd.DataFrame]:
+) -> Optional[Path]:
     # NOTE: model = baseline | optimized_baseline
     base_folder = (
         OUTPUTS_PATH / "ai_prices" / model / f"property_id_{property_id}" / scrap_type
@@ -269,6 +296,14 @@ def load_ai_prices(
     best_file = find_best_matching_file(base_folder, date, scrap_type)
     if best_file is None:
         logger.warning(f"No matching AI prices file found for {date} in {base_folder}")
+    return best_file
+
+
+def load_ai_prices(
+    date: pd.Timestamp, model: str, property_id: int, scrap_type: str
+) -> Optional[pd.DataFrame]:
+    best_file = find_ai_prices_file(date, model, property_id, scrap_type)
+    if best_file is None:
         return None
 
     try:
@@ -279,6 +314,119 @@ def load_ai_prices(
         return None
 
 
+def load_ai_prices_index(ai_prices_file: Path) -> Optional[dict[str, np.ndarray]]:
+    # Arrays compiled from an AI prices file, stored next to it under its timestamp
+    path = ai_prices_file.with_suffix(".npz")
+    if not path.exists():
+        return None
+    try:
+        with np.load(path) as arrays:
+            return dict(arrays)
+    except Exception as e:
+        logger.error(f"Failed to read AI prices index from {path}: {e}")
+        return None
+
+
+# ----------------------------------- read chart state -----------------------------------
+
+
+def load_chart_state(
+    property_id: int, scrap_type: str
+) -> Optional[tuple[dict[str, pd.DataFrame], pd.Timestamp]]:
+    # None when missing or unreadable: the charts are then rebuilt from history
+    folder = OUTPUTS_PATH / "chart_state" / f"property_id_{property_id}" / scrap_type
+    path = folder / "watermark.json"
+    if not path.exists():
+        return None
+    try:
+        with open(path, "r") as f:
+            meta = json.load(f)
+        state = {
+            name: pd.read_feather(folder / f"{name}.feather") for name in meta["frames"]
+        }
+        return state, pd.Timestamp(meta["watermark"])
+    except Exception as e:
+        logger.error(f"Failed to read chart state from '{folder}': {e}")
+        return None
+
+
+# ----------------------------------- read models artifacts -----------------------------------
+
+
+def load_model_json(property_id: int, scrap_type: str, name: str) -> dict:
+    path = MODELS_PATH / f"property_id_{property_id}" / scrap_type / f"{name}.json"
+    if not path.exists():
+        return {}
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except Exception as e:
+        raise RuntimeError(f"Failed to read or parse: {path}\n{e}")
+
+
+def load_categorical_dict(property_id: int, scrap_type: str) -> dict[str, list]:
+    return load_model_json(property_id, scrap_type, "categories")
+
+
+def load_model_metadata(property_id: int, scrap_type: str) -> dict:
+    # Metadata and registry only drive reuse decisions: unreadable means retrain
+    try:
+        return load_model_json(property_id, scrap_type, "metadata")
+    except RuntimeError as e:
+        logger.error(e)
+        return {}
+
+
+def load_model_registry(property_id: int, scrap_type: str) -> dict:
+    try:
+        return load_model_json(property_id, scrap_type, "registry")
+    except RuntimeError as e:
+        logger.error(e)
+        return {}
+
+
+def load_drift_reference(property_id: int, scrap_type: str) -> dict:
+    try:
+        return load_model_json(property_id, scrap_type, "drift_reference")
+    except RuntimeError as e:
+        logger.error(e)
+        return {}
+
+
+def load_tuned_hyperparameters(property_id: int, scrap_type: str) -> dict:
+    try:
+        return load_model_json(property_id, scrap_type, "params").get("params", {})
+    except RuntimeError as e:
+        logger.error(e)
+        return {}
+
+
+def load_booster(property_id: int, scrap_type: str) -> Optional["lgb.Booster"]:
+    # Imported here so readers of processed data do not load lightgbm
+    import lightgbm as lgb
+
+    path = MODELS_PATH / f"property_id_{property_id}" / scrap_type / "booster.txt"
+    if not path.exists():
+        return None
+    try:
+        return lgb.Booster(model_file=str(path))
+    except Exception as e:
+        logger.error(f"Failed to load booster from {path}: {e}")
+        return None
+
+
+def load_fitted_params() -> dict:
+    # Optimized baseline curves: {property_id: {room name: {P0, k, v, L}}}
+    path = OPTIMIZED_BASELINE_FITTED_PARAMS_PATH
+    if not path.exists():
+        raise RuntimeError(f"[FATAL] Fitted params file not found: {path}")
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except Exception as e:
+        raise RuntimeError(f"[FATAL] Failed to read or parse: {path}\n{e}")
+
+
 # ----------------------------------- read properties in pickle -----------------------------------
 
 
@@ -1,9 +1,13 @@
+import io
 import os
 import json
 import pandas as pd
+import numpy as np
 import pickle
 import logging
 import pytz
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 from config.paths import (
     RAW_DATA_PATH,
@@ -11,11 +15,15 @@ from config.paths import (
     PROCESSED_DATA_PATH,
     OUTPUTS_PATH,
     PROPERTIES_PATH,
+    MODELS_PATH,
 )
 from config.settings import DEFAULT_TIMEZONE
-from .data_manip import cleanup_old_files
+from .data_manip import bytes_digest, cleanup_old_files
 from data_ingestion.hotel_class import HotelProperty
 
+if TYPE_CHECKING:
+    import lightgbm as lgb
+
 tz = pytz.timezone(DEFAULT_TIMEZONE)
 
 logger = logging.getLogger(__name__)
@@ -103,15 +111,29 @@ def save_processed_data(
             except Exception as e:
                 raise RuntimeError(f"Failed to create subdirectory: {sub_path}\n{e}")
 
+            # Serialized in memory so the file digests come without a re-read
+            digests = {}
             for ota, df in dict_df.items():
                 file_path = sub_path / f"{ota}.feather"
                 try:
-                    df.to_feather(file_path)
+                    buffer = io.BytesIO()
+                    df.to_feather(buffer)
+                    data = buffer.getvalue()
+                    file_path.write_bytes(data)
+                    stat = file_path.stat()
+                    digests[ota] = [stat.st_size, stat.st_mtime_ns, bytes_digest(data)]
                 except Exception as e:
                     logger.error(
                         f"Failed to save {ota}.feather in '{subfolder_name}' for property_id={property_id}: {e}"
                     )
 
+            # (size, mtime_ns, digest) per file: sub charts group properties on them
+            try:
+                with open(base_path / f"{subfolder_name}_digests.json", "w") as f:
+                    json.dump(digests, f)
+            except Exception as e:
+                logger.error(f"Failed to save digests of '{sub_path}': {e}")
+
         save_dataframes(dict_df_client, "client_data")
         save_dataframes(dict_df_comp, "comp_data")
 
@@ -211,6 +233,167 @@ def save_ai_prices(
         logger.error(f"Failed to save AI prices at '{path}': {e}")
 
 
+def save_ai_prices_index(arrays: dict[str, np.ndarray], ai_prices_file: Path) -> None:
+    # Only the index of the latest AI prices file is kept
+    path = ai_prices_file.with_suffix(".npz")
+    tmp_path = path.with_suffix(".npz.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.error(f"Failed to save AI prices index at '{path}': {e}")
+        return
+
+    for old_path in path.parent.glob("*.npz"):
+        if old_path != path:
+            old_path.unlink(missing_ok=True)
+
+
+# ----------------------------------- save chart state -----------------------------------
+
+
+def save_chart_state(
+    state: dict[str, pd.DataFrame],
+    watermark: pd.Timestamp,
+    property_id: int,
+    scrap_type: str,
+) -> None:
+    # Frames of the incremental charts plus the last scrape they include; the
+    # watermark goes last, so an interrupted save only replays those scrapes
+    folder = OUTPUTS_PATH / "chart_state" / f"property_id_{property_id}" / scrap_type
+    try:
+        folder.mkdir(parents=True, exist_ok=True)
+    except Exception as e:
+        logger.error(f"Failed to create directory '{folder}': {e}")
+        return
+
+    try:
+        for name, df in state.items():
+            path = folder / f"{name}.feather"
+            tmp_path = path.with_suffix(".feather.tmp")
+            df.reset_index(drop=True).to_feather(tmp_path)
+            os.replace(tmp_path, path)
+        with open(folder / "watermark.json", "w") as f:
+            json.dump({"watermark": watermark.isoformat(), "frames": list(state)}, f)
+    except Exception as e:
+        logger.error(f"Failed to save chart state at '{folder}': {e}")
+
+
+# ----------------------------------- save models artifacts -----------------------------------
+
+# Size past which a model-folder .jsonl log is rotated
+JSONL_MAX_BYTES = 5 * 1024 * 1024
+
+
+def _model_folder(property_id: int, scrap_type: str):
+    folder = MODELS_PATH / f"property_id_{property_id}" / scrap_type
+    try:
+        folder.mkdir(parents=True, exist_ok=True)
+    except Exception as e:
+        logger.error(f"Failed to create directory '{folder}': {e}")
+        return None
+    return folder
+
+
+def save_model_json(obj: dict, property_id: int, scrap_type: str, name: str) -> None:
+    folder = _model_folder(property_id, scrap_type)
+    if folder is None:
+        return
+
+    path = folder / f"{name}.json"
+    tmp_path = path.with_suffix(".json.tmp")
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(obj, f, indent=4)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.error(f"Failed to save {name} at '{path}': {e}")
+
+
+def save_categorical_dict(
+    cat_dict: dict[str, list], property_id: int, scrap_type: str
+) -> None:
+    save_model_json(cat_dict, property_id, scrap_type, "categories")
+
+
+def save_model_metadata(metadata: dict, property_id: int, scrap_type: str) -> None:
+    save_model_json(metadata, property_id, scrap_type, "metadata")
+
+
+def save_model_registry(registry: dict, property_id: int, scrap_type: str) -> None:
+    save_model_json(registry, property_id, scrap_type, "registry")
+
+
+def save_tuned_hyperparameters(
+    params: dict, score: float, property_id: int, scrap_type: str
+) -> None:
+    save_model_json(
+        {
+            "params": params,
+            "score": score,
+            "tuned_at": pd.Timestamp.now(tz=tz).isoformat(),
+        },
+        property_id,
+        scrap_type,
+        "params",
+    )
+
+
+def save_drift_reference(reference: dict, property_id: int, scrap_type: str) -> None:
+    save_model_json(reference, property_id, scrap_type, "drift_reference")
+
+
+def append_model_jsonl(
+    record: dict,
+    property_id: int,
+    scrap_type: str,
+    name: str,
+    max_bytes: Optional[int] = None,
+) -> None:
+    # One JSON line per record, appended to {name}.jsonl in the model folder.
+    # Past max_bytes the file is rotated to {name}.jsonl.1 (one generation kept)
+    folder = _model_folder(property_id, scrap_type)
+    if folder is None:
+        return
+
+    path = folder / f"{name}.jsonl"
+    try:
+        if max_bytes is not None and path.exists():
+            if path.stat().st_size >= max_bytes:
+                os.replace(path, path.with_suffix(".jsonl.1"))
+        with open(path, "a") as f:
+            f.write(json.dumps(record, default=str) + "\n")
+    except Exception as e:
+        logger.error(f"Failed to append {name} record at '{path}': {e}")
+
+
+def append_drift_audit(record: dict, property_id: int, scrap_type: str) -> None:
+    append_model_jsonl(
+        record, property_id, scrap_type, "drift_audit", max_bytes=JSONL_MAX_BYTES
+    )
+
+
+def append_profile_record(record: dict, property_id: int, scrap_type: str) -> None:
+    append_model_jsonl(
+        record, property_id, scrap_type, "profiling", max_bytes=JSONL_MAX_BYTES
+    )
+
+
+def save_booster(booster: "lgb.Booster", property_id: int, scrap_type: str) -> None:
+    folder = _model_folder(property_id, scrap_type)
+    if folder is None:
+        return
+
+    path = folder / "booster.txt"
+    tmp_path = path.with_suffix(".txt.tmp")
+    try:
+        booster.save_model(tmp_path)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.error(f"Failed to save booster at '{path}': {e}")
+
+
 # ----------------------------------- save properties in pickle -----------------------------------
 
 
@@ -0,0 +1,123 @@
+import time
+import tracemalloc
+import functools
+from contextlib import contextmanager, nullcontext
+from typing import Iterator, Optional
+
+from config.settings import PROFILING_ENABLED, PROFILING_TRACE_MEMORY
+
+# Stage timers for the ML pipeline. A StageProfile is active for one property at
+# a time (per process); profile_stage / profiled are no-ops when none is active,
+# so instrumented code pays a single global lookup when profiling is off.
+
+_ACTIVE: Optional["StageProfile"] = None
+_NO_STAGE = nullcontext()
+
+
+class StageProfile:
+
+    def __init__(
+        self, property_id: int, scrap_type: str, trace_memory: bool = False
+    ) -> None:
+        self.property_id = property_id
+        self.scrap_type = scrap_type
+        self.trace_memory = trace_memory
+        self.stages: dict[str, dict[str, float]] = {}
+        self.wall_seconds = 0.0
+        # Open stages: [start_current, max_peak] of traced memory, innermost last
+        self._memory_stack: list[list[int]] = []
+
+    def add(self, name: str, seconds: float, peak_bytes: Optional[int] = None):
+        stage = self.stages.setdefault(name, {"seconds": 0.0, "calls": 0})
+        stage["seconds"] += seconds
+        stage["calls"] += 1
+        if peak_bytes is not None:
+            peak_mb = peak_bytes / 2**20
+            stage["peak_mb"] = max(stage.get("peak_mb", 0.0), peak_mb)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if not (self.trace_memory and tracemalloc.is_tracing()):
+            start = time.perf_counter()
+            try:
+                yield
+            finally:
+                self.add(name, time.perf_counter() - start)
+            return
+
+        # tracemalloc keeps one global peak: fold it into the enclosing stage
+        # before resetting it, and propagate this stage's peak back on exit
+        current, peak = tracemalloc.get_traced_memory()
+        if self._memory_stack:
+            self._memory_stack[-1][1] = max(self._memory_stack[-1][1], peak)
+        tracemalloc.reset_peak()
+        self._memory_stack.append([current, current])
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            start_current, max_peak = self._memory_stack.pop()
+            peak = max(tracemalloc.get_traced_memory()[1], max_peak)
+            if self._memory_stack:
+                self._memory_stack[-1][1] = max(self._memory_stack[-1][1], peak)
+            self.add(name, seconds, peak - start_current)
+
+    @contextmanager
+    def activate(self) -> Iterator["StageProfile"]:
+        global _ACTIVE
+        previous, _ACTIVE = _ACTIVE, self
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.wall_seconds += time.perf_counter() - start
+            if started_tracing:
+                tracemalloc.stop()
+            _ACTIVE = previous
+
+    def record(self) -> dict:
+        return {
+            "property_id": self.property_id,
+            "scrap_type": self.scrap_type,
+            "total_seconds": round(self.wall_seconds, 6),
+            "stages": {
+                name: {key: round(value, 6) for key, value in stage.items()}
+                for name, stage in self.stages.items()
+            },
+        }
+
+
+def new_profile(property_id: int, scrap_type: str) -> Optional[StageProfile]:
+    # None unless PROFILING is enabled
+    if not PROFILING_ENABLED:
+        return None
+    return StageProfile(property_id, scrap_type, trace_memory=PROFILING_TRACE_MEMORY)
+
+
+def activate_profile(profile: Optional[StageProfile]):
+    return _NO_STAGE if profile is None else profile.activate()
+
+
+def profile_stage(name: str):
+    if _ACTIVE is None:
+        return _NO_STAGE
+    return _ACTIVE.stage(name)
+
+
+def profiled(name: str):
+    # Decorator form of profile_stage for functions called from several places
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _ACTIVE is None:
+                return fn(*args, **kwargs)
+            with _ACTIVE.stage(name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator